@@ -0,0 +1,72 @@
+"""Add timeline_entries table for materialized home timelines
+
+Revision ID: 0a6e4b9d7c15
+Revises: f3c9e1a7b2d4
+Create Date: 2026-10-18 18:11:37.290561
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "0a6e4b9d7c15"
+down_revision: Union[str, Sequence[str], None] = "f3c9e1a7b2d4"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# Defaults of TIMELINE_FANOUT_MAX_FOLLOWERS and TIMELINE_BACKFILL_POSTS
+FANOUT_MAX_FOLLOWERS = 10000
+BACKFILL_POSTS = 50
+
+
+def upgrade() -> None:
+    op.create_table(
+        "timeline_entries",
+        sa.Column("user_id", sa.Integer(), nullable=False),
+        sa.Column("post_id", sa.Integer(), nullable=False),
+        sa.Column("owner_id", sa.Integer(), nullable=False),
+        sa.Column("created_at", sa.TIMESTAMP(timezone=True), nullable=False),
+        sa.ForeignKeyConstraint(["post_id"], ["posts.id"], ondelete="CASCADE"),
+        sa.ForeignKeyConstraint(["user_id"], ["users.id"], ondelete="CASCADE"),
+        sa.PrimaryKeyConstraint("user_id", "post_id"),
+    )
+    op.create_index(
+        "ix_timeline_entries_user_id_created_at",
+        "timeline_entries",
+        ["user_id", "created_at", "post_id"],
+    )
+    op.create_index(
+        "ix_timeline_entries_user_id_owner_id",
+        "timeline_entries",
+        ["user_id", "owner_id"],
+    )
+    op.create_index("ix_timeline_entries_post_id", "timeline_entries", ["post_id"])
+
+    # Materialize the latest posts of every fanned-out followee; accounts at
+    # or above the threshold are merged in at read time instead
+    op.execute(f"""
+        INSERT INTO timeline_entries (user_id, post_id, owner_id, created_at)
+        SELECT f.follower_id, p.id, p.owner_id, p.created_at
+        FROM follows f
+        JOIN users u ON u.id = f.followee_id
+        CROSS JOIN LATERAL (
+            SELECT id, owner_id, created_at FROM posts
+            WHERE owner_id = f.followee_id AND created_at IS NOT NULL
+            ORDER BY created_at DESC, id DESC
+            LIMIT {BACKFILL_POSTS}
+        ) p
+        WHERE f.accepted AND u.followers_count < {FANOUT_MAX_FOLLOWERS}
+        """)
+
+
+def downgrade() -> None:
+    op.drop_index("ix_timeline_entries_post_id", table_name="timeline_entries")
+    op.drop_index("ix_timeline_entries_user_id_owner_id", table_name="timeline_entries")
+    op.drop_index(
+        "ix_timeline_entries_user_id_created_at", table_name="timeline_entries"
+    )
+    op.drop_table("timeline_entries")
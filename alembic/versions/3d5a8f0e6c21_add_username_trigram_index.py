@@ -0,0 +1,33 @@
+"""Add trigram index on lowercased username
+
+Revision ID: 3d5a8f0e6c21
+Revises: 7b2e9c4d1a56
+Create Date: 2026-10-18 11:04:19.227815
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "3d5a8f0e6c21"
+down_revision: Union[str, Sequence[str], None] = "7b2e9c4d1a56"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+
+    # CONCURRENTLY cannot run inside a transaction, so build outside of it
+    with op.get_context().autocommit_block():
+        op.execute("""
+            CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_users_username_trgm
+            ON users USING gin (lower(username) gin_trgm_ops)
+            """)
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.execute("DROP INDEX CONCURRENTLY IF EXISTS ix_users_username_trgm")
@@ -0,0 +1,49 @@
+"""Add secondary indexes for service queries
+
+Revision ID: 7b2e9c4d1a56
+Revises: e45742b0d3e0
+Create Date: 2026-10-18 10:12:41.503218
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "7b2e9c4d1a56"
+down_revision: Union[str, Sequence[str], None] = "e45742b0d3e0"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# (index name, table, columns)
+INDEXES = [
+    ("ix_posts_owner_id_created_at", "posts", ["owner_id", "created_at"]),
+    ("ix_comments_post_id_created_at", "comments", ["post_id", "created_at"]),
+    ("ix_reactions_post_id_type", "reactions", ["post_id", "type"]),
+    ("ix_follows_followee_id_accepted", "follows", ["followee_id", "accepted"]),
+]
+
+
+def upgrade() -> None:
+    # CONCURRENTLY cannot run inside a transaction, so build outside of it
+    with op.get_context().autocommit_block():
+        for name, table, columns in INDEXES:
+            op.create_index(
+                name,
+                table,
+                columns,
+                postgresql_concurrently=True,
+                if_not_exists=True,
+            )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        for name, table, _ in reversed(INDEXES):
+            op.drop_index(
+                name,
+                table_name=table,
+                postgresql_concurrently=True,
+                if_exists=True,
+            )
@@ -0,0 +1,33 @@
+"""Add version columns to users and post_counters for ETags
+
+Revision ID: 8c1d5e7f3a92
+Revises: 0a6e4b9d7c15
+Create Date: 2026-10-18 21:14:36.902417
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "8c1d5e7f3a92"
+down_revision: Union[str, Sequence[str], None] = "0a6e4b9d7c15"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # A constant default makes these metadata-only changes, without a rewrite
+    for table in ("users", "post_counters"):
+        op.add_column(
+            table,
+            sa.Column("version", sa.Integer(), nullable=False, server_default="0"),
+        )
+
+
+def downgrade() -> None:
+    for table in ("post_counters", "users"):
+        op.drop_column(table, "version")
@@ -0,0 +1,58 @@
+"""Add denormalized post and follow counters to users
+
+Revision ID: a41c7e2f9b83
+Revises: 3d5a8f0e6c21
+Create Date: 2026-10-18 13:42:07.518204
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "a41c7e2f9b83"
+down_revision: Union[str, Sequence[str], None] = "3d5a8f0e6c21"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+COUNTERS = ("posts_count", "followers_count", "following_count")
+
+
+def upgrade() -> None:
+    for name in COUNTERS:
+        op.add_column(
+            "users",
+            sa.Column(name, sa.Integer(), nullable=False, server_default="0"),
+        )
+
+    # Backfill from the source tables; drift later is fixed by
+    # scripts/reconcile_counters.py
+    op.execute("""
+        UPDATE users SET posts_count = c.n
+        FROM (SELECT owner_id, count(*) AS n FROM posts GROUP BY owner_id) c
+        WHERE c.owner_id = users.id
+        """)
+    op.execute("""
+        UPDATE users SET followers_count = c.n
+        FROM (
+            SELECT followee_id, count(*) AS n FROM follows
+            WHERE accepted GROUP BY followee_id
+        ) c
+        WHERE c.followee_id = users.id
+        """)
+    op.execute("""
+        UPDATE users SET following_count = c.n
+        FROM (
+            SELECT follower_id, count(*) AS n FROM follows
+            WHERE accepted GROUP BY follower_id
+        ) c
+        WHERE c.follower_id = users.id
+        """)
+
+
+def downgrade() -> None:
+    for name in reversed(COUNTERS):
+        op.drop_column("users", name)
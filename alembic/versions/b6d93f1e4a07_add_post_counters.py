@@ -0,0 +1,59 @@
+"""Add post_counters table with comment and per-type reaction counts
+
+Revision ID: b6d93f1e4a07
+Revises: a41c7e2f9b83
+Create Date: 2026-10-18 14:55:31.904412
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "b6d93f1e4a07"
+down_revision: Union[str, Sequence[str], None] = "a41c7e2f9b83"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+REACTION_TYPES = ("like", "wow", "heart", "fire", "sad")
+
+
+def upgrade() -> None:
+    op.create_table(
+        "post_counters",
+        sa.Column("post_id", sa.Integer(), nullable=False),
+        sa.Column("comments_count", sa.Integer(), server_default="0", nullable=False),
+        *(
+            sa.Column(f"{t}_count", sa.Integer(), server_default="0", nullable=False)
+            for t in REACTION_TYPES
+        ),
+        sa.ForeignKeyConstraint(["post_id"], ["posts.id"], ondelete="CASCADE"),
+        sa.PrimaryKeyConstraint("post_id"),
+    )
+
+    # Backfill one row per existing post
+    reaction_columns = ", ".join(f"{t}_count" for t in REACTION_TYPES)
+    reaction_values = ", ".join(f"coalesce(r.{t}_count, 0)" for t in REACTION_TYPES)
+    reaction_counts = ", ".join(
+        f"count(*) FILTER (WHERE type = '{t}') AS {t}_count" for t in REACTION_TYPES
+    )
+    op.execute(f"""
+        INSERT INTO post_counters (post_id, comments_count, {reaction_columns})
+        SELECT p.id, coalesce(c.comments_count, 0), {reaction_values}
+        FROM posts p
+        LEFT JOIN (
+            SELECT post_id, count(*) AS comments_count
+            FROM comments GROUP BY post_id
+        ) c ON c.post_id = p.id
+        LEFT JOIN (
+            SELECT post_id, {reaction_counts}
+            FROM reactions GROUP BY post_id
+        ) r ON r.post_id = p.id
+        """)
+
+
+def downgrade() -> None:
+    op.drop_table("post_counters")
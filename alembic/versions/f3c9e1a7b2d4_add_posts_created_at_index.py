@@ -0,0 +1,39 @@
+"""Add posts (created_at, id) index for the home feed
+
+Revision ID: f3c9e1a7b2d4
+Revises: d2f7a9c31e58
+Create Date: 2026-10-18 17:03:12.640127
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "f3c9e1a7b2d4"
+down_revision: Union[str, Sequence[str], None] = "d2f7a9c31e58"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # CONCURRENTLY cannot run inside a transaction, so build outside of it
+    with op.get_context().autocommit_block():
+        op.create_index(
+            "ix_posts_created_at_id",
+            "posts",
+            ["created_at", "id"],
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.drop_index(
+            "ix_posts_created_at_id",
+            table_name="posts",
+            postgresql_concurrently=True,
+            if_exists=True,
+        )
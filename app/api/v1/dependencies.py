@@ -1,34 +1,49 @@
 from fastapi import Depends
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 
-from app.db.database import get_db
-from app.services.auth_service import AuthService
-from app.services.comment_service import CommentService
-from app.services.follow_service import FollowService
-from app.services.post_service import PostService
-from app.services.reaction_service import ReactionService
-from app.services.user_service import UserService
+from app.db.database import get_session
+from app.services.async_services import (
+    AsyncAuthService,
+    AsyncCommentService,
+    AsyncFollowService,
+    AsyncPostService,
+    AsyncReactionService,
+    AsyncUserService,
+)
 
 
-def get_auth_service(db: Session = Depends(get_db)) -> AuthService:
-    return AuthService(db)
+async def get_auth_service(
+    db: Session | AsyncSession = Depends(get_session),
+) -> AsyncAuthService:
+    return AsyncAuthService(db)
 
 
-def get_user_service(db: Session = Depends(get_db)) -> UserService:
-    return UserService(db)
+async def get_user_service(
+    db: Session | AsyncSession = Depends(get_session),
+) -> AsyncUserService:
+    return AsyncUserService(db)
 
 
-def get_post_service(db: Session = Depends(get_db)) -> PostService:
-    return PostService(db)
+async def get_post_service(
+    db: Session | AsyncSession = Depends(get_session),
+) -> AsyncPostService:
+    return AsyncPostService(db)
 
 
-def get_comment_service(db: Session = Depends(get_db)) -> CommentService:
-    return CommentService(db)
+async def get_comment_service(
+    db: Session | AsyncSession = Depends(get_session),
+) -> AsyncCommentService:
+    return AsyncCommentService(db)
 
 
-def get_reaction_service(db: Session = Depends(get_db)) -> ReactionService:
-    return ReactionService(db)
+async def get_reaction_service(
+    db: Session | AsyncSession = Depends(get_session),
+) -> AsyncReactionService:
+    return AsyncReactionService(db)
 
 
-def get_follow_service(db: Session = Depends(get_db)) -> FollowService:
-    return FollowService(db)
+async def get_follow_service(
+    db: Session | AsyncSession = Depends(get_session),
+) -> AsyncFollowService:
+    return AsyncFollowService(db)
@@ -1,9 +1,9 @@
-from fastapi import APIRouter, Depends
+from fastapi import APIRouter, Depends, status
 from fastapi.security import OAuth2PasswordRequestForm
 
 from app.api.v1.dependencies import get_auth_service
-from app.api.v1.schemas.auth import Token
-from app.services.auth_service import AuthService
+from app.api.v1.schemas.auth import RefreshTokenIn, Token
+from app.services.async_services import AsyncAuthService
 
 prefix = "/auth"
 router = APIRouter(prefix=prefix, tags=["Authentication"])
@@ -12,8 +12,32 @@ router = APIRouter(prefix=prefix, tags=["Authentication"])
 @router.post(
     "/login", response_model=Token, summary="User login to obtain access token"
 )
-def login_user(
+async def login_user(
     user_credentials: OAuth2PasswordRequestForm = Depends(),
-    auth_service: AuthService = Depends(get_auth_service),
+    auth_service: AsyncAuthService = Depends(get_auth_service),
 ):
-    return auth_service.login_user(user_credentials)
+    return await auth_service.login_user(user_credentials)
+
+
+@router.post(
+    "/refresh",
+    response_model=Token,
+    summary="Exchange a refresh token for a new access and refresh token",
+)
+async def refresh_tokens(
+    data: RefreshTokenIn,
+    auth_service: AsyncAuthService = Depends(get_auth_service),
+):
+    return await auth_service.refresh_tokens(data.refresh_token)
+
+
+@router.post(
+    "/logout",
+    summary="Revoke the session a refresh token belongs to",
+    status_code=status.HTTP_204_NO_CONTENT,
+)
+async def logout_user(
+    data: RefreshTokenIn,
+    auth_service: AsyncAuthService = Depends(get_auth_service),
+):
+    await auth_service.logout_user(data.refresh_token)
@@ -1,6 +1,6 @@
-from typing import List
+from typing import List, Optional
 
-from fastapi import APIRouter, Depends, Query, status
+from fastapi import APIRouter, Depends, Query, Request, Response, status
 
 from app.api.v1.dependencies import get_comment_service
 from app.api.v1.schemas.comment import (
@@ -9,8 +9,13 @@ from app.api.v1.schemas.comment import (
     CommentEdit,
     CommentOut,
 )
-from app.core.security.access_controls import can_view_post, get_current_user
-from app.services.comment_service import CommentService
+from app.core.security.access_controls import (
+    can_view_post_async,
+    get_current_user_async,
+)
+from app.services.async_services import AsyncCommentService
+from app.utils.etag import check_not_modified, make_etag
+from app.utils.responses import list_response
 
 prefix = "/posts/{post_id}/comments"
 router = APIRouter(prefix=prefix, tags=["Comments"])
@@ -22,13 +27,13 @@ router = APIRouter(prefix=prefix, tags=["Comments"])
     status_code=status.HTTP_201_CREATED,
     response_model=CommentCreatedOut,
 )
-def add_post_comment(
+async def add_post_comment(
     comment: CommentCreate,
-    post_id=Depends(can_view_post),
-    current_user=Depends(get_current_user),
-    comment_service: CommentService = Depends(get_comment_service),
+    post_id=Depends(can_view_post_async),
+    current_user=Depends(get_current_user_async),
+    comment_service: AsyncCommentService = Depends(get_comment_service),
 ):
-    return comment_service.add_post_comment(current_user.id, post_id, comment)
+    return await comment_service.add_post_comment(current_user.id, post_id, comment)
 
 
 @router.get(
@@ -36,16 +41,33 @@ def add_post_comment(
     summary="Get comments for a post",
     response_model=List[CommentOut],
 )
-def get_post_comments(
-    post_id=Depends(can_view_post),
-    current_user=Depends(get_current_user),
+async def get_post_comments(
+    request: Request,
+    response: Response,
+    post_id=Depends(can_view_post_async),
+    current_user=Depends(get_current_user_async),
     limit: int = Query(10, ge=1, le=50),
     offset: int = Query(0, ge=0),
-    comment_service: CommentService = Depends(get_comment_service),
+    cursor: Optional[str] = None,
+    comment_service: AsyncCommentService = Depends(get_comment_service),
 ):
-    return comment_service.get_post_comments(
-        current_user_id=current_user.id, post_id=post_id, limit=limit, offset=offset
+    version = await comment_service.get_post_comments_version(
+        post_id, limit=limit, offset=offset, cursor=cursor
+    )
+    if version is not None:
+        etag = make_etag(
+            "comments", current_user.id, post_id, limit, offset, cursor, *version
+        )
+        if not_modified := check_not_modified(request, response, etag):
+            return not_modified
+    page = await comment_service.get_post_comments(
+        current_user_id=current_user.id,
+        post_id=post_id,
+        limit=limit,
+        offset=offset,
+        cursor=cursor,
     )
+    return list_response(CommentOut, page, response)
 
 
 @router.patch(
@@ -53,14 +75,14 @@ def get_post_comments(
     summary="Update a comment to a post",
     response_model=CommentCreatedOut,
 )
-def update_post_comment(
+async def update_post_comment(
     comment: CommentEdit,
     comment_id: int,
-    post_id=Depends(can_view_post),
-    current_user=Depends(get_current_user),
-    comment_service: CommentService = Depends(get_comment_service),
+    post_id=Depends(can_view_post_async),
+    current_user=Depends(get_current_user_async),
+    comment_service: AsyncCommentService = Depends(get_comment_service),
 ):
-    return comment_service.update_post_comment(
+    return await comment_service.update_post_comment(
         current_user.id, post_id, comment_id, comment
     )
 
@@ -70,10 +92,10 @@ def update_post_comment(
     summary="Delete a comment from a post",
     status_code=status.HTTP_204_NO_CONTENT,
 )
-def delete_post_comment(
+async def delete_post_comment(
     comment_id: int,
-    post_id=Depends(can_view_post),
-    current_user=Depends(get_current_user),
-    comment_service: CommentService = Depends(get_comment_service),
+    post_id=Depends(can_view_post_async),
+    current_user=Depends(get_current_user_async),
+    comment_service: AsyncCommentService = Depends(get_comment_service),
 ):
-    comment_service.delete_post_comment(current_user.id, post_id, comment_id)
+    await comment_service.delete_post_comment(current_user.id, post_id, comment_id)
@@ -0,0 +1,87 @@
+from fastapi import APIRouter, Depends
+
+from app.api.v1.schemas.diagnostics import (
+    CacheStatsOut,
+    EnginePoolsOut,
+    HashPoolStatusOut,
+    ServiceCacheStatsOut,
+    TimelineFanoutStatusOut,
+)
+from app.core.cache.service_cache import service_cache
+from app.core.config import settings
+from app.core.security.access_controls import get_current_user_async
+from app.core.security.password import hash_pool
+from app.core.security.principal import principal_cache
+from app.db.database import (
+    async_engine,
+    async_replica_engines,
+    engine,
+    replica_engines,
+)
+from app.db.pool import pool_status
+from app.services.timeline_fanout import timeline_fanout
+
+prefix = "/diagnostics"
+# Load and queue figures help time attacks, so only signed-in users see them
+router = APIRouter(
+    prefix=prefix,
+    tags=["Diagnostics"],
+    dependencies=[Depends(get_current_user_async)],
+)
+
+
+@router.get(
+    "/pool",
+    summary="Get connection pool statistics of every engine for this worker",
+    response_model=EnginePoolsOut,
+)
+async def get_pool_status():
+    if settings.DATABASE_ASYNC:
+        mode, primary, replicas = (
+            "async",
+            async_engine.sync_engine,
+            async_replica_engines,
+        )
+    else:
+        mode, primary, replicas = "sync", engine, replica_engines
+
+    engines = {"primary": pool_status(primary)}
+    for number, replica in enumerate(replicas, start=1):
+        engines[f"replica-{number}"] = pool_status(replica)
+    return {"mode": mode, "engines": engines}
+
+
+@router.get(
+    "/principal-cache",
+    summary="Get authenticated principal cache statistics for this worker",
+    response_model=CacheStatsOut,
+)
+async def get_principal_cache_stats():
+    return principal_cache.stats()
+
+
+@router.get(
+    "/service-cache",
+    summary="Get service result cache statistics (hits and misses for this worker)",
+    response_model=ServiceCacheStatsOut,
+)
+async def get_service_cache_stats():
+    return service_cache.stats()
+
+
+@router.get(
+    "/password-hashing",
+    summary="Get password hashing pool queue and timing statistics for this worker",
+    response_model=HashPoolStatusOut,
+)
+async def get_password_hashing_status():
+    return hash_pool.status()
+
+
+@router.get(
+    "/timeline-fanout",
+    summary="Get timeline fan-out queue and job statistics for this worker",
+    response_model=TimelineFanoutStatusOut,
+)
+async def get_timeline_fanout_status():
+    return timeline_fanout.status()
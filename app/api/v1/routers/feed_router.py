@@ -0,0 +1,28 @@
+from typing import List, Optional
+
+from fastapi import APIRouter, Depends, Query, Response
+
+from app.api.v1.dependencies import get_post_service
+from app.api.v1.schemas.post import PostListItemOut
+from app.core.security.access_controls import get_current_user_async
+from app.services.async_services import AsyncPostService
+from app.utils.responses import list_response
+
+prefix = "/feed"
+router = APIRouter(prefix=prefix, tags=["Feed"])
+
+
+@router.get(
+    "",
+    summary="Get posts from followed users, newest first",
+    response_model=List[PostListItemOut],
+)
+async def get_feed(
+    response: Response,
+    current_user=Depends(get_current_user_async),
+    limit: int = Query(10, ge=1, le=50),
+    cursor: Optional[str] = None,
+    post_service: AsyncPostService = Depends(get_post_service),
+):
+    page = await post_service.get_feed(current_user.id, limit=limit, cursor=cursor)
+    return list_response(PostListItemOut, page, response)
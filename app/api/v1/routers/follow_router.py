@@ -4,8 +4,9 @@ from fastapi import APIRouter, Depends, status
 
 from app.api.v1.dependencies import get_follow_service
 from app.api.v1.schemas.follow import FollowRequestOut
-from app.core.security.access_controls import get_current_user
-from app.services.follow_service import FollowService
+from app.core.security.access_controls import get_current_user_async
+from app.services.async_services import AsyncFollowService
+from app.utils.responses import list_response
 
 prefix = "/follows"
 router = APIRouter(prefix=prefix, tags=["Follows"])
@@ -16,12 +17,12 @@ router = APIRouter(prefix=prefix, tags=["Follows"])
     summary="Follow a user",
     status_code=status.HTTP_204_NO_CONTENT,
 )
-def follow_user(
+async def follow_user(
     user_id: int,
-    current_user=Depends(get_current_user),
-    follow_service: FollowService = Depends(get_follow_service),
+    current_user=Depends(get_current_user_async),
+    follow_service: AsyncFollowService = Depends(get_follow_service),
 ):
-    follow_service.follow_user(follower_id=current_user.id, followee_id=user_id)
+    await follow_service.follow_user(follower_id=current_user.id, followee_id=user_id)
 
 
 @router.delete(
@@ -29,12 +30,12 @@ def follow_user(
     summary="Unfollow a user",
     status_code=status.HTTP_204_NO_CONTENT,
 )
-def unfollow_user(
+async def unfollow_user(
     user_id: int,
-    current_user=Depends(get_current_user),
-    follow_service: FollowService = Depends(get_follow_service),
+    current_user=Depends(get_current_user_async),
+    follow_service: AsyncFollowService = Depends(get_follow_service),
 ):
-    follow_service.unfollow_user(follower_id=current_user.id, followee_id=user_id)
+    await follow_service.unfollow_user(follower_id=current_user.id, followee_id=user_id)
 
 
 @router.delete(
@@ -42,12 +43,12 @@ def unfollow_user(
     summary="Remove a user from your followers list",
     status_code=status.HTTP_204_NO_CONTENT,
 )
-def remove_follower(
+async def remove_follower(
     user_id: int,
-    current_user=Depends(get_current_user),
-    follow_service: FollowService = Depends(get_follow_service),
+    current_user=Depends(get_current_user_async),
+    follow_service: AsyncFollowService = Depends(get_follow_service),
 ):
-    follow_service.unfollow_user(follower_id=user_id, followee_id=current_user.id)
+    await follow_service.unfollow_user(follower_id=user_id, followee_id=current_user.id)
 
 
 @router.patch(
@@ -55,12 +56,12 @@ def remove_follower(
     summary="Accept a follow request",
     status_code=status.HTTP_204_NO_CONTENT,
 )
-def accept_follow_request(
+async def accept_follow_request(
     user_id: int,
-    current_user=Depends(get_current_user),
-    follow_service: FollowService = Depends(get_follow_service),
+    current_user=Depends(get_current_user_async),
+    follow_service: AsyncFollowService = Depends(get_follow_service),
 ):
-    follow_service.accept_follow_request(
+    await follow_service.accept_follow_request(
         follower_id=user_id, followee_id=current_user.id
     )
 
@@ -70,12 +71,12 @@ def accept_follow_request(
     summary="Cancel a pending follow request",
     status_code=status.HTTP_204_NO_CONTENT,
 )
-def cancel_follow_request(
+async def cancel_follow_request(
     user_id: int,
-    current_user=Depends(get_current_user),
-    follow_service: FollowService = Depends(get_follow_service),
+    current_user=Depends(get_current_user_async),
+    follow_service: AsyncFollowService = Depends(get_follow_service),
 ):
-    follow_service.remove_pending_request(
+    await follow_service.remove_pending_request(
         follower_id=user_id, followee_id=current_user.id
     )
 
@@ -85,12 +86,12 @@ def cancel_follow_request(
     summary="Reject a follow request",
     status_code=status.HTTP_204_NO_CONTENT,
 )
-def reject_follow_request(
+async def reject_follow_request(
     user_id: int,
-    current_user=Depends(get_current_user),
-    follow_service: FollowService = Depends(get_follow_service),
+    current_user=Depends(get_current_user_async),
+    follow_service: AsyncFollowService = Depends(get_follow_service),
 ):
-    follow_service.remove_pending_request(
+    await follow_service.remove_pending_request(
         follower_id=user_id, followee_id=current_user.id
     )
 
@@ -100,11 +101,14 @@ def reject_follow_request(
     summary="Get incoming follow requests",
     response_model=List[FollowRequestOut],
 )
-def get_incoming_follow_requests(
-    current_user=Depends(get_current_user),
-    follow_service: FollowService = Depends(get_follow_service),
+async def get_incoming_follow_requests(
+    current_user=Depends(get_current_user_async),
+    follow_service: AsyncFollowService = Depends(get_follow_service),
 ):
-    return follow_service.get_follow_requests(user_id=current_user.id, incoming=True)
+    requests = await follow_service.get_follow_requests(
+        user_id=current_user.id, incoming=True
+    )
+    return list_response(FollowRequestOut, requests)
 
 
 @router.get(
@@ -112,8 +116,11 @@ def get_incoming_follow_requests(
     summary="Get outgoing follow requests",
     response_model=List[FollowRequestOut],
 )
-def get_outgoing_follow_requests(
-    current_user=Depends(get_current_user),
-    follow_service: FollowService = Depends(get_follow_service),
+async def get_outgoing_follow_requests(
+    current_user=Depends(get_current_user_async),
+    follow_service: AsyncFollowService = Depends(get_follow_service),
 ):
-    return follow_service.get_follow_requests(user_id=current_user.id, incoming=False)
+    requests = await follow_service.get_follow_requests(
+        user_id=current_user.id, incoming=False
+    )
+    return list_response(FollowRequestOut, requests)
@@ -1,14 +1,18 @@
-from fastapi import APIRouter, Depends, status
+from typing import List
+
+from fastapi import APIRouter, Depends, Query, Request, Response, status
 
 from app.api.v1.dependencies import get_post_service
 from app.api.v1.schemas.post import PostCreate, PostCreatedOut, PostEdit, PostOut
+from app.core.config import settings
 from app.core.security.access_controls import (
-    can_view_post,
-    get_current_user,
+    get_current_user_async,
 )
-from app.db.models.post import Post
 from app.db.models.user import User
-from app.services.post_service import PostService
+from app.services.async_services import AsyncPostService
+from app.utils.batch import parse_batch, positive_id
+from app.utils.etag import check_not_modified, make_etag
+from app.utils.responses import list_response
 
 prefix = "/posts"
 router = APIRouter(prefix=prefix, tags=["Posts"])
@@ -20,12 +24,32 @@ router = APIRouter(prefix=prefix, tags=["Posts"])
     status_code=status.HTTP_201_CREATED,
     response_model=PostCreatedOut,
 )
-def create_post(
+async def create_post(
     post: PostCreate,
-    current_user=Depends(get_current_user),
-    post_service: PostService = Depends(get_post_service),
+    current_user=Depends(get_current_user_async),
+    post_service: AsyncPostService = Depends(get_post_service),
 ):
-    return post_service.create_post(current_user.id, post)
+    return await post_service.create_post(current_user.id, post)
+
+
+@router.get(
+    ":batch",
+    summary="Get many posts by ID",
+    response_model=List[PostOut],
+)
+async def get_posts_batch(
+    ids: List[str] = Query(
+        ...,
+        description="Repeated or comma separated; posts that are missing or "
+        "not visible to the caller are left out",
+    ),
+    current_user: User = Depends(get_current_user_async),
+    post_service: AsyncPostService = Depends(get_post_service),
+):
+    post_ids = parse_batch(ids, "ids", settings.BATCH_MAX_ITEMS, cast=positive_id)
+    # Visibility is a filter of the batch query, so hidden posts never load
+    posts = await post_service.get_posts_detail(current_user.id, post_ids)
+    return list_response(PostOut, posts)
 
 
 @router.get(
@@ -33,12 +57,22 @@ def create_post(
     summary="Get a post by ID",
     response_model=PostOut,
 )
-def get_post(
-    post_id: Post = Depends(can_view_post),
-    current_user: User = Depends(get_current_user),
-    post_service: PostService = Depends(get_post_service),
+async def get_post(
+    request: Request,
+    response: Response,
+    post_id: int,
+    current_user: User = Depends(get_current_user_async),
+    post_service: AsyncPostService = Depends(get_post_service),
 ):
-    return post_service.get_post(current_user.id, post_id)
+    # A lost view permission changes the owner's version, so a 304 never
+    # skips the visibility check the detail query performs
+    version = await post_service.get_post_version(post_id)
+    if version is not None:
+        etag = make_etag("post", current_user.id, post_id, *version)
+        if not_modified := check_not_modified(request, response, etag):
+            return not_modified
+    # Visibility is decided inside the detail query, not by can_view_post
+    return await post_service.get_post_detail(current_user.id, post_id)
 
 
 @router.patch(
@@ -46,13 +80,13 @@ def get_post(
     summary="Update a post by ID",
     response_model=PostCreatedOut,
 )
-def update_post(
+async def update_post(
     post_id: int,
     post_update: PostEdit,
-    current_user=Depends(get_current_user),
-    post_service: PostService = Depends(get_post_service),
+    current_user=Depends(get_current_user_async),
+    post_service: AsyncPostService = Depends(get_post_service),
 ):
-    return post_service.update_post(current_user.id, post_id, post_update)
+    return await post_service.update_post(current_user.id, post_id, post_update)
 
 
 @router.delete(
@@ -60,9 +94,9 @@ def update_post(
     summary="Delete a post by ID",
     status_code=status.HTTP_204_NO_CONTENT,
 )
-def delete_post(
+async def delete_post(
     post_id: int,
-    current_user=Depends(get_current_user),
-    post_service: PostService = Depends(get_post_service),
+    current_user=Depends(get_current_user_async),
+    post_service: AsyncPostService = Depends(get_post_service),
 ):
-    post_service.delete_post(current_user.id, post_id)
+    await post_service.delete_post(current_user.id, post_id)
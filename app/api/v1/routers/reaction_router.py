@@ -1,6 +1,6 @@
-from typing import List
+from typing import List, Optional
 
-from fastapi import APIRouter, Depends, Query, status
+from fastapi import APIRouter, Depends, Query, Response, status
 
 from app.api.v1.dependencies import get_reaction_service
 from app.api.v1.schemas.reaction import (
@@ -9,8 +9,12 @@ from app.api.v1.schemas.reaction import (
     ReactionEdit,
     ReactionOut,
 )
-from app.core.security.access_controls import can_view_post, get_current_user
-from app.services.reaction_service import ReactionService
+from app.core.security.access_controls import (
+    can_view_post_async,
+    get_current_user_async,
+)
+from app.services.async_services import AsyncReactionService
+from app.utils.responses import list_response
 
 prefix = "/posts/{post_id}/reactions"
 router = APIRouter(prefix=prefix, tags=["Reactions"])
@@ -22,13 +26,13 @@ router = APIRouter(prefix=prefix, tags=["Reactions"])
     status_code=status.HTTP_201_CREATED,
     response_model=ReactionCreatedOut,
 )
-def add_post_reaction(
+async def add_post_reaction(
     reaction: ReactionCreate,
-    post_id=Depends(can_view_post),
-    current_user=Depends(get_current_user),
-    reaction_service: ReactionService = Depends(get_reaction_service),
+    post_id=Depends(can_view_post_async),
+    current_user=Depends(get_current_user_async),
+    reaction_service: AsyncReactionService = Depends(get_reaction_service),
 ):
-    return reaction_service.add_post_reaction(current_user.id, post_id, reaction)
+    return await reaction_service.add_post_reaction(current_user.id, post_id, reaction)
 
 
 @router.get(
@@ -36,16 +40,23 @@ def add_post_reaction(
     summary="Get reactions for a post",
     response_model=List[ReactionOut],
 )
-def get_post_reactions(
-    post_id=Depends(can_view_post),
-    current_user=Depends(get_current_user),
+async def get_post_reactions(
+    response: Response,
+    post_id=Depends(can_view_post_async),
+    current_user=Depends(get_current_user_async),
     limit: int = Query(10, ge=1, le=50),
     offset: int = Query(0, ge=0),
-    reaction_service: ReactionService = Depends(get_reaction_service),
+    cursor: Optional[str] = None,
+    reaction_service: AsyncReactionService = Depends(get_reaction_service),
 ):
-    return reaction_service.get_post_reactions(
-        current_user_id=current_user.id, post_id=post_id, limit=limit, offset=offset
+    page = await reaction_service.get_post_reactions(
+        current_user_id=current_user.id,
+        post_id=post_id,
+        limit=limit,
+        offset=offset,
+        cursor=cursor,
     )
+    return list_response(ReactionOut, page, response)
 
 
 @router.patch(
@@ -53,13 +64,13 @@ def get_post_reactions(
     summary="Update a reaction to a post",
     response_model=ReactionCreatedOut,
 )
-def update_post_reaction(
+async def update_post_reaction(
     reaction_update: ReactionEdit,
-    post_id=Depends(can_view_post),
-    current_user=Depends(get_current_user),
-    reaction_service: ReactionService = Depends(get_reaction_service),
+    post_id=Depends(can_view_post_async),
+    current_user=Depends(get_current_user_async),
+    reaction_service: AsyncReactionService = Depends(get_reaction_service),
 ):
-    return reaction_service.update_post_reaction(
+    return await reaction_service.update_post_reaction(
         current_user.id, post_id, reaction_update
     )
 
@@ -69,9 +80,9 @@ def update_post_reaction(
     summary="Delete a reaction from a post",
     status_code=status.HTTP_204_NO_CONTENT,
 )
-def delete_post_reaction(
-    post_id=Depends(can_view_post),
-    current_user=Depends(get_current_user),
-    reaction_service: ReactionService = Depends(get_reaction_service),
+async def delete_post_reaction(
+    post_id=Depends(can_view_post_async),
+    current_user=Depends(get_current_user_async),
+    reaction_service: AsyncReactionService = Depends(get_reaction_service),
 ):
-    return reaction_service.delete_post_reaction(current_user.id, post_id)
+    return await reaction_service.delete_post_reaction(current_user.id, post_id)
@@ -1,6 +1,6 @@
 from typing import List, Optional
 
-from fastapi import APIRouter, Depends, Query, status
+from fastapi import APIRouter, Depends, Query, Request, Response, status
 
 from app.api.v1.dependencies import (
     get_post_service,
@@ -17,9 +17,15 @@ from app.api.v1.schemas.user import (
     UserPublicOut,
     UserSettingsOut,
 )
-from app.core.security.access_controls import can_view_target_user, get_current_user
-from app.services.post_service import PostService
-from app.services.user_service import UserService
+from app.core.config import settings
+from app.core.security.access_controls import (
+    can_view_target_user_async,
+    get_current_user_async,
+)
+from app.services.async_services import AsyncPostService, AsyncUserService
+from app.utils.batch import parse_batch
+from app.utils.etag import check_not_modified, make_etag
+from app.utils.responses import list_response
 
 prefix = "/users"
 router = APIRouter(prefix=prefix, tags=["Users"])
@@ -31,11 +37,11 @@ router = APIRouter(prefix=prefix, tags=["Users"])
     status_code=status.HTTP_201_CREATED,
     response_model=UserCreatedOut,
 )
-def create_user(
+async def create_user(
     user: UserCreate,
-    user_service: UserService = Depends(get_user_service),
+    user_service: AsyncUserService = Depends(get_user_service),
 ):
-    return user_service.create_user(user)
+    return await user_service.create_user(user)
 
 
 @router.get(
@@ -43,11 +49,11 @@ def create_user(
     summary="Get current user",
     response_model=UserPublicOut,
 )
-def get_logged_in_user(
-    current_user=Depends(get_current_user),
-    user_service: UserService = Depends(get_user_service),
+async def get_logged_in_user(
+    current_user=Depends(get_current_user_async),
+    user_service: AsyncUserService = Depends(get_user_service),
 ):
-    return user_service.get_current_user(current_user.id)
+    return await user_service.get_current_user(current_user.id)
 
 
 @router.get(
@@ -55,11 +61,11 @@ def get_logged_in_user(
     summary="Get current user settings",
     response_model=UserSettingsOut,
 )
-def get_current_user_settings(
-    current_user=Depends(get_current_user),
-    user_service: UserService = Depends(get_user_service),
+async def get_current_user_settings(
+    current_user=Depends(get_current_user_async),
+    user_service: AsyncUserService = Depends(get_user_service),
 ):
-    return user_service.get_current_user_settings(current_user.id)
+    return await user_service.get_current_user_settings(current_user.id)
 
 
 @router.patch(
@@ -67,12 +73,12 @@ def get_current_user_settings(
     summary="Edit current user's information",
     response_model=UserEditOut,
 )
-def edit_current_user(
+async def edit_current_user(
     user_edit: UserEdit,
-    current_user=Depends(get_current_user),
-    user_service: UserService = Depends(get_user_service),
+    current_user=Depends(get_current_user_async),
+    user_service: AsyncUserService = Depends(get_user_service),
 ):
-    return user_service.update_user(current_user.id, user_edit)
+    return await user_service.update_user(current_user.id, user_edit)
 
 
 @router.put(
@@ -80,12 +86,12 @@ def edit_current_user(
     summary="Change current user's password",
     status_code=status.HTTP_204_NO_CONTENT,
 )
-def change_password(
+async def change_password(
     data: UserChangePassword,
-    current_user=Depends(get_current_user),
-    user_service: UserService = Depends(get_user_service),
+    current_user=Depends(get_current_user_async),
+    user_service: AsyncUserService = Depends(get_user_service),
 ):
-    user_service.change_password(current_user.id, data)
+    await user_service.change_password(current_user.id, data)
 
 
 @router.delete(
@@ -93,11 +99,11 @@ def change_password(
     summary="Delete current user",
     status_code=status.HTTP_204_NO_CONTENT,
 )
-def delete_current_user(
-    current_user=Depends(get_current_user),
-    user_service: UserService = Depends(get_user_service),
+async def delete_current_user(
+    current_user=Depends(get_current_user_async),
+    user_service: AsyncUserService = Depends(get_user_service),
 ):
-    user_service.delete_user(current_user.id)
+    await user_service.delete_user(current_user.id)
 
 
 @router.get(
@@ -105,12 +111,36 @@ def delete_current_user(
     summary="Search users by username",
     response_model=List[UserListItemOut],
 )
-def search_users(
+async def search_users(
     query: str,
-    current_user=Depends(get_current_user),
-    user_service: UserService = Depends(get_user_service),
+    response: Response,
+    current_user=Depends(get_current_user_async),
+    user_service: AsyncUserService = Depends(get_user_service),
+    limit: int = Query(10, ge=1, le=50),
+    offset: int = Query(0, ge=0),
+    cursor: Optional[str] = None,
+):
+    page = await user_service.search_users(
+        current_user.id, query, limit=limit, offset=offset, cursor=cursor
+    )
+    return list_response(UserListItemOut, page, response)
+
+
+@router.get(
+    ":batch",
+    summary="Get public user information for many usernames",
+    response_model=List[UserPublicOut],
+)
+async def get_users_batch(
+    usernames: List[str] = Query(
+        ..., description="Repeated or comma separated; unknown ones are left out"
+    ),
+    current_user=Depends(get_current_user_async),
+    user_service: AsyncUserService = Depends(get_user_service),
 ):
-    return user_service.search_users(current_user.id, query)
+    usernames = parse_batch(usernames, "usernames", settings.BATCH_MAX_ITEMS)
+    users = await user_service.get_users_by_usernames(current_user.id, usernames)
+    return list_response(UserPublicOut, users)
 
 
 @router.get(
@@ -118,12 +148,19 @@ def search_users(
     summary="Get public user information by username",
     response_model=UserPublicOut,
 )
-def get_user_by_username(
+async def get_user_by_username(
+    request: Request,
+    response: Response,
     username: str,
-    current_user=Depends(get_current_user),
-    user_service: UserService = Depends(get_user_service),
+    current_user=Depends(get_current_user_async),
+    user_service: AsyncUserService = Depends(get_user_service),
 ):
-    return user_service.get_user_by_username(current_user.id, username)
+    version = await user_service.get_profile_version(username)
+    if version is not None:
+        etag = make_etag("user", current_user.id, username, version)
+        if not_modified := check_not_modified(request, response, etag):
+            return not_modified
+    return await user_service.get_user_by_username(current_user.id, username)
 
 
 @router.get(
@@ -131,21 +168,25 @@ def get_user_by_username(
     summary="Get a list of followers for a user",
     response_model=List[UserListItemOut],
 )
-def get_user_followers(
-    target_user_id=Depends(can_view_target_user),
-    current_user=Depends(get_current_user),
-    user_service: UserService = Depends(get_user_service),
+async def get_user_followers(
+    response: Response,
+    target_user_id=Depends(can_view_target_user_async),
+    current_user=Depends(get_current_user_async),
+    user_service: AsyncUserService = Depends(get_user_service),
     limit: int = Query(10, ge=1, le=50),
     offset: int = Query(0, ge=0),
     search: Optional[str] = "",
+    cursor: Optional[str] = None,
 ):
-    return user_service.get_user_followers(
+    page = await user_service.get_user_followers(
         current_user.id,
         target_user_id,
         limit=limit,
         offset=offset,
         search=search,
+        cursor=cursor,
     )
+    return list_response(UserListItemOut, page, response)
 
 
 @router.get(
@@ -153,21 +194,25 @@ def get_user_followers(
     summary="Get a list of following for a user",
     response_model=List[UserListItemOut],
 )
-def get_user_following(
-    target_user_id=Depends(can_view_target_user),
-    current_user=Depends(get_current_user),
-    user_service: UserService = Depends(get_user_service),
+async def get_user_following(
+    response: Response,
+    target_user_id=Depends(can_view_target_user_async),
+    current_user=Depends(get_current_user_async),
+    user_service: AsyncUserService = Depends(get_user_service),
     limit: int = Query(10, ge=1, le=50),
     offset: int = Query(0, ge=0),
     search: Optional[str] = "",
+    cursor: Optional[str] = None,
 ):
-    return user_service.get_user_following(
+    page = await user_service.get_user_following(
         current_user.id,
         target_user_id,
         limit=limit,
         offset=offset,
         search=search,
+        cursor=cursor,
     )
+    return list_response(UserListItemOut, page, response)
 
 
 @router.get(
@@ -175,16 +220,20 @@ def get_user_following(
     summary="Get a list of posts for a user",
     response_model=List[PostListItemOut],
 )
-def get_user_posts(
-    target_user_id=Depends(can_view_target_user),
-    current_user=Depends(get_current_user),
+async def get_user_posts(
+    response: Response,
+    target_user_id=Depends(can_view_target_user_async),
+    current_user=Depends(get_current_user_async),
     limit: int = Query(10, ge=1, le=50),
     offset: int = Query(0, ge=0),
-    post_service: PostService = Depends(get_post_service),
+    cursor: Optional[str] = None,
+    post_service: AsyncPostService = Depends(get_post_service),
 ):
-    return post_service.get_user_posts(
+    page = await post_service.get_user_posts(
         current_user.id,
         target_user_id,
         limit=limit,
         offset=offset,
+        cursor=cursor,
     )
+    return list_response(PostListItemOut, page, response)
@@ -8,10 +8,17 @@ class Token(BaseModel):
 
     access_token: str
     token_type: str
+    refresh_token: str
 
     model_config = {"frozen": True}
 
 
+class RefreshTokenIn(BaseModel):
+    """Schema for exchanging or revoking a refresh token."""
+
+    refresh_token: str
+
+
 class TokenData(BaseModel):
     """Schema for data contained in authentication token."""
 
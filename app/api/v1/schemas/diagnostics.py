@@ -0,0 +1,106 @@
+from pydantic import BaseModel
+
+
+class CheckoutWaitOut(BaseModel):
+    """Schema for connection checkout wait statistics in milliseconds."""
+
+    avg: float
+    p50: float
+    p99: float
+    max: float
+
+
+class ConnectionLifetimeOut(BaseModel):
+    """Schema for closed connection lifetime statistics in seconds."""
+
+    p50: float
+    max: float
+
+
+class PoolStatusOut(BaseModel):
+    """Schema for database connection pool occupancy and metrics."""
+
+    size: int
+    checked_in: int
+    in_use: int
+    overflow: int
+    checkouts: int
+    checkout_timeouts: int
+    checkout_wait_ms: CheckoutWaitOut
+    connections_opened: int
+    connections_closed: int
+    connection_lifetime_s: ConnectionLifetimeOut
+    pre_pings: int
+    pre_ping_failures: int
+
+
+class EnginePoolsOut(BaseModel):
+    """Schema for the pools of every engine, keyed primary or replica-N."""
+
+    mode: str
+    engines: dict[str, PoolStatusOut]
+
+
+class CacheStatsOut(BaseModel):
+    """Schema for in-process cache occupancy and hit/miss counters."""
+
+    size: int
+    maxsize: int
+    ttl_seconds: float
+    hits: int
+    misses: int
+    evictions: int
+    hit_ratio: float
+
+
+class NamespaceStatsOut(BaseModel):
+    """Schema for hit/miss counters of one cached service method."""
+
+    hits: int
+    misses: int
+
+
+class ServiceCacheStatsOut(BaseModel):
+    """Schema for service result cache counters; size is null for shared backends."""
+
+    backend: str
+    size: int | None
+    ttl_seconds: float
+    hits: int
+    misses: int
+    errors: int
+    hit_ratio: float
+    namespaces: dict[str, NamespaceStatsOut]
+
+
+class DurationMsOut(BaseModel):
+    """Schema for duration statistics in milliseconds."""
+
+    avg: float
+    p50: float
+    p99: float
+    max: float
+
+
+class HashPoolStatusOut(BaseModel):
+    """Schema for password hashing pool occupancy and timings."""
+
+    workers: int
+    max_pending: int
+    pending: int
+    completed: int
+    rejected: int
+    queue_wait_ms: DurationMsOut
+    hash_ms: DurationMsOut
+
+
+class TimelineFanoutStatusOut(BaseModel):
+    """Schema for timeline fan-out queue occupancy and job statistics."""
+
+    workers: int
+    queued: int
+    completed: int
+    failed: int
+    dropped: int
+    rows_written: int
+    job_ms: DurationMsOut
@@ -0,0 +1,209 @@
+import asyncio
+import pickle
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Iterable, Protocol
+
+from sqlalchemy.util.concurrency import await_only, in_greenlet
+
+# Returned by get() when a key is absent, so None can be cached like any value
+MISSING = object()
+
+
+class CacheBackendError(Exception):
+    """Raised by a backend when its store cannot be reached."""
+
+
+class CacheBackend(Protocol):
+    name: str
+
+    def get(self, key: str) -> Any: ...
+
+    def set(self, key: str, value: Any, ttl: float, tags: Iterable[str]) -> None: ...
+
+    def invalidate(self, tags: Iterable[str]) -> None: ...
+
+    def clear(self) -> None: ...
+
+    def size(self) -> int | None: ...
+
+
+class MemoryBackend:
+    """
+    Per-process LRU of live objects with per-entry TTLs and a tag -> keys
+    index. Values are stored as is, so callers must not mutate them.
+    """
+
+    name = "memory"
+
+    def __init__(self, maxsize: int, clock: Callable[[], float] = time.monotonic):
+        self.maxsize = maxsize
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._data: OrderedDict[str, tuple[float, Any, tuple[str, ...]]] = OrderedDict()
+        self._tags: dict[str, set[str]] = {}
+        self.evictions = 0
+
+    def get(self, key: str) -> Any:
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is None:
+                return MISSING
+            if entry[0] <= self._clock():
+                self._remove(key)
+                return MISSING
+            self._data.move_to_end(key)
+            return entry[1]
+
+    def set(self, key: str, value: Any, ttl: float, tags: Iterable[str]) -> None:
+        if self.maxsize <= 0 or ttl <= 0:
+            return
+        tags = tuple(tags)
+        with self._lock:
+            self._remove(key)
+            self._data[key] = (self._clock() + ttl, value, tags)
+            for tag in tags:
+                self._tags.setdefault(tag, set()).add(key)
+            while len(self._data) > self.maxsize:
+                self._remove(next(iter(self._data)))
+                self.evictions += 1
+
+    def invalidate(self, tags: Iterable[str]) -> None:
+        with self._lock:
+            for tag in tags:
+                for key in self._tags.pop(tag, ()):
+                    self._remove(key)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._data.clear()
+            self._tags.clear()
+            self.evictions = 0
+
+    def size(self) -> int:
+        return len(self._data)
+
+    def _remove(self, key: str) -> None:
+        """Drop key and its tag index entries; the caller holds the lock."""
+        entry = self._data.pop(key, None)
+        if entry is None:
+            return
+        for tag in entry[2]:
+            keys = self._tags.get(tag)
+            if keys is not None:
+                keys.discard(key)
+                if not keys:
+                    del self._tags[tag]
+
+
+class RedisBackend:
+    """
+    Any server speaking the Redis protocol (Redis, Valkey, KeyDB, fakeredis
+    in tests), shared by every worker. Values are pickled, so the server must
+    only be writable by this application. Each tag is a set of the keys
+    stored under it, expiring with the longest-lived of them.
+    """
+
+    name = "redis"
+
+    def __init__(self, client: Any, prefix: str = "cache:"):
+        import redis
+
+        self.client = client
+        self.prefix = prefix
+        self._errors = (redis.RedisError,)
+
+    @classmethod
+    def from_url(cls, url: str, prefix: str = "cache:") -> "RedisBackend":
+        try:
+            import redis
+        except ImportError as exc:
+            raise ValueError(
+                "CACHE_BACKEND=redis needs the redis package (uv sync --extra redis)"
+            ) from exc
+        return cls(redis.Redis.from_url(url), prefix)
+
+    def _key(self, key: str) -> str:
+        return f"{self.prefix}{key}"
+
+    def _tag(self, tag: str) -> str:
+        return f"{self.prefix}tag:{tag}"
+
+    def _call(self, fn: Callable[..., Any], *args: Any) -> Any:
+        """
+        Run a blocking client call, off the event loop when called from
+        async-mode service code, turning client errors into CacheBackendError.
+        """
+        try:
+            if in_greenlet():
+                return await_only(asyncio.to_thread(fn, *args))
+            return fn(*args)
+        except self._errors as exc:
+            raise CacheBackendError(str(exc)) from exc
+
+    def get(self, key: str) -> Any:
+        payload = self._call(self.client.get, self._key(key))
+        return MISSING if payload is None else pickle.loads(payload)
+
+    def set(self, key: str, value: Any, ttl: float, tags: Iterable[str]) -> None:
+        ttl_ms = int(ttl * 1000)
+        if ttl_ms <= 0:
+            return
+        tags = tuple(tags)
+
+        def write():
+            pipe = self.client.pipeline(transaction=False)
+            pipe.set(self._key(key), pickle.dumps(value), px=ttl_ms)
+            for tag in tags:
+                pipe.sadd(self._tag(tag), key)
+                # NX gives a new set its first expiry; GT only ever extends it
+                pipe.pexpire(self._tag(tag), ttl_ms, nx=True)
+                pipe.pexpire(self._tag(tag), ttl_ms, gt=True)
+            pipe.execute()
+
+        self._call(write)
+
+    def invalidate(self, tags: Iterable[str]) -> None:
+        tag_keys = [self._tag(tag) for tag in tags]
+        if not tag_keys:
+            return
+
+        def drop():
+            pipe = self.client.pipeline(transaction=False)
+            for tag_key in tag_keys:
+                pipe.smembers(tag_key)
+            members = set().union(*pipe.execute())
+            keys = [self._key(m.decode()) for m in members]
+            self.client.delete(*keys, *tag_keys)
+
+        self._call(drop)
+
+    def clear(self) -> None:
+        def drop_all():
+            keys = list(self.client.scan_iter(match=f"{self.prefix}*", count=1000))
+            if keys:
+                self.client.delete(*keys)
+
+        self._call(drop_all)
+
+    def size(self) -> None:
+        # Shared by every worker; counting our keys would mean a full SCAN
+        return None
+
+
+BACKENDS: dict[str, Callable[..., CacheBackend]] = {
+    "memory": lambda settings: MemoryBackend(settings.CACHE_MAX_ENTRIES),
+    "redis": lambda settings: RedisBackend.from_url(
+        settings.CACHE_REDIS_URL, settings.CACHE_KEY_PREFIX
+    ),
+}
+
+
+def get_backend(settings: Any) -> CacheBackend:
+    """Build the backend named by settings.CACHE_BACKEND from its settings."""
+    try:
+        factory = BACKENDS[settings.CACHE_BACKEND]
+    except KeyError:
+        raise ValueError(f"Unknown cache backend {settings.CACHE_BACKEND!r}") from None
+    return factory(settings)
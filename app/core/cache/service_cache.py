@@ -0,0 +1,173 @@
+import functools
+import inspect
+import threading
+from collections import defaultdict
+from typing import Any, Callable, Iterable
+
+from sqlalchemy import event
+from sqlalchemy.orm import Session
+
+from app.core.cache.backends import (
+    MISSING,
+    CacheBackend,
+    CacheBackendError,
+    get_backend,
+)
+from app.core.config import settings
+from app.core.logger import logger
+
+
+def user_tag(user_id: int) -> str:
+    return f"user:{user_id}"
+
+
+def post_tag(post_id: int) -> str:
+    return f"post:{post_id}"
+
+
+class ServiceCache:
+    """
+    Caches service results on a pluggable backend. Entries are grouped by
+    namespace (one per cached method) and tagged with the entities they were
+    built from (user:ID, post:ID); a write invalidates the tags it touched.
+    Backend failures are logged and counted, and degrade to cache misses.
+    """
+
+    def __init__(self, backend: CacheBackend, default_ttl: float):
+        self.backend = backend
+        self.default_ttl = default_ttl
+        self._lock = threading.Lock()
+        self._hits: defaultdict[str, int] = defaultdict(int)
+        self._misses: defaultdict[str, int] = defaultdict(int)
+        self.errors = 0
+
+    @property
+    def enabled(self) -> bool:
+        return self.default_ttl > 0
+
+    def get(self, namespace: str, key: Any) -> Any:
+        """Return the cached value, or MISSING."""
+        if not self.enabled:
+            return MISSING
+        try:
+            value = self.backend.get(_key(namespace, key))
+        except CacheBackendError:
+            self._record_error("get")
+            value = MISSING
+        with self._lock:
+            counts = self._misses if value is MISSING else self._hits
+            counts[namespace] += 1
+        return value
+
+    def set(
+        self,
+        namespace: str,
+        key: Any,
+        value: Any,
+        tags: Iterable[str],
+        ttl: float | None = None,
+    ) -> None:
+        if not self.enabled:
+            return
+        try:
+            self.backend.set(
+                _key(namespace, key),
+                value,
+                self.default_ttl if ttl is None else ttl,
+                tags,
+            )
+        except CacheBackendError:
+            self._record_error("set")
+
+    def invalidate(self, *tags: str) -> None:
+        if not self.enabled or not tags:
+            return
+        try:
+            self.backend.invalidate(tags)
+        except CacheBackendError:
+            self._record_error("invalidate")
+
+    def invalidate_on_commit(self, db: Session, *tags: str) -> None:
+        """
+        Invalidate tags now and again once db commits, so a request racing
+        this transaction cannot leave the pre-commit state cached.
+        """
+        self.invalidate(*tags)
+        event.listen(db, "after_commit", lambda _: self.invalidate(*tags), once=True)
+
+    def cached(
+        self,
+        namespace: str,
+        tags: Callable[..., Iterable[str]],
+        ttl: float | None = None,
+    ):
+        """
+        Decorate a service method to cache its result under namespace and
+        its arguments (without self). tags receives the result followed by
+        the method's arguments and returns the tags to file it under.
+        Exceptions are not cached.
+        """
+
+        def decorator(fn):
+            signature = inspect.signature(fn)
+
+            @functools.wraps(fn)
+            def wrapper(*args, **kwargs):
+                bound = signature.bind(*args, **kwargs)
+                bound.apply_defaults()
+                arguments = list(bound.arguments.values())[1:]
+
+                value = self.get(namespace, arguments)
+                if value is MISSING:
+                    value = fn(*args, **kwargs)
+                    self.set(namespace, arguments, value, tags(value, *arguments), ttl)
+                return value
+
+            return wrapper
+
+        return decorator
+
+    def clear(self) -> None:
+        try:
+            self.backend.clear()
+        except CacheBackendError:
+            self._record_error("clear")
+        with self._lock:
+            self._hits.clear()
+            self._misses.clear()
+            self.errors = 0
+
+    def stats(self) -> dict:
+        with self._lock:
+            hits, misses = sum(self._hits.values()), sum(self._misses.values())
+            return {
+                "backend": self.backend.name,
+                "size": self.backend.size(),
+                "ttl_seconds": self.default_ttl,
+                "hits": hits,
+                "misses": misses,
+                "errors": self.errors,
+                "hit_ratio": hits / (hits + misses) if hits + misses else 0.0,
+                "namespaces": {
+                    namespace: {
+                        "hits": self._hits[namespace],
+                        "misses": self._misses[namespace],
+                    }
+                    for namespace in sorted(self._hits.keys() | self._misses.keys())
+                },
+            }
+
+    def _record_error(self, operation: str) -> None:
+        with self._lock:
+            self.errors += 1
+        logger.exception(f"Service cache {operation} failed")
+
+
+def _key(namespace: str, key: Any) -> str:
+    parts = key if isinstance(key, (list, tuple)) else [key]
+    return ":".join([namespace, *map(str, parts)])
+
+
+# Per worker process with the memory backend, shared with the redis one;
+# entries live CACHE_TTL_SECONDS unless a cached method sets its own ttl
+service_cache = ServiceCache(get_backend(settings), settings.CACHE_TTL_SECONDS)
@@ -0,0 +1,213 @@
+import zlib
+from typing import Any, Callable, Protocol
+
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from app.core.logger import logger
+
+# Bodies of these types shrink; images, archives and the like are sent as is
+COMPRESSIBLE_TYPES = (
+    "application/json",
+    "application/javascript",
+    "application/xml",
+    "text/",
+)
+
+
+class Compressor(Protocol):
+    def compress(self, data: bytes) -> bytes: ...
+
+    def flush(self) -> bytes: ...
+
+
+class _BrotliCompressor:
+    def __init__(self, compressor: Any):
+        self._compressor = compressor
+
+    def compress(self, data: bytes) -> bytes:
+        return self._compressor.process(data)
+
+    def flush(self) -> bytes:
+        return self._compressor.finish()
+
+
+def _gzip(settings: Any) -> Callable[[], Compressor]:
+    level = settings.COMPRESSION_GZIP_LEVEL
+    # wbits=31 writes the gzip container rather than raw zlib
+    return lambda: zlib.compressobj(level, zlib.DEFLATED, 31)
+
+
+def _brotli(settings: Any) -> Callable[[], Compressor]:
+    import brotli
+
+    quality = settings.COMPRESSION_BROTLI_QUALITY
+    return lambda: _BrotliCompressor(brotli.Compressor(quality=quality))
+
+
+def _zstd(settings: Any) -> Callable[[], Compressor]:
+    import zstandard
+
+    level = settings.COMPRESSION_ZSTD_LEVEL
+    # A ZstdCompressor's context is shared by its compressobj streams, so
+    # concurrent responses each need their own
+    return lambda: zstandard.ZstdCompressor(level=level).compressobj()
+
+
+ENCODERS: dict[str, Callable[[Any], Callable[[], Compressor]]] = {
+    "gzip": _gzip,
+    "br": _brotli,
+    "zstd": _zstd,
+}
+
+
+def get_encoders(settings: Any) -> dict[str, Callable[[], Compressor]]:
+    """
+    Build compressor factories for settings.COMPRESSION_ENCODINGS, in that
+    order of preference. br and zstd need the compression extra and are
+    skipped with a warning without it.
+    """
+    encoders = {}
+    for name in settings.COMPRESSION_ENCODINGS:
+        try:
+            factory = ENCODERS[name]
+        except KeyError:
+            raise ValueError(f"Unknown compression encoding {name!r}") from None
+        try:
+            encoders[name] = factory(settings)
+        except ImportError:
+            logger.warning(
+                f"Compression encoding {name!r} needs the compression extra "
+                "(uv sync --extra compression); skipped"
+            )
+    return encoders
+
+
+def negotiate(accept_encoding: str, available: list[str]) -> str | None:
+    """
+    Pick the encoding the client weights highest in Accept-Encoding, breaking
+    ties by the order of available (the server's preference). None means
+    send the body as is.
+    """
+    weights: dict[str, float] = {}
+    for item in accept_encoding.lower().split(","):
+        name, _, params = item.partition(";")
+        name = name.strip()
+        if not name:
+            continue
+        weight = 1.0
+        params = params.strip()
+        if params.startswith("q="):
+            try:
+                weight = float(params[2:])
+            except ValueError:
+                continue
+        weights[name] = weight
+
+    best, best_weight = None, 0.0
+    for name in available:
+        weight = weights.get(name, weights.get("*", 0.0))
+        if weight > best_weight:
+            best, best_weight = name, weight
+    return best
+
+
+class CompressionMiddleware:
+    """
+    Compress response bodies with the best encoding both sides support.
+    Bodies smaller than minimum_size are sent as is, since the framing
+    outweighs the saving; streamed bodies are compressed chunk by chunk.
+    """
+
+    def __init__(
+        self,
+        app: ASGIApp,
+        encoders: dict[str, Callable[[], Compressor]],
+        minimum_size: int = 1024,
+    ):
+        self.app = app
+        self.encoders = encoders
+        self.minimum_size = minimum_size
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http" or not self.encoders:
+            await self.app(scope, receive, send)
+            return
+        encoding = negotiate(
+            Headers(scope=scope).get("accept-encoding", ""), list(self.encoders)
+        )
+        responder = _CompressionResponder(
+            send, encoding, encoding and self.encoders[encoding], self.minimum_size
+        )
+        await self.app(scope, receive, responder.send)
+
+
+class _CompressionResponder:
+    """Holds back http.response.start until the first body chunk decides."""
+
+    def __init__(
+        self,
+        send: Send,
+        encoding: str | None,
+        factory: Callable[[], Compressor] | None,
+        minimum_size: int,
+    ):
+        self._send = send
+        self.encoding = encoding
+        self.factory = factory
+        self.minimum_size = minimum_size
+        self.start: Message | None = None
+        self.compressor: Compressor | None = None
+
+    async def send(self, message: Message) -> None:
+        if message["type"] == "http.response.start":
+            self.start = message
+            return
+        if message["type"] != "http.response.body":
+            await self._send(message)
+            return
+
+        if self.start is not None:
+            start, self.start = self.start, None
+            await self._begin(start, message)
+            return
+
+        if self.compressor is not None:
+            body = self.compressor.compress(message.get("body", b""))
+            if not message.get("more_body", False):
+                body += self.compressor.flush()
+            message = {**message, "body": body}
+        await self._send(message)
+
+    async def _begin(self, start: Message, message: Message) -> None:
+        body = message.get("body", b"")
+        more_body = message.get("more_body", False)
+        headers = MutableHeaders(raw=start["headers"])
+
+        content_type = headers.get("content-type", "")
+        if (
+            "content-encoding" in headers
+            or not content_type.startswith(COMPRESSIBLE_TYPES)
+            or (not more_body and len(body) < self.minimum_size)
+        ):
+            await self._send(start)
+            await self._send(message)
+            return
+
+        # The body now depends on Accept-Encoding, even when sent as is
+        headers.add_vary_header("Accept-Encoding")
+        if self.encoding is None:
+            await self._send(start)
+            await self._send(message)
+            return
+
+        self.compressor = self.factory()
+        body = self.compressor.compress(body)
+        headers["Content-Encoding"] = self.encoding
+        if more_body:
+            del headers["Content-Length"]
+        else:
+            body += self.compressor.flush()
+            headers["Content-Length"] = str(len(body))
+        await self._send(start)
+        await self._send({**message, "body": body})
@@ -10,6 +10,84 @@ class Settings(BaseSettings):
     SECRET_KEY: str
     ALGORITHM: str
     ACCESS_TOKEN_EXPIRE_MINUTES: int
+    # Refresh tokens rotate on every use; each one is valid this long
+    REFRESH_TOKEN_EXPIRE_DAYS: int = 30
+    # How often each worker loads revocations made by other workers (0 = never)
+    TOKEN_REVOCATION_SYNC_SECONDS: int = 5
+
+    # Serve requests through AsyncEngine/AsyncSession instead of the threadpool
+    DATABASE_ASYNC: bool = False
+
+    # Connection pool sizing, per engine and per worker process
+    DATABASE_POOL_SIZE: int = 5
+    DATABASE_POOL_MAX_OVERFLOW: int = 10
+    DATABASE_POOL_RECYCLE_SECONDS: int = 1800
+    DATABASE_POOL_TIMEOUT_SECONDS: int = 30
+    # Ping connections idle longer than this on checkout (0 = always, -1 = never)
+    DATABASE_POOL_PRE_PING_IDLE_SECONDS: int = 30
+
+    # Read replicas for read-only requests, e.g. '["postgresql+psycopg://..."]'
+    DATABASE_REPLICA_URLS: list[str] = []
+    # How long a client reads from the primary after one of its writes
+    DATABASE_READ_YOUR_WRITES_SECONDS: int = 10
+    # Run GET/HEAD/OPTIONS requests in READ ONLY transactions that roll back
+    DATABASE_READ_ONLY_REQUESTS: bool = True
+
+    # In-process cache of authenticated principals (0 disables either bound)
+    PRINCIPAL_CACHE_SIZE: int = 10000
+    PRINCIPAL_CACHE_TTL_SECONDS: int = 30
+
+    # Service result cache: "memory" (per worker LRU) or "redis" (shared,
+    # needs the redis extra); a TTL of 0 disables it
+    CACHE_BACKEND: str = "memory"
+    CACHE_TTL_SECONDS: int = 30
+    CACHE_MAX_ENTRIES: int = 10000
+    CACHE_REDIS_URL: str = "redis://localhost:6379/0"
+    CACHE_KEY_PREFIX: str = "cache:"
+
+    # JWT signing/verification backend: "native" (pre-parsed keys) or "jose"
+    JWT_BACKEND: str = "native"
+    # Extra keys by kid, e.g. '{"2026-10": {"alg": "ES256", "private_key": "..."}}'
+    # HS* keys take "secret"; keys with only "public_key" verify but never sign
+    JWT_KEYS: dict[str, dict[str, str]] = {}
+    # kid that signs new tokens; empty signs with SECRET_KEY/ALGORITHM
+    JWT_ACTIVE_KID: str = ""
+    # In-process cache of verified token digests (0 disables either bound)
+    JWT_VERIFY_CACHE_SIZE: int = 10000
+    JWT_VERIFY_CACHE_TTL_SECONDS: int = 300
+
+    # Argon2 hashing process pool per worker process (0 workers hashes inline)
+    PASSWORD_HASH_WORKERS: int = 2
+    # Hashes queued or running before new ones fail fast with 503
+    PASSWORD_HASH_MAX_PENDING: int = 32
+    # Argon2id cost for new hashes; older hashes are upgraded on next login
+    PASSWORD_HASH_TIME_COST: int = 3
+    PASSWORD_HASH_MEMORY_COST_KIB: int = 65536
+    PASSWORD_HASH_PARALLELISM: int = 4
+
+    # Home timelines: posts by accounts with fewer followers than this are
+    # written into followers' timelines, larger accounts are merged on read
+    TIMELINE_FANOUT_MAX_FOLLOWERS: int = 10000
+    # Latest posts copied into a timeline when a follow is accepted
+    TIMELINE_BACKFILL_POSTS: int = 50
+    # Background fan-out threads per worker process (0 writes in the request)
+    TIMELINE_FANOUT_WORKERS: int = 1
+    # Fan-out jobs waiting beyond this are dropped (fix with rebuild_timelines.py)
+    TIMELINE_FANOUT_QUEUE_SIZE: int = 10000
+
+    # Response compression negotiated on Accept-Encoding, in server preference
+    # order; br and zstd need the compression extra. [] disables it
+    COMPRESSION_ENCODINGS: list[str] = ["zstd", "br", "gzip"]
+    # Bodies smaller than this are sent uncompressed
+    COMPRESSION_MINIMUM_SIZE: int = 1024
+    # Levels measured by benchmarks/compression_benchmark.py: higher ones cost
+    # 2-4x the CPU on list pages for a few percent fewer bytes
+    COMPRESSION_GZIP_LEVEL: int = 4
+    COMPRESSION_BROTLI_QUALITY: int = 2
+    COMPRESSION_ZSTD_LEVEL: int = 3
+
+    # Most usernames or post ids one /users:batch or /posts:batch call takes
+    BATCH_MAX_ITEMS: int = 100
 
     model_config = SettingsConfigDict(env_file=".env")
 
@@ -23,5 +101,14 @@ class Settings(BaseSettings):
             f"{self.DATABASE_NAME}"
         )
 
+    @property
+    def pool_options(self) -> dict:
+        return {
+            "pool_size": self.DATABASE_POOL_SIZE,
+            "max_overflow": self.DATABASE_POOL_MAX_OVERFLOW,
+            "pool_recycle": self.DATABASE_POOL_RECYCLE_SECONDS,
+            "pool_timeout": self.DATABASE_POOL_TIMEOUT_SECONDS,
+        }
+
 
 settings = Settings()
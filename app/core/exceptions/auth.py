@@ -26,9 +26,35 @@ class AuthInvalidJWT(AuthBaseException):
     message = "JWT is invalid or cannot be validated."
 
 
+class AuthInvalidRefreshToken(AuthBaseException):
+    """Raised when a refresh token is unknown, expired or revoked."""
+
+    status_code = status.HTTP_401_UNAUTHORIZED
+    error = "invalid_refresh_token"
+    message = "Refresh token is invalid or expired."
+
+
+class AuthRefreshTokenReused(AuthBaseException):
+    """Raised when an already rotated refresh token is presented again."""
+
+    status_code = status.HTTP_401_UNAUTHORIZED
+    error = "refresh_token_reused"
+    message = (
+        "Refresh token was already used; all sessions from this login were revoked."
+    )
+
+
 class AuthUserCannotBeAuthenticated(AuthBaseException):
     """Raised when the user cannot be authenticated from the provided token."""
 
     status_code = status.HTTP_400_BAD_REQUEST
     error = "user_cannot_be_authenticated"
     message = "The user is not authenticated or cannot be found in the database."
+
+
+class AuthPasswordHashingBusy(AuthBaseException):
+    """Raised when the password hashing pool has no room for another request."""
+
+    status_code = status.HTTP_503_SERVICE_UNAVAILABLE
+    error = "password_hashing_busy"
+    message = "Too many password checks in progress. Please retry shortly."
@@ -0,0 +1,34 @@
+from fastapi import status
+
+from app.core.exceptions.base_exception import AppBaseException
+
+
+class BatchBaseException(AppBaseException):
+    """Base class for all batch lookup exceptions."""
+
+    error: str = "batch_error"
+    message: str = "A batch lookup error occurred."
+
+
+class BatchEmpty(BatchBaseException):
+    """Raised when a batch lookup names no items."""
+
+    status_code = status.HTTP_400_BAD_REQUEST
+    error = "batch_empty"
+    message = "At least one item must be requested."
+
+
+class BatchTooLarge(BatchBaseException):
+    """Raised when a batch lookup names more items than allowed."""
+
+    status_code = status.HTTP_400_BAD_REQUEST
+    error = "batch_too_large"
+    message = "Too many items requested in one batch."
+
+
+class BatchInvalidItem(BatchBaseException):
+    """Raised when a batch item cannot be parsed or is out of range."""
+
+    status_code = status.HTTP_422_UNPROCESSABLE_CONTENT
+    error = "batch_invalid_item"
+    message = "A requested item is invalid."
@@ -0,0 +1,19 @@
+from fastapi import status
+
+from app.core.exceptions.base_exception import AppBaseException
+
+
+class PaginationBaseException(AppBaseException):
+    """Base class for all pagination-related exceptions."""
+
+    error: str = "pagination_error"
+    message: str = "A pagination error occurred."
+
+
+class PaginationInvalidCursor(PaginationBaseException):
+    """Raised when a pagination cursor cannot be decoded."""
+
+    status_code = status.HTTP_400_BAD_REQUEST
+    error = "invalid_cursor"
+    message = "The pagination cursor is invalid."
+    field = "cursor"
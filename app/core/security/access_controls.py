@@ -1,15 +1,17 @@
 from fastapi import Depends, Path
 from fastapi.security import OAuth2PasswordBearer
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 
 from app.core.exceptions.auth import AuthUserCannotBeAuthenticated
 from app.core.exceptions.post import PostNotFound
 from app.core.exceptions.user import UserNotAllowedToViewResource, UserNotFound
 from app.core.security.jwt import verify_access_token
-from app.db.database import get_db
+from app.core.security.principal import Principal, load_principal
+from app.db.database import get_db, get_session, run_in_session
 from app.db.models import User
-from app.db.models.follow import Follow
 from app.db.models.post import Post
+from app.services.helpers.subqueries.user_subqueries import UserSubqueries
 
 oauth2_scheme = OAuth2PasswordBearer(tokenUrl="/auth/login")
 
@@ -17,78 +19,105 @@ oauth2_scheme = OAuth2PasswordBearer(tokenUrl="/auth/login")
 def get_current_user(
     token: str = Depends(oauth2_scheme),
     db: Session = Depends(get_db),
-) -> User:
-    """Get the current user from the access token."""
+) -> Principal:
+    """Get the current user from the access token, served from the cache."""
     token_data = verify_access_token(token)
-    user = db.get(User, token_data.user_id)
-    if not user:
+    principal = load_principal(db, token_data.user_id)
+    if not principal:
         raise AuthUserCannotBeAuthenticated()
-    return user
+    return principal
 
 
 def can_view_target_user(
     username: str = Path(...),
     db: Session = Depends(get_db),
-    current_user: User = Depends(get_current_user),
+    current_user: Principal = Depends(get_current_user),
 ) -> int:
     """
     Raise if current_user cannot view target user.
     Return target user_id if allowed.
+    The lookup and the visibility decision run as one statement.
     """
-    # Get target user
-    target_user = db.query(User).filter(User.username == username).first()
-    if not target_user:
-        raise UserNotFound()
-
-    # Public user or self
-    if not target_user.is_private or target_user.id == current_user.id:
-        return target_user.id
-
-    # Check if current user follows target user
-    follow_exists = (
-        db.query(Follow)
-        .filter(
-            Follow.follower_id == current_user.id,
-            Follow.followee_id == target_user.id,
-            Follow.accepted.is_(True),
+    target = (
+        db.query(
+            User.id,
+            UserSubqueries.can_view_content(current_user.id, User.id).label("can_view"),
         )
+        .filter(User.username == username)
         .first()
     )
-    if not follow_exists:
+    if not target:
+        raise UserNotFound()
+
+    if not target.can_view:
         raise UserNotAllowedToViewResource()
 
-    return target_user.id
+    return target.id
 
 
 def can_view_post(
     post_id: int,
-    current_user: User = Depends(get_current_user),
+    current_user: Principal = Depends(get_current_user),
     db: Session = Depends(get_db),
 ) -> int:
     """
     Raises an exception if current_user cannot view the post.
     Returns the post_id if allowed.
+    The lookup and the visibility decision run as one statement.
     """
-    post = db.query(Post).filter(Post.id == post_id).first()
+    post = (
+        db.query(
+            Post.id,
+            UserSubqueries.can_view_content(current_user.id, Post.owner_id).label(
+                "can_view"
+            ),
+        )
+        .filter(Post.id == post_id)
+        .first()
+    )
     if not post:
         raise PostNotFound()
 
-    owner = db.query(User).filter(User.id == post.owner_id).first()
-    if not owner:
-        raise UserNotFound()
-
-    if owner.is_private and owner.id != current_user.id:
-        # check if current user follows owner
-        follow_exists = (
-            db.query(Follow)
-            .filter(
-                Follow.follower_id == current_user.id,
-                Follow.followee_id == owner.id,
-                Follow.accepted.is_(True),
-            )
-            .first()
-        )
-        if not follow_exists:
-            raise UserNotAllowedToViewResource()
+    if not post.can_view:
+        raise UserNotAllowedToViewResource()
 
     return post_id
+
+
+# -----------------------------
+# Awaitable dependencies used by the routers
+# -----------------------------
+
+
+async def get_current_user_async(
+    token: str = Depends(oauth2_scheme),
+    db: Session | AsyncSession = Depends(get_session),
+) -> Principal:
+    """Awaitable get_current_user for the configured database mode."""
+    return await run_in_session(db, lambda s: get_current_user(token=token, db=s))
+
+
+async def can_view_target_user_async(
+    username: str = Path(...),
+    db: Session | AsyncSession = Depends(get_session),
+    current_user: Principal = Depends(get_current_user_async),
+) -> int:
+    """Awaitable can_view_target_user for the configured database mode."""
+    return await run_in_session(
+        db,
+        lambda s: can_view_target_user(
+            username=username, db=s, current_user=current_user
+        ),
+    )
+
+
+async def can_view_post_async(
+    post_id: int,
+    current_user: Principal = Depends(get_current_user_async),
+    db: Session | AsyncSession = Depends(get_session),
+) -> int:
+    """Awaitable can_view_post for the configured database mode."""
+    return await run_in_session(
+        db,
+        lambda s: can_view_post(post_id=post_id, current_user=current_user, db=s),
+    )
@@ -0,0 +1,164 @@
+import asyncio
+import multiprocessing
+import threading
+import time
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from typing import Any, Callable, TypeVar
+
+from sqlalchemy.util.concurrency import await_only, in_greenlet
+
+from app.core.exceptions.auth import AuthPasswordHashingBusy
+from app.core.logger import logger
+from app.utils.stats import SAMPLE_SIZE, percentile
+
+T = TypeVar("T")
+
+
+def _timed(fn: Callable[..., T], *args: Any) -> tuple[T, float]:
+    """Run fn in the worker and return its result with the CPU time it took."""
+    start = time.perf_counter()
+    result = fn(*args)
+    return result, time.perf_counter() - start
+
+
+class HashPoolMetrics:
+    """Thread-safe counters for one HashPool."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.completed = 0
+        self.rejected = 0
+        self._waits: deque[float] = deque(maxlen=SAMPLE_SIZE)
+        self._hashes: deque[float] = deque(maxlen=SAMPLE_SIZE)
+
+    def record(self, wait: float, hash_time: float) -> None:
+        with self._lock:
+            self.completed += 1
+            self._waits.append(wait)
+            self._hashes.append(hash_time)
+
+    def record_rejection(self) -> None:
+        with self._lock:
+            self.rejected += 1
+
+    def snapshot(self) -> dict:
+        with self._lock:
+            waits = list(self._waits)
+            hashes = list(self._hashes)
+            return {
+                "completed": self.completed,
+                "rejected": self.rejected,
+                "queue_wait_ms": _summary(waits),
+                "hash_ms": _summary(hashes),
+            }
+
+
+def _summary(samples: list[float]) -> dict:
+    return {
+        "avg": sum(samples) / len(samples) * 1000 if samples else 0.0,
+        "p50": percentile(samples, 50) * 1000,
+        "p99": percentile(samples, 99) * 1000,
+        "max": max(samples, default=0.0) * 1000,
+    }
+
+
+class HashPool:
+    """
+    Size-limited process pool for password hashing, so Argon2 bursts burn
+    CPU outside the interpreter serving requests.
+    At most max_pending calls may be queued or running; the next one fails
+    fast with AuthPasswordHashingBusy (503) instead of piling up behind them.
+    workers=0 hashes inline in the calling thread.
+    """
+
+    def __init__(self, workers: int, max_pending: int):
+        self.workers = workers
+        self.max_pending = max_pending
+        self.metrics = HashPoolMetrics()
+        self._lock = threading.Lock()
+        self._pending = 0
+        self._executor: ProcessPoolExecutor | None = None
+
+    @property
+    def pending(self) -> int:
+        return self._pending
+
+    def _get_executor(self) -> ProcessPoolExecutor:
+        with self._lock:
+            if self._executor is None:
+                # spawn: forking a process that runs threads and an event loop
+                # can deadlock the child
+                self._executor = ProcessPoolExecutor(
+                    max_workers=self.workers,
+                    mp_context=multiprocessing.get_context("spawn"),
+                )
+            return self._executor
+
+    def _acquire(self) -> None:
+        with self._lock:
+            if self._pending >= self.max_pending:
+                self.metrics.record_rejection()
+                raise AuthPasswordHashingBusy()
+            self._pending += 1
+
+    def _release(self) -> None:
+        with self._lock:
+            self._pending -= 1
+
+    def run(self, fn: Callable[..., T], *args: Any) -> T:
+        """
+        Run fn(*args) in the pool and wait for it. Called from a threadpool
+        worker this blocks only that thread; on an AsyncSession's greenlet it
+        yields to the event loop while the worker hashes.
+        """
+        self._acquire()
+        try:
+            start = time.perf_counter()
+            if self.workers <= 0:
+                result, hash_time = _timed(fn, *args)
+            else:
+                try:
+                    result, hash_time = self._run_in_executor(fn, *args)
+                except BrokenProcessPool:
+                    # Hashing has no side effects, so one retry on the fresh
+                    # executor is safe
+                    result, hash_time = self._run_in_executor(fn, *args)
+            elapsed = time.perf_counter() - start
+        finally:
+            self._release()
+
+        self.metrics.record(max(elapsed - hash_time, 0.0), hash_time)
+        return result
+
+    def _run_in_executor(self, fn: Callable[..., T], *args: Any) -> tuple[T, float]:
+        executor = self._get_executor()
+        try:
+            future = executor.submit(_timed, fn, *args)
+            if in_greenlet():
+                return await_only(asyncio.wrap_future(future))
+            return future.result()
+        except BrokenProcessPool:
+            # A dead worker (OOM, kill) breaks the executor for good; drop it
+            # so the next call spawns a new one instead of failing forever
+            with self._lock:
+                if self._executor is executor:
+                    self._executor = None
+                    logger.warning("Password hashing worker died; restarting the pool")
+            executor.shutdown(wait=False, cancel_futures=True)
+            raise
+
+    def shutdown(self) -> None:
+        with self._lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=True, cancel_futures=True)
+
+    def status(self) -> dict:
+        return {
+            "workers": self.workers,
+            "max_pending": self.max_pending,
+            "pending": self._pending,
+            **self.metrics.snapshot(),
+        }
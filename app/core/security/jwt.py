@@ -1,30 +1,72 @@
+import hashlib
+import time
 from datetime import datetime, timedelta, timezone
 
-from jose import JWTError, jwt
-
 from app.api.v1.schemas.auth import TokenData
 from app.core.config import settings
 from app.core.exceptions.auth import AuthInvalidJWT
+from app.core.security.jwt_backends import (
+    TokenVerificationError,
+    get_backend,
+    load_keyring,
+)
+from app.core.security.revocation import revoked_tokens
+from app.utils.ttl_cache import TTLCache
 
 SECRET_KEY = settings.SECRET_KEY
 ALGORITHM = settings.ALGORITHM
 ACCESS_TOKEN_EXPIRE_MINUTES = settings.ACCESS_TOKEN_EXPIRE_MINUTES
 
+backend = get_backend(settings.JWT_BACKEND)
+keyring = load_keyring(
+    SECRET_KEY, ALGORITHM, settings.JWT_KEYS, settings.JWT_ACTIVE_KID
+)
+
+# Digest of each verified token -> (user_id, jti), kept until its exp at most
+verified_tokens = TTLCache(
+    maxsize=settings.JWT_VERIFY_CACHE_SIZE,
+    ttl=settings.JWT_VERIFY_CACHE_TTL_SECONDS,
+)
+
 
 def create_access_token(data: dict):
     to_encode = data.copy()
     expire = datetime.now(timezone.utc) + timedelta(minutes=ACCESS_TOKEN_EXPIRE_MINUTES)
-    to_encode.update({"exp": expire})
-    token = jwt.encode(to_encode, SECRET_KEY, algorithm=ALGORITHM)
+    to_encode.update({"exp": int(expire.timestamp())})
+    token = backend.encode(to_encode, keyring.active)
     return token
 
 
 def verify_access_token(token: str) -> TokenData:
-    try:
-        payload = jwt.decode(token, SECRET_KEY, algorithms=[ALGORITHM])
-        user_id = payload.get("user_id")
-        if not user_id:
+    """
+    Return the token's claims; raises AuthInvalidJWT if it is forged, expired
+    or revoked. Revocation is checked on every call, cached or not.
+    """
+    digest = hashlib.sha256(token.encode()).digest()
+    cached = verified_tokens.get(digest)
+    if cached is not None:
+        user_id, jti = cached
+        if jti and jti in revoked_tokens:
             raise AuthInvalidJWT()
         return TokenData(user_id=user_id)
-    except JWTError:
+
+    try:
+        payload = backend.decode(token, keyring)
+    except TokenVerificationError:
         raise AuthInvalidJWT()
+
+    user_id = payload.get("user_id")
+    if not user_id:
+        raise AuthInvalidJWT()
+
+    # Tokens issued before refresh tokens existed carry no jti
+    jti = payload.get("jti")
+    if jti and jti in revoked_tokens:
+        raise AuthInvalidJWT()
+
+    token_data = TokenData(user_id=user_id)
+    exp = payload.get("exp")
+    verified_tokens.set(
+        digest, (token_data.user_id, jti), ttl=exp - time.time() if exp else None
+    )
+    return token_data
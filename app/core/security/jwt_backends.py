@@ -0,0 +1,241 @@
+import base64
+import hashlib
+import hmac
+import json
+import time
+from dataclasses import dataclass
+from typing import Any, Protocol
+
+from cryptography.exceptions import InvalidSignature
+from cryptography.hazmat.primitives import hashes, serialization
+from cryptography.hazmat.primitives.asymmetric import ec, ed25519
+from cryptography.hazmat.primitives.asymmetric.utils import (
+    decode_dss_signature,
+    encode_dss_signature,
+)
+from jose import JWTError
+from jose import jwt as jose_jwt
+
+HMAC_HASHES = {
+    "HS256": hashlib.sha256,
+    "HS384": hashlib.sha384,
+    "HS512": hashlib.sha512,
+}
+SUPPORTED_ALGORITHMS = (*HMAC_HASHES, "ES256", "EdDSA")
+
+
+class TokenVerificationError(Exception):
+    """Raised by a backend when a token is malformed, forged or expired."""
+
+
+@dataclass(frozen=True, slots=True)
+class JWTKey:
+    """
+    One entry of the keyring. signing_key is None for verify-only keys kept
+    around so tokens signed before a rotation stay valid until they expire.
+    """
+
+    kid: str | None
+    alg: str
+    signing_key: Any
+    verifying_key: Any
+    # The raw secret or PEM, for backends that parse keys themselves
+    signing_material: str | None
+    verifying_material: str
+
+
+@dataclass(frozen=True, slots=True)
+class Keyring:
+    keys: dict[str | None, JWTKey]
+    active: JWTKey
+
+    def get(self, kid: str | None) -> JWTKey:
+        key = self.keys.get(kid)
+        if key is None:
+            raise TokenVerificationError(f"Unknown key id {kid!r}")
+        return key
+
+
+def _parse_key(kid: str | None, alg: str, entry: dict[str, str]) -> JWTKey:
+    if alg not in SUPPORTED_ALGORITHMS:
+        raise ValueError(f"Unsupported JWT algorithm {alg!r} for key {kid!r}")
+
+    if alg in HMAC_HASHES:
+        secret = entry["secret"]
+        return JWTKey(kid, alg, secret.encode(), secret.encode(), secret, secret)
+
+    private_pem = entry.get("private_key")
+    if private_pem:
+        private_key = serialization.load_pem_private_key(
+            private_pem.encode(), password=None
+        )
+        public_key = private_key.public_key()
+        public_pem = public_key.public_bytes(
+            serialization.Encoding.PEM,
+            serialization.PublicFormat.SubjectPublicKeyInfo,
+        ).decode()
+    else:
+        private_key = None
+        public_pem = entry["public_key"]
+        public_key = serialization.load_pem_public_key(public_pem.encode())
+
+    expected = ec.EllipticCurvePublicKey if alg == "ES256" else ed25519.Ed25519PublicKey
+    if not isinstance(public_key, expected) or (
+        alg == "ES256" and public_key.curve.name != "secp256r1"
+    ):
+        raise ValueError(f"Key {kid!r} does not match algorithm {alg}")
+    return JWTKey(kid, alg, private_key, public_key, private_pem, public_pem)
+
+
+def load_keyring(
+    secret_key: str,
+    algorithm: str,
+    keys: dict[str, dict[str, str]],
+    active_kid: str,
+) -> Keyring:
+    """
+    Build the keyring from settings. SECRET_KEY/ALGORITHM are registered
+    without a kid, so tokens issued before JWT_KEYS was configured keep
+    verifying; JWT_ACTIVE_KID selects the key new tokens are signed with.
+    """
+    legacy = _parse_key(None, algorithm, {"secret": secret_key})
+    parsed: dict[str | None, JWTKey] = {None: legacy}
+    for kid, entry in keys.items():
+        parsed[kid] = _parse_key(kid, entry.get("alg", "HS256"), entry)
+
+    if not active_kid:
+        return Keyring(parsed, legacy)
+    if active_kid not in parsed:
+        raise ValueError(f"JWT_ACTIVE_KID {active_kid!r} is not in JWT_KEYS")
+    active = parsed[active_kid]
+    if active.signing_key is None:
+        raise ValueError(f"JWT_ACTIVE_KID {active_kid!r} has no private key")
+    return Keyring(parsed, active)
+
+
+class JWTBackend(Protocol):
+    name: str
+    algorithms: tuple[str, ...]
+
+    def encode(self, payload: dict, key: JWTKey) -> str: ...
+
+    def decode(self, token: str, keyring: Keyring) -> dict: ...
+
+
+class JoseBackend:
+    """python-jose; re-parses the key on every call and has no EdDSA."""
+
+    name = "jose"
+    algorithms = (*HMAC_HASHES, "ES256")
+
+    def encode(self, payload: dict, key: JWTKey) -> str:
+        if key.alg not in self.algorithms:
+            raise ValueError(f"python-jose cannot sign {key.alg}")
+        headers = {"kid": key.kid} if key.kid else None
+        return jose_jwt.encode(
+            payload, key.signing_material, algorithm=key.alg, headers=headers
+        )
+
+    def decode(self, token: str, keyring: Keyring) -> dict:
+        try:
+            key = keyring.get(jose_jwt.get_unverified_header(token).get("kid"))
+            if key.alg not in self.algorithms:
+                raise TokenVerificationError(f"python-jose cannot verify {key.alg}")
+            return jose_jwt.decode(token, key.verifying_material, algorithms=[key.alg])
+        except JWTError as exc:
+            raise TokenVerificationError(str(exc)) from exc
+
+
+def _b64encode(data: bytes) -> bytes:
+    return base64.urlsafe_b64encode(data).rstrip(b"=")
+
+
+def _b64decode(data: bytes) -> bytes:
+    return base64.urlsafe_b64decode(data + b"=" * (-len(data) % 4))
+
+
+def _json(data: dict) -> bytes:
+    return json.dumps(data, separators=(",", ":")).encode()
+
+
+class NativeBackend:
+    """
+    Compact JWS signed and verified directly with hmac/cryptography against
+    the keyring's pre-parsed key objects.
+    """
+
+    name = "native"
+    algorithms = SUPPORTED_ALGORITHMS
+
+    def encode(self, payload: dict, key: JWTKey) -> str:
+        header = {"alg": key.alg, "typ": "JWT"}
+        if key.kid:
+            header["kid"] = key.kid
+        signing_input = _b64encode(_json(header)) + b"." + _b64encode(_json(payload))
+        signature = self._sign(key, signing_input)
+        return (signing_input + b"." + _b64encode(signature)).decode()
+
+    def decode(self, token: str, keyring: Keyring) -> dict:
+        try:
+            signing_input, _, signature = token.encode().rpartition(b".")
+            header_segment, _, payload_segment = signing_input.partition(b".")
+            header = json.loads(_b64decode(header_segment))
+            key = keyring.get(header.get("kid"))
+            # The key decides the algorithm; a mismatched header is a forgery
+            if header.get("alg") != key.alg:
+                raise TokenVerificationError("Algorithm does not match key")
+            self._verify(key, signing_input, _b64decode(signature))
+            payload = json.loads(_b64decode(payload_segment))
+        except (ValueError, TypeError, AttributeError, InvalidSignature) as exc:
+            raise TokenVerificationError(str(exc)) from exc
+
+        if not isinstance(payload, dict):
+            raise TokenVerificationError("Payload is not a JSON object")
+        exp = payload.get("exp")
+        if exp is not None:
+            if not isinstance(exp, (int, float)):
+                raise TokenVerificationError("exp is not a number")
+            if exp <= time.time():
+                raise TokenVerificationError("Signature has expired")
+        return payload
+
+    @staticmethod
+    def _sign(key: JWTKey, data: bytes) -> bytes:
+        if key.alg in HMAC_HASHES:
+            return hmac.new(key.signing_key, data, HMAC_HASHES[key.alg]).digest()
+        if key.alg == "ES256":
+            r, s = decode_dss_signature(
+                key.signing_key.sign(data, ec.ECDSA(hashes.SHA256()))
+            )
+            return r.to_bytes(32, "big") + s.to_bytes(32, "big")
+        return key.signing_key.sign(data)
+
+    @staticmethod
+    def _verify(key: JWTKey, data: bytes, signature: bytes) -> None:
+        if key.alg in HMAC_HASHES:
+            expected = hmac.new(key.verifying_key, data, HMAC_HASHES[key.alg]).digest()
+            if not hmac.compare_digest(expected, signature):
+                raise InvalidSignature()
+        elif key.alg == "ES256":
+            if len(signature) != 64:
+                raise InvalidSignature()
+            der = encode_dss_signature(
+                int.from_bytes(signature[:32], "big"),
+                int.from_bytes(signature[32:], "big"),
+            )
+            key.verifying_key.verify(der, data, ec.ECDSA(hashes.SHA256()))
+        else:
+            key.verifying_key.verify(signature, data)
+
+
+BACKENDS: dict[str, type] = {
+    JoseBackend.name: JoseBackend,
+    NativeBackend.name: NativeBackend,
+}
+
+
+def get_backend(name: str) -> JWTBackend:
+    try:
+        return BACKENDS[name]()
+    except KeyError:
+        raise ValueError(f"Unknown JWT backend {name!r}") from None
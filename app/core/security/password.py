@@ -1,11 +1,54 @@
 from pwdlib import PasswordHash
+from pwdlib.hashers.argon2 import Argon2Hasher
 
-pwd_context = PasswordHash.recommended()
+from app.core.config import settings
+from app.core.security.hash_pool import HashPool
 
+# Built from settings in every pool worker too, since workers import this module
+pwd_context = PasswordHash(
+    (
+        Argon2Hasher(
+            time_cost=settings.PASSWORD_HASH_TIME_COST,
+            memory_cost=settings.PASSWORD_HASH_MEMORY_COST_KIB,
+            parallelism=settings.PASSWORD_HASH_PARALLELISM,
+        ),
+    )
+)
 
-def hash_password(password: str) -> str:
+# Per worker process; started on first use
+hash_pool = HashPool(
+    workers=settings.PASSWORD_HASH_WORKERS,
+    max_pending=settings.PASSWORD_HASH_MAX_PENDING,
+)
+
+
+def _hash(password: str) -> str:
     return pwd_context.hash(password)
 
 
-def verify_password(plain_password: str, hashed_password: str) -> bool:
+def _verify(plain_password: str, hashed_password: str) -> bool:
     return pwd_context.verify(plain_password, hashed_password)
+
+
+def _verify_and_update(
+    plain_password: str, hashed_password: str
+) -> tuple[bool, str | None]:
+    return pwd_context.verify_and_update(plain_password, hashed_password)
+
+
+def hash_password(password: str) -> str:
+    return hash_pool.run(_hash, password)
+
+
+def verify_password(plain_password: str, hashed_password: str) -> bool:
+    return hash_pool.run(_verify, plain_password, hashed_password)
+
+
+def verify_and_update_password(
+    plain_password: str, hashed_password: str
+) -> tuple[bool, str | None]:
+    """
+    Verify plain_password and, when hashed_password was made with other
+    parameters than the current settings, also return a fresh hash to store.
+    """
+    return hash_pool.run(_verify_and_update, plain_password, hashed_password)
@@ -0,0 +1,53 @@
+from dataclasses import dataclass
+
+from sqlalchemy import event
+from sqlalchemy.orm import Session
+
+from app.core.config import settings
+from app.db.models import User
+from app.utils.ttl_cache import TTLCache
+
+
+@dataclass(frozen=True, slots=True)
+class Principal:
+    """The authenticated caller, as cached between requests."""
+
+    id: int
+    username: str
+    is_private: bool
+
+
+# Per worker process; entries live at most PRINCIPAL_CACHE_TTL_SECONDS, which
+# bounds how long other workers may serve a principal after it changes
+principal_cache = TTLCache(
+    maxsize=settings.PRINCIPAL_CACHE_SIZE,
+    ttl=settings.PRINCIPAL_CACHE_TTL_SECONDS,
+)
+
+
+def load_principal(db: Session, user_id: int) -> Principal | None:
+    """Return the cached principal for user_id, loading it on a miss."""
+    principal = principal_cache.get(user_id)
+    if principal is not None:
+        return principal
+
+    user = db.get(User, user_id)
+    if not user:
+        return None
+
+    principal = Principal(
+        id=user.id, username=user.username, is_private=user.is_private
+    )
+    principal_cache.set(user_id, principal)
+    return principal
+
+
+def invalidate_principal(db: Session, user_id: int) -> None:
+    """
+    Drop user_id from the cache now and again once db commits, so a request
+    racing this transaction cannot leave the pre-commit state cached.
+    """
+    principal_cache.delete(user_id)
+    event.listen(
+        db, "after_commit", lambda _: principal_cache.delete(user_id), once=True
+    )
@@ -0,0 +1,127 @@
+import asyncio
+import threading
+import time
+from datetime import datetime, timedelta, timezone
+from typing import Callable, Iterable
+
+from fastapi.concurrency import run_in_threadpool
+from sqlalchemy import select
+from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.orm import Session
+
+from app.core.config import settings
+from app.core.logger import logger
+from app.db.database import SessionLocal
+from app.db.models import RefreshToken
+
+
+class RevocationSet:
+    """
+    Revoked access-token ids, checked on every request without touching the
+    database. Ids are kept as 16 raw bytes and dropped once the token they
+    name has expired anyway, so the set only holds live revocations.
+    """
+
+    def __init__(self, clock: Callable[[], float] = time.time):
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._expires: dict[bytes, float] = {}
+        # Size at which add() next sweeps out expired entries
+        self._purge_at = 1024
+        # Upper bound of revoked_at already loaded by sync()
+        self.synced_until: datetime | None = None
+
+    @staticmethod
+    def _key(jti: str) -> bytes | None:
+        try:
+            return bytes.fromhex(jti)
+        except (TypeError, ValueError):
+            return None
+
+    def __contains__(self, jti: str) -> bool:
+        return self._key(jti) in self._expires
+
+    def __len__(self) -> int:
+        return len(self._expires)
+
+    def add(self, jti: str, expires_at: float) -> None:
+        key = self._key(jti)
+        if key is None or expires_at <= self._clock():
+            return
+        with self._lock:
+            self._expires[key] = expires_at
+            grown = len(self._expires) >= self._purge_at
+        if grown:
+            self.purge()
+            self._purge_at = max(2 * len(self._expires), 1024)
+
+    def add_issued(self, rows: Iterable[tuple[str, datetime]]) -> None:
+        """Revoke access tokens given (jti, issued_at) rows of refresh_tokens."""
+        lifetime = timedelta(minutes=settings.ACCESS_TOKEN_EXPIRE_MINUTES)
+        for jti, issued_at in rows:
+            self.add(jti, (_as_utc(issued_at) + lifetime).timestamp())
+
+    def purge(self) -> int:
+        """Drop entries whose tokens have expired; return how many went."""
+        now = self._clock()
+        with self._lock:
+            expired = [key for key, exp in self._expires.items() if exp <= now]
+            for key in expired:
+                del self._expires[key]
+        return len(expired)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._expires.clear()
+            self.synced_until = None
+
+    def sync(self, db: Session) -> int:
+        """
+        Load families revoked by other worker processes since the last sync,
+        limited to rows whose access tokens can still be live.
+        Returns the number of rows read.
+        """
+        now = datetime.now(timezone.utc)
+        lifetime = timedelta(minutes=settings.ACCESS_TOKEN_EXPIRE_MINUTES)
+        query = select(RefreshToken.jti, RefreshToken.created_at).where(
+            RefreshToken.revoked_at.is_not(None),
+            RefreshToken.created_at > now - lifetime,
+        )
+        if self.synced_until is not None:
+            query = query.where(RefreshToken.revoked_at >= self.synced_until)
+
+        rows = db.execute(query).all()
+        self.add_issued(rows)
+        self.purge()
+        # Overlap one interval so commits racing this read are not missed
+        self.synced_until = now - timedelta(
+            seconds=max(settings.TOKEN_REVOCATION_SYNC_SECONDS, 1)
+        )
+        return len(rows)
+
+
+def _as_utc(value: datetime) -> datetime:
+    return value if value.tzinfo else value.replace(tzinfo=timezone.utc)
+
+
+# Per worker process; revocations made elsewhere arrive through sync()
+revoked_tokens = RevocationSet()
+
+
+def _sync_once() -> None:
+    with SessionLocal() as db:
+        revoked_tokens.sync(db)
+
+
+async def run_revocation_sync(interval: float) -> None:
+    """Keep revoked_tokens in step with the table until cancelled."""
+    while True:
+        try:
+            await run_in_threadpool(_sync_once)
+        except SQLAlchemyError:
+            # Database unreachable or the query failed; retry next interval
+            logger.exception("Token revocation sync failed")
+        except Exception:
+            logger.exception("Token revocation sync stopped")
+            raise
+        await asyncio.sleep(interval)
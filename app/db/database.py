@@ -1,24 +1,129 @@
+from typing import Any, Callable, TypeVar
+
+from fastapi import Request, Response
+from fastapi.concurrency import run_in_threadpool
 from sqlalchemy import create_engine
-from sqlalchemy.orm import DeclarativeBase, sessionmaker
+from sqlalchemy.engine import Engine
+from sqlalchemy.ext.asyncio import (
+    AsyncEngine,
+    AsyncSession,
+    async_sessionmaker,
+    create_async_engine,
+)
+from sqlalchemy.orm import DeclarativeBase, Session, sessionmaker
 
 from app.core.config import settings
+from app.db.pool import (
+    InstrumentedAsyncQueuePool,
+    InstrumentedQueuePool,
+    instrument_pool,
+)
+from app.db.routing import RoutingSession, route_request
+
+T = TypeVar("T")
 
 
 class Base(DeclarativeBase):
     pass
 
 
-engine = create_engine(settings.database_url, echo=False, pool_pre_ping=True)
-SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+def _create_engine(url: str) -> Engine:
+    new_engine = create_engine(
+        url,
+        echo=False,
+        poolclass=InstrumentedQueuePool,
+        **settings.pool_options,
+    )
+    instrument_pool(new_engine, settings.DATABASE_POOL_PRE_PING_IDLE_SECONDS)
+    return new_engine
+
+
+def _create_async_engine(url: str) -> AsyncEngine:
+    # psycopg 3 serves both engines; the async engine picks its asyncio dialect
+    new_engine = create_async_engine(
+        url,
+        echo=False,
+        poolclass=InstrumentedAsyncQueuePool,
+        **settings.pool_options,
+    )
+    instrument_pool(
+        new_engine.sync_engine, settings.DATABASE_POOL_PRE_PING_IDLE_SECONDS
+    )
+    return new_engine
+
+
+engine = _create_engine(settings.database_url)
+replica_engines = [_create_engine(url) for url in settings.DATABASE_REPLICA_URLS]
+SessionLocal = sessionmaker(
+    class_=RoutingSession, autocommit=False, autoflush=False, bind=engine
+)
+
+async_engine = _create_async_engine(settings.database_url)
+# RoutingSession runs inside the AsyncSession, so it routes to the sync facades
+async_replica_engines = [
+    _create_async_engine(url).sync_engine for url in settings.DATABASE_REPLICA_URLS
+]
+AsyncSessionLocal = async_sessionmaker(
+    bind=async_engine,
+    sync_session_class=RoutingSession,
+    autoflush=False,
+    expire_on_commit=False,
+)
 
 
-def get_db():
-    db = SessionLocal()
+def get_db(request: Request, response: Response):
+    """
+    Yield the request session. No connection is checked out until the first
+    statement runs; read-only requests roll back on close instead of committing.
+    """
+    info = route_request(
+        request,
+        response,
+        replica_engines,
+        settings.DATABASE_READ_YOUR_WRITES_SECONDS,
+        settings.DATABASE_READ_ONLY_REQUESTS,
+    )
+    db = SessionLocal(info=info)
     try:
         yield db
-        db.commit()
+        if not info.get("read_only"):
+            db.commit()
     except:
         db.rollback()
         raise
     finally:
         db.close()
+
+
+async def get_async_db(request: Request, response: Response):
+    info = route_request(
+        request,
+        response,
+        async_replica_engines,
+        settings.DATABASE_READ_YOUR_WRITES_SECONDS,
+        settings.DATABASE_READ_ONLY_REQUESTS,
+    )
+    async with AsyncSessionLocal(info=info) as db:
+        try:
+            yield db
+            if not info.get("read_only"):
+                await db.commit()
+        except:
+            await db.rollback()
+            raise
+
+
+# Session dependency used by the API, selected by the configured database mode
+get_session = get_async_db if settings.DATABASE_ASYNC else get_db
+
+
+async def run_in_session(
+    db: Session | AsyncSession, fn: Callable[..., T], *args: Any, **kwargs: Any
+) -> T:
+    """
+    Run sync ORM code fn(session, *args, **kwargs) without blocking the event loop.
+    An AsyncSession runs it on its greenlet bridge, a Session on the threadpool.
+    """
+    if isinstance(db, AsyncSession):
+        return await db.run_sync(fn, *args, **kwargs)
+    return await run_in_threadpool(fn, db, *args, **kwargs)
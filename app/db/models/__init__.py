@@ -1,5 +1,8 @@
 from .comment import Comment  # noqa: F401
 from .follow import Follow  # noqa: F401
 from .post import Post  # noqa: F401
+from .post_counters import PostCounters  # noqa: F401
 from .reaction import Reaction  # noqa: F401
+from .refresh_token import RefreshToken  # noqa: F401
+from .timeline_entry import TimelineEntry  # noqa: F401
 from .user import User  # noqa: F401
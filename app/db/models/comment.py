@@ -1,4 +1,4 @@
-from sqlalchemy import TIMESTAMP, Column, ForeignKey, Integer, String, text
+from sqlalchemy import TIMESTAMP, Column, ForeignKey, Index, Integer, String, text
 from sqlalchemy.orm import relationship
 
 from app.db.database import Base
@@ -6,6 +6,7 @@ from app.db.database import Base
 
 class Comment(Base):
     __tablename__ = "comments"
+    __table_args__ = (Index("ix_comments_post_id_created_at", "post_id", "created_at"),)
 
     id = Column(Integer, primary_key=True, nullable=False)
     content = Column(String, nullable=False)
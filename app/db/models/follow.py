@@ -1,4 +1,4 @@
-from sqlalchemy import TIMESTAMP, Boolean, Column, ForeignKey, Integer, text
+from sqlalchemy import TIMESTAMP, Boolean, Column, ForeignKey, Index, Integer, text
 from sqlalchemy.orm import relationship
 
 from app.db.database import Base
@@ -6,6 +6,9 @@ from app.db.database import Base
 
 class Follow(Base):
     __tablename__ = "follows"
+    __table_args__ = (
+        Index("ix_follows_followee_id_accepted", "followee_id", "accepted"),
+    )
 
     follower_id = Column(
         Integer, ForeignKey("users.id", ondelete="CASCADE"), primary_key=True
@@ -1,11 +1,17 @@
-from sqlalchemy import TIMESTAMP, Column, ForeignKey, Integer, String, text
+from sqlalchemy import TIMESTAMP, Column, ForeignKey, Index, Integer, String, text
 from sqlalchemy.orm import relationship
 
 from app.db.database import Base
+from app.db.models.post_counters import PostCounters
 
 
 class Post(Base):
     __tablename__ = "posts"
+    __table_args__ = (
+        Index("ix_posts_owner_id_created_at", "owner_id", "created_at"),
+        # Newest-first walk for the home feed when followees post densely
+        Index("ix_posts_created_at_id", "created_at", "id"),
+    )
 
     id = Column(Integer, primary_key=True, nullable=False)
     title = Column(String, nullable=False)
@@ -18,3 +24,11 @@ class Post(Base):
     owner = relationship("User", back_populates="posts")
     comments = relationship("Comment", back_populates="post", cascade="all, delete")
     reactions = relationship("Reaction", back_populates="post", cascade="all, delete")
+    counters = relationship(
+        "PostCounters", back_populates="post", uselist=False, cascade="all, delete"
+    )
+
+    def __init__(self, **kwargs):
+        # Every post gets its counters row in the same flush
+        kwargs.setdefault("counters", PostCounters())
+        super().__init__(**kwargs)
@@ -0,0 +1,38 @@
+import operator
+from functools import reduce
+
+from sqlalchemy import Column, ForeignKey, Integer
+from sqlalchemy.orm import relationship
+
+from app.core.enums import ReactionType
+from app.db.database import Base
+
+
+class PostCounters(Base):
+    """Denormalized per-post counts, maintained by the services (see CounterHelper)."""
+
+    __tablename__ = "post_counters"
+
+    post_id = Column(
+        Integer, ForeignKey("posts.id", ondelete="CASCADE"), primary_key=True
+    )
+    comments_count = Column(Integer, nullable=False, server_default="0", default=0)
+    like_count = Column(Integer, nullable=False, server_default="0", default=0)
+    wow_count = Column(Integer, nullable=False, server_default="0", default=0)
+    heart_count = Column(Integer, nullable=False, server_default="0", default=0)
+    fire_count = Column(Integer, nullable=False, server_default="0", default=0)
+    sad_count = Column(Integer, nullable=False, server_default="0", default=0)
+    # Bumped whenever the post, its counters or its comments change (ETags)
+    version = Column(Integer, nullable=False, server_default="0", default=0)
+
+    post = relationship("Post", back_populates="counters")
+
+    @classmethod
+    def reaction_column(cls, reaction_type: ReactionType):
+        """Return the counter column for reaction_type."""
+        return getattr(cls, f"{reaction_type.value}_count")
+
+    @classmethod
+    def reactions_total(cls):
+        """SQL expression summing the per-type reaction counters."""
+        return reduce(operator.add, (cls.reaction_column(t) for t in ReactionType))
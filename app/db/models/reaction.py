@@ -1,4 +1,4 @@
-from sqlalchemy import Column, Enum, ForeignKey, Integer
+from sqlalchemy import Column, Enum, ForeignKey, Index, Integer
 from sqlalchemy.orm import relationship
 
 from app.core.enums import ReactionType
@@ -7,6 +7,7 @@ from app.db.database import Base
 
 class Reaction(Base):
     __tablename__ = "reactions"
+    __table_args__ = (Index("ix_reactions_post_id_type", "post_id", "type"),)
 
     user_id = Column(
         Integer, ForeignKey("users.id", ondelete="CASCADE"), primary_key=True
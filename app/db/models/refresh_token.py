@@ -0,0 +1,29 @@
+from sqlalchemy import TIMESTAMP, Column, ForeignKey, Integer, String, text
+
+from app.db.database import Base
+
+
+class RefreshToken(Base):
+    """
+    One rotation of a refresh token. Every login starts a family; each refresh
+    marks its row used and adds the next one to the same family. jti is shared
+    with the access token issued alongside, so revoking a family can revoke
+    its live access tokens too.
+    """
+
+    __tablename__ = "refresh_tokens"
+
+    id = Column(Integer, primary_key=True, nullable=False)
+    user_id = Column(
+        Integer, ForeignKey("users.id", ondelete="CASCADE"), nullable=False, index=True
+    )
+    family_id = Column(String(32), nullable=False, index=True)
+    jti = Column(String(32), nullable=False, unique=True)
+    # SHA-256 hex of the opaque token; the token itself is never stored
+    token_hash = Column(String(64), nullable=False, unique=True)
+    created_at = Column(
+        TIMESTAMP(timezone=True), nullable=False, server_default=text("now()")
+    )
+    expires_at = Column(TIMESTAMP(timezone=True), nullable=False)
+    used_at = Column(TIMESTAMP(timezone=True), nullable=True)
+    revoked_at = Column(TIMESTAMP(timezone=True), nullable=True, index=True)
@@ -0,0 +1,34 @@
+from sqlalchemy import TIMESTAMP, Column, ForeignKey, Index, Integer
+
+from app.db.database import Base
+
+
+class TimelineEntry(Base):
+    """
+    A post materialized into a follower's home timeline (see TimelineHelper).
+    owner_id and created_at are copied from the post so the timeline can be
+    paged and pruned per followee without touching posts.
+    """
+
+    __tablename__ = "timeline_entries"
+    __table_args__ = (
+        Index(
+            "ix_timeline_entries_user_id_created_at",
+            "user_id",
+            "created_at",
+            "post_id",
+        ),
+        Index("ix_timeline_entries_user_id_owner_id", "user_id", "owner_id"),
+        # Serves the post_id cascade when a post is deleted
+        Index("ix_timeline_entries_post_id", "post_id"),
+    )
+
+    user_id = Column(
+        Integer, ForeignKey("users.id", ondelete="CASCADE"), primary_key=True
+    )
+    post_id = Column(
+        Integer, ForeignKey("posts.id", ondelete="CASCADE"), primary_key=True
+    )
+    # No foreign key: deleting the owner already cascades through its posts
+    owner_id = Column(Integer, nullable=False)
+    created_at = Column(TIMESTAMP(timezone=True), nullable=False)
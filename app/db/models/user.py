@@ -1,4 +1,15 @@
-from sqlalchemy import TIMESTAMP, Boolean, Column, Integer, String, text
+from sqlalchemy import (
+    DDL,
+    TIMESTAMP,
+    Boolean,
+    Column,
+    Index,
+    Integer,
+    String,
+    event,
+    func,
+    text,
+)
 from sqlalchemy.orm import relationship
 
 from app.db.database import Base
@@ -15,6 +26,13 @@ class User(Base):
     is_private = Column(Boolean, nullable=False, server_default="false")
     created_at = Column(TIMESTAMP(timezone=True), server_default=text("now()"))
 
+    # Denormalized counters, maintained by the services (see CounterHelper)
+    posts_count = Column(Integer, nullable=False, server_default="0", default=0)
+    followers_count = Column(Integer, nullable=False, server_default="0", default=0)
+    following_count = Column(Integer, nullable=False, server_default="0", default=0)
+    # Bumped whenever a column shown on the public profile changes (ETags)
+    version = Column(Integer, nullable=False, server_default="0", default=0)
+
     posts = relationship("Post", back_populates="owner", cascade="all, delete")
     comments = relationship("Comment", back_populates="owner", cascade="all, delete")
     reactions = relationship("Reaction", back_populates="user", cascade="all, delete")
@@ -31,3 +49,19 @@ class User(Base):
         back_populates="followee",
         cascade="all, delete",
     )
+
+
+# Trigram index serving substring search and similarity ranking on usernames
+Index(
+    "ix_users_username_trgm",
+    func.lower(User.username).label("username_lower"),
+    postgresql_using="gin",
+    postgresql_ops={"username_lower": "gin_trgm_ops"},
+)
+
+# create_all (used by the tests) needs the extension before building the index
+event.listen(
+    Base.metadata,
+    "before_create",
+    DDL("CREATE EXTENSION IF NOT EXISTS pg_trgm").execute_if(dialect="postgresql"),
+)
@@ -0,0 +1,163 @@
+import threading
+import time
+from collections import deque
+
+from sqlalchemy import event, exc
+from sqlalchemy.engine import Engine
+from sqlalchemy.pool import AsyncAdaptedQueuePool, QueuePool
+
+from app.utils.stats import SAMPLE_SIZE, percentile
+
+
+class PoolMetrics:
+    """Thread-safe counters for one connection pool."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.checkouts = 0
+        self.checkout_timeouts = 0
+        self.checkout_wait_total = 0.0
+        self.checkout_wait_max = 0.0
+        self.connections_opened = 0
+        self.connections_closed = 0
+        self.pre_pings = 0
+        self.pre_ping_failures = 0
+        self._waits: deque[float] = deque(maxlen=SAMPLE_SIZE)
+        self._lifetimes: deque[float] = deque(maxlen=SAMPLE_SIZE)
+
+    def record_checkout(self, wait: float) -> None:
+        with self._lock:
+            self.checkouts += 1
+            self.checkout_wait_total += wait
+            self.checkout_wait_max = max(self.checkout_wait_max, wait)
+            self._waits.append(wait)
+
+    def record_timeout(self) -> None:
+        with self._lock:
+            self.checkout_timeouts += 1
+
+    def record_open(self) -> None:
+        with self._lock:
+            self.connections_opened += 1
+
+    def record_close(self, lifetime: float | None) -> None:
+        with self._lock:
+            self.connections_closed += 1
+            if lifetime is not None:
+                self._lifetimes.append(lifetime)
+
+    def record_pre_ping(self, failed: bool) -> None:
+        with self._lock:
+            self.pre_pings += 1
+            if failed:
+                self.pre_ping_failures += 1
+
+    def snapshot(self) -> dict:
+        with self._lock:
+            waits = list(self._waits)
+            lifetimes = list(self._lifetimes)
+            return {
+                "checkouts": self.checkouts,
+                "checkout_timeouts": self.checkout_timeouts,
+                "checkout_wait_ms": {
+                    "avg": (
+                        self.checkout_wait_total / self.checkouts * 1000
+                        if self.checkouts
+                        else 0.0
+                    ),
+                    "p50": percentile(waits, 50) * 1000,
+                    "p99": percentile(waits, 99) * 1000,
+                    "max": self.checkout_wait_max * 1000,
+                },
+                "connections_opened": self.connections_opened,
+                "connections_closed": self.connections_closed,
+                "connection_lifetime_s": {
+                    "p50": percentile(lifetimes, 50),
+                    "max": max(lifetimes, default=0.0),
+                },
+                "pre_pings": self.pre_pings,
+                "pre_ping_failures": self.pre_ping_failures,
+            }
+
+
+class InstrumentedQueuePool(QueuePool):
+    """QueuePool that times how long callers wait for a connection."""
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.metrics = PoolMetrics()
+
+    def recreate(self):
+        pool = super().recreate()
+        pool.metrics = self.metrics
+        return pool
+
+    def connect(self):
+        start = time.perf_counter()
+        try:
+            connection = super().connect()
+        except exc.TimeoutError:
+            self.metrics.record_timeout()
+            raise
+        self.metrics.record_checkout(time.perf_counter() - start)
+        return connection
+
+
+class InstrumentedAsyncQueuePool(InstrumentedQueuePool, AsyncAdaptedQueuePool):
+    """Async-adapted variant of InstrumentedQueuePool for AsyncEngine."""
+
+
+def instrument_pool(engine: Engine, pre_ping_idle_seconds: int) -> None:
+    """
+    Attach lifetime tracking and the idle-based pre-ping policy to engine's pool.
+    pre_ping_idle_seconds: ping connections idle for longer than this on
+    checkout; 0 pings on every checkout, a negative value never pings.
+    """
+    metrics = engine.pool.metrics
+
+    @event.listens_for(engine, "connect")
+    def on_connect(dbapi_connection, connection_record):
+        connection_record.info["opened_at"] = time.monotonic()
+        connection_record.info["checked_in_at"] = time.monotonic()
+        metrics.record_open()
+
+    @event.listens_for(engine, "checkin")
+    def on_checkin(dbapi_connection, connection_record):
+        connection_record.info["checked_in_at"] = time.monotonic()
+
+    @event.listens_for(engine, "close")
+    def on_close(dbapi_connection, connection_record):
+        opened_at = connection_record.info.get("opened_at")
+        metrics.record_close(
+            time.monotonic() - opened_at if opened_at is not None else None
+        )
+
+    if pre_ping_idle_seconds < 0:
+        return
+
+    @event.listens_for(engine, "checkout")
+    def on_checkout(dbapi_connection, connection_record, connection_proxy):
+        idle = time.monotonic() - connection_record.info.get("checked_in_at", 0)
+        if idle <= pre_ping_idle_seconds:
+            return
+        try:
+            # The dialect pings outside a transaction (psycopg: in autocommit),
+            # so options applied after checkout, like read_only, still apply
+            engine.dialect.do_ping(dbapi_connection)
+        except Exception as e:
+            metrics.record_pre_ping(failed=True)
+            # Makes the pool discard this connection and retry with a fresh one
+            raise exc.DisconnectionError() from e
+        metrics.record_pre_ping(failed=False)
+
+
+def pool_status(engine: Engine) -> dict:
+    """Return live pool occupancy plus the recorded metrics for engine."""
+    pool = engine.pool
+    return {
+        "size": pool.size(),
+        "checked_in": pool.checkedin(),
+        "in_use": pool.checkedout(),
+        "overflow": max(pool.overflow(), 0),
+        **pool.metrics.snapshot(),
+    }
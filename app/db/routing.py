@@ -0,0 +1,91 @@
+import random
+import time
+from functools import cache
+
+from fastapi import Request, Response
+from sqlalchemy.engine import Engine
+from sqlalchemy.orm import Session
+
+READ_ONLY_METHODS = {"GET", "HEAD", "OPTIONS"}
+
+# Clients echo this back (cookie or header) to keep reading from the primary
+PRIMARY_UNTIL_COOKIE = "primary_until"
+PRIMARY_UNTIL_HEADER = "X-Primary-Until"
+
+
+@cache
+def read_only_engine(engine: Engine) -> Engine:
+    """Return a view of engine whose transactions start as BEGIN READ ONLY."""
+    return engine.execution_options(postgresql_readonly=True)
+
+
+class RoutingSession(Session):
+    """
+    Session bound to the primary unless a replica was picked for it.
+    The replica is chosen once per request (see route_request) so a unit of
+    work never mixes engines and always sees its own writes. Sessions marked
+    read_only run their transaction as READ ONLY on the chosen engine.
+    """
+
+    def get_bind(self, mapper=None, clause=None, **kw):
+        bind = self.info.get("replica")
+        if bind is None:
+            bind = super().get_bind(mapper=mapper, clause=clause, **kw)
+        if self.info.get("read_only"):
+            return read_only_engine(bind)
+        return bind
+
+
+def is_read_only_request(request: Request) -> bool:
+    return request.method in READ_ONLY_METHODS
+
+
+def _sticks_to_primary(request: Request) -> bool:
+    """Return True while the client is inside its read-your-writes window."""
+    value = request.cookies.get(PRIMARY_UNTIL_COOKIE) or request.headers.get(
+        PRIMARY_UNTIL_HEADER
+    )
+    if not value:
+        return False
+    try:
+        return float(value) > time.time()
+    except ValueError:
+        return False
+
+
+def route_request(
+    request: Request,
+    response: Response,
+    replicas: list[Engine],
+    sticky_seconds: int,
+    read_only_transactions: bool = False,
+) -> dict:
+    """
+    Decide where a request's session reads from and return the session info.
+    Read-only requests go to a random replica, in a READ ONLY transaction when
+    read_only_transactions is set; writes go to the primary and pin the
+    client's following reads to it for sticky_seconds.
+    """
+    info = {}
+    if read_only_transactions and is_read_only_request(request):
+        info["read_only"] = True
+
+    if not replicas:
+        return info
+
+    if not is_read_only_request(request):
+        until = time.time() + sticky_seconds
+        response.set_cookie(
+            PRIMARY_UNTIL_COOKIE,
+            f"{until:.3f}",
+            max_age=sticky_seconds,
+            httponly=True,
+            samesite="lax",
+        )
+        response.headers[PRIMARY_UNTIL_HEADER] = f"{until:.3f}"
+        return info
+
+    if not _sticks_to_primary(request):
+        info["replica"] = random.choice(replicas)
+
+    return info
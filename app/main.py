@@ -1,11 +1,18 @@
+import asyncio
+
 from fastapi import FastAPI, Request
 from fastapi.concurrency import asynccontextmanager
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.responses import JSONResponse
 
-from app.api.v1 import router as api_v1_router
+from app.api.v1.router import router as api_v1_router
+from app.core.compression import CompressionMiddleware, get_encoders
+from app.core.config import settings
 from app.core.exceptions.base_exception import AppBaseException
 from app.core.logger import logger
+from app.core.security.password import hash_pool
+from app.core.security.revocation import run_revocation_sync
+from app.services.timeline_fanout import timeline_fanout
 
 api_v1_router_prefix = "/api/v1"
 
@@ -14,7 +21,16 @@ api_v1_router_prefix = "/api/v1"
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     logger.info("Application startup")
+    sync_task = None
+    if settings.TOKEN_REVOCATION_SYNC_SECONDS > 0:
+        sync_task = asyncio.create_task(
+            run_revocation_sync(settings.TOKEN_REVOCATION_SYNC_SECONDS)
+        )
     yield
+    if sync_task is not None:
+        sync_task.cancel()
+    hash_pool.shutdown()
+    timeline_fanout.shutdown()
     logger.info("Application shutdown")
 
 
@@ -36,6 +52,14 @@ app.add_middleware(
 )
 
 
+# Compress large responses (list endpoints) for clients that accept it
+app.add_middleware(
+    CompressionMiddleware,
+    encoders=get_encoders(settings),
+    minimum_size=settings.COMPRESSION_MINIMUM_SIZE,
+)
+
+
 # Register global exception handlers
 @app.exception_handler(AppBaseException)
 async def app_base_exception_handler(request: Request, exc: AppBaseException):
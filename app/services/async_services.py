@@ -0,0 +1,63 @@
+from typing import Any, Callable
+
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+
+from app.db.database import run_in_session
+from app.services.auth_service import AuthService
+from app.services.comment_service import CommentService
+from app.services.follow_service import FollowService
+from app.services.post_service import PostService
+from app.services.reaction_service import ReactionService
+from app.services.user_service import UserService
+
+
+class AsyncService:
+    """
+    Awaitable facade over a sync service.
+    Every public method of service_cls becomes a coroutine that runs the sync
+    implementation against the request session through run_in_session, so the
+    business logic lives in one place for both database modes.
+    """
+
+    service_cls: type
+
+    def __init__(self, db: Session | AsyncSession):
+        self.db = db
+
+    def __getattr__(self, name: str) -> Callable[..., Any]:
+        if name.startswith("_") or not callable(getattr(self.service_cls, name)):
+            raise AttributeError(name)
+
+        async def call(*args: Any, **kwargs: Any) -> Any:
+            return await run_in_session(
+                self.db,
+                lambda db: getattr(self.service_cls(db), name)(*args, **kwargs),
+            )
+
+        call.__name__ = name
+        return call
+
+
+class AsyncAuthService(AsyncService):
+    service_cls = AuthService
+
+
+class AsyncUserService(AsyncService):
+    service_cls = UserService
+
+
+class AsyncPostService(AsyncService):
+    service_cls = PostService
+
+
+class AsyncCommentService(AsyncService):
+    service_cls = CommentService
+
+
+class AsyncReactionService(AsyncService):
+    service_cls = ReactionService
+
+
+class AsyncFollowService(AsyncService):
+    service_cls = FollowService
@@ -1,10 +1,26 @@
+import hashlib
+import secrets
+import uuid
+from datetime import datetime, timedelta, timezone
+
 from fastapi.security import OAuth2PasswordRequestForm
+from sqlalchemy import select, update
 from sqlalchemy.orm import Session
 
-from app.core.exceptions.auth import AuthInvalidLoginCredentials
+from app.core.config import settings
+from app.core.exceptions.auth import (
+    AuthInvalidLoginCredentials,
+    AuthInvalidRefreshToken,
+    AuthRefreshTokenReused,
+)
 from app.core.security.jwt import create_access_token
-from app.core.security.password import verify_password
-from app.db.models import User
+from app.core.security.password import verify_and_update_password
+from app.core.security.revocation import revoked_tokens
+from app.db.models import RefreshToken, User
+
+
+def _token_hash(refresh_token: str) -> str:
+    return hashlib.sha256(refresh_token.encode()).hexdigest()
 
 
 class AuthService:
@@ -12,7 +28,11 @@ class AuthService:
         self.db = db
 
     def login_user(self, user_credentials: OAuth2PasswordRequestForm):
-        """Authenticate user and return access token; raises InvalidLoginCredentials on failure."""
+        """
+        Authenticate user and return access and refresh tokens; raises
+        InvalidLoginCredentials on failure. Rehashes the stored password if
+        its parameters are outdated.
+        """
         user = (
             self.db.query(User).filter(User.email == user_credentials.username).first()
         )
@@ -20,9 +40,96 @@ class AuthService:
         if not user:
             raise AuthInvalidLoginCredentials()
 
-        if not verify_password(user_credentials.password, user.hashed_password):
+        verified, new_hash = verify_and_update_password(
+            user_credentials.password, user.hashed_password
+        )
+        if not verified:
             raise AuthInvalidLoginCredentials()
 
-        access_token = create_access_token(data={"user_id": user.id})
+        # Upgrade hashes made with older cost parameters while we have the password
+        if new_hash:
+            user.hashed_password = new_hash
+            self.db.flush()
+
+        return self._issue_tokens(user.id, family_id=uuid.uuid4().hex)
+
+    def refresh_tokens(self, refresh_token: str):
+        """
+        Rotate refresh_token: mark it used and return a new access/refresh pair
+        in the same family. Raises InvalidRefreshToken for unknown, expired or
+        revoked tokens, and RefreshTokenReused (revoking the whole family) when
+        an already rotated token comes back, since one of its holders stole it.
+        """
+        row = self._get_refresh_token(refresh_token)
+
+        if row.used_at is not None:
+            self._revoke_family(row.family_id)
+            # The request fails, but the revocation must outlive its rollback
+            self.db.commit()
+            raise AuthRefreshTokenReused()
+
+        row.used_at = datetime.now(timezone.utc)
+        return self._issue_tokens(row.user_id, row.family_id)
+
+    def logout_user(self, refresh_token: str) -> None:
+        """Revoke the family refresh_token belongs to; raises InvalidRefreshToken."""
+        row = self._get_refresh_token(refresh_token)
+        self._revoke_family(row.family_id)
+
+    def _get_refresh_token(self, refresh_token: str) -> RefreshToken:
+        # Row lock so two concurrent refreshes of one token cannot both rotate it
+        row = self.db.scalar(
+            select(RefreshToken)
+            .where(
+                RefreshToken.token_hash == _token_hash(refresh_token),
+                RefreshToken.expires_at > datetime.now(timezone.utc),
+                RefreshToken.revoked_at.is_(None),
+            )
+            .with_for_update()
+        )
+        if row is None:
+            raise AuthInvalidRefreshToken()
+        return row
+
+    def _issue_tokens(self, user_id: int, family_id: str) -> dict:
+        now = datetime.now(timezone.utc)
+        jti = uuid.uuid4().hex
+        refresh_token = secrets.token_urlsafe(32)
+
+        self.db.add(
+            RefreshToken(
+                user_id=user_id,
+                family_id=family_id,
+                jti=jti,
+                token_hash=_token_hash(refresh_token),
+                created_at=now,
+                expires_at=now + timedelta(days=settings.REFRESH_TOKEN_EXPIRE_DAYS),
+            )
+        )
+        self.db.flush()
+
+        access_token = create_access_token(data={"user_id": user_id, "jti": jti})
+
+        return {
+            "access_token": access_token,
+            "token_type": "bearer",
+            "refresh_token": refresh_token,
+        }
 
-        return {"access_token": access_token, "token_type": "bearer"}
+    def _revoke_family(self, family_id: str) -> None:
+        """
+        Revoke every refresh token of family_id and, in this worker's memory,
+        the access tokens issued with them. Other workers pick the revocation
+        up from the table on their next sync.
+        """
+        rows = self.db.execute(
+            update(RefreshToken)
+            .where(
+                RefreshToken.family_id == family_id,
+                RefreshToken.revoked_at.is_(None),
+            )
+            .values(revoked_at=datetime.now(timezone.utc))
+            .returning(RefreshToken.jti, RefreshToken.created_at),
+            execution_options={"synchronize_session": False},
+        ).all()
+        revoked_tokens.add_issued(rows)
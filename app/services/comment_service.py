@@ -1,5 +1,7 @@
-from typing import List
+from datetime import datetime
+from typing import Optional
 
+from sqlalchemy import delete, func, select
 from sqlalchemy.orm import Session
 
 from app.api.v1.schemas.comment import (
@@ -10,12 +12,26 @@ from app.api.v1.schemas.comment import (
 )
 from app.core.exceptions.comment import CommentNotFound, CommentUserNotAllowed
 from app.db.models.comment import Comment
+from app.db.models.post_counters import PostCounters
+from app.db.models.user import User
+from app.services.helpers.counter_helper import CounterHelper
 from app.services.helpers.user_helper import UserHelper
+from app.utils.pagination import (
+    Page,
+    decode_cursor,
+    keyset_filter,
+    order_by_keys,
+    paginate_query,
+)
+
+COMMENT_KEYS = [(Comment.created_at, True), (Comment.id, True)]
+COMMENT_KEY_TYPES = [datetime, int]
 
 
 class CommentService:
     def __init__(self, db: Session):
         self.user_helper = UserHelper(db)
+        self.counter_helper = CounterHelper(db)
         self.db = db
 
     def add_post_comment(
@@ -26,6 +42,7 @@ class CommentService:
             **comment_create.model_dump(), owner_id=current_user_id, post_id=post_id
         )
         self.db.add(new_comment)
+        self.counter_helper.adjust_comments_count(post_id, 1)
         self.db.flush()
         self.db.refresh(new_comment)
         return new_comment
@@ -36,36 +53,73 @@ class CommentService:
         post_id: int,
         limit: int = 10,
         offset: int = 0,
-    ) -> List[CommentOut]:
+        cursor: Optional[str] = None,
+    ) -> Page:
         """Get comments for a given post with minimal owner info and pagination."""
 
-        comments = (
-            self.db.query(Comment)
-            .filter(Comment.post_id == post_id)
-            .order_by(Comment.created_at.desc())
-            .limit(limit)
-            .offset(offset)
-            .all()
+        comments = paginate_query(
+            self.db.query(Comment).filter(Comment.post_id == post_id),
+            COMMENT_KEYS,
+            COMMENT_KEY_TYPES,
+            limit,
+            offset,
+            cursor,
         )
 
-        result: List[CommentOut] = []
-        for comment in comments:
-            owner_out = self.user_helper.get_user_list_item_out(
-                user_id=comment.owner_id,
-                current_user_id=current_user_id,
-            )
+        owners = self.user_helper.get_user_list_items_out(
+            (comment.owner_id for comment in comments), current_user_id
+        )
 
-            result.append(
+        return Page(
+            (
                 CommentOut(
                     id=comment.id,
                     content=comment.content,
                     created_at=comment.created_at,
                     post_id=comment.post_id,
-                    owner=owner_out,
+                    owner=owners[comment.owner_id],
                 )
-            )
+                for comment in comments
+            ),
+            next_cursor=comments.next_cursor,
+        )
 
-        return result
+    def get_post_comments_version(
+        self,
+        post_id: int,
+        limit: int = 10,
+        offset: int = 0,
+        cursor: Optional[str] = None,
+    ) -> Optional[tuple[int, int]]:
+        """
+        Return the change signal for a page of get_post_comments: the post's
+        version, bumped by every comment written to it, and the sum of the
+        versions of the page's comment owners, whose summaries it shows.
+        It walks the same index range as the page itself (OFFSET included),
+        so a match saves loading comment bodies and owner summaries and
+        serializing them, not the page lookup.
+        None when the post has no counters row.
+        """
+        page = select(Comment.owner_id).where(Comment.post_id == post_id)
+        if cursor:
+            page = page.where(
+                keyset_filter(COMMENT_KEYS, decode_cursor(cursor, COMMENT_KEY_TYPES))
+            )
+        else:
+            page = page.offset(offset)
+        page = page.order_by(*order_by_keys(COMMENT_KEYS)).limit(limit).subquery()
+
+        owners_version = (
+            select(func.coalesce(func.sum(User.version), 0))
+            .join(page, page.c.owner_id == User.id)
+            .scalar_subquery()
+        )
+        row = self.db.execute(
+            select(PostCounters.version, owners_version).where(
+                PostCounters.post_id == post_id
+            )
+        ).first()
+        return tuple(row) if row else None
 
     def update_post_comment(
         self,
@@ -81,6 +135,7 @@ class CommentService:
         if comment_update.content is not None:
             comment.content = comment_update.content
 
+        self.counter_helper.bump_post_version(post_id)
         self.db.flush()
         self.db.refresh(comment)
 
@@ -94,9 +149,20 @@ class CommentService:
     ) -> None:
         """Delete a comment on a post."""
 
-        comment = self._get_comment(current_user_id, post_id, comment_id)
+        self._get_comment(current_user_id, post_id, comment_id)
+
+        # Only the request whose DELETE removed the row adjusts the counter
+        deleted = self.db.execute(
+            delete(Comment)
+            .where(Comment.id == comment_id)
+            .returning(Comment.id)
+            .execution_options(synchronize_session="fetch")
+        ).first()
 
-        self.db.delete(comment)
+        if deleted is None:
+            raise CommentNotFound()
+
+        self.counter_helper.adjust_comments_count(post_id, -1)
         self.db.flush()
 
     def _get_comment(
@@ -113,7 +179,7 @@ class CommentService:
             .filter(Comment.id == comment_id, Comment.post_id == post_id)
             .first()
         )
-        
+
         if not comment:
             raise CommentNotFound()
 
@@ -1,5 +1,6 @@
 from typing import List
 
+from sqlalchemy import delete, update
 from sqlalchemy.orm import Session
 
 from app.api.v1.schemas.follow import FollowRequestOut
@@ -11,13 +12,18 @@ from app.core.exceptions.follow import (
     FollowYourself,
 )
 from app.db.models.follow import Follow
+from app.services.helpers.counter_helper import CounterHelper
+from app.services.helpers.timeline_helper import TimelineHelper
 from app.services.helpers.user_helper import UserHelper
+from app.services.timeline_fanout import timeline_fanout
 
 
 class FollowService:
     def __init__(self, db: Session):
         self.db = db
         self.user_helper = UserHelper(db)
+        self.counter_helper = CounterHelper(db)
+        self.timeline_helper = TimelineHelper(db)
 
     def follow_user(self, follower_id: int, followee_id: int) -> None:
         """Create a follow relationship between two users."""
@@ -41,7 +47,11 @@ class FollowService:
         )
 
         self.db.add(follow)
+        if accepted:
+            self.counter_helper.adjust_follow_counts(follower_id, followee_id, 1)
         self.db.flush()
+        if accepted:
+            timeline_fanout.submit(self.db, "backfill_follow", follower_id, followee_id)
 
     def unfollow_user(self, follower_id: int, followee_id: int) -> None:
         """Remove a follow relationship between two users."""
@@ -51,7 +61,12 @@ class FollowService:
         if not follow.accepted:
             raise FollowNotAccepted()
 
-        self.db.delete(follow)
+        # Only the request whose DELETE removed the row adjusts the counters
+        if not self._delete_follow(follower_id, followee_id, accepted=True):
+            raise FollowNotFound()
+        self.counter_helper.adjust_follow_counts(follower_id, followee_id, -1)
+        # Synchronous: a private followee's posts must vanish with the follow
+        self.timeline_helper.remove_follow(follower_id, followee_id)
         self.db.flush()
 
     def accept_follow_request(self, follower_id: int, followee_id: int) -> None:
@@ -62,8 +77,23 @@ class FollowService:
         if follow.accepted:
             raise FollowAlreadyAccepted()
 
-        follow.accepted = True
+        # Conditional, so a concurrent accept of the same request counts once
+        accepted = self.db.execute(
+            update(Follow)
+            .where(
+                Follow.follower_id == follower_id,
+                Follow.followee_id == followee_id,
+                Follow.accepted.is_(False),
+            )
+            .values(accepted=True)
+            .returning(Follow.follower_id)
+            .execution_options(synchronize_session="fetch")
+        ).first()
+        if accepted is None:
+            raise self._lost_race(follower_id, followee_id)
+        self.counter_helper.adjust_follow_counts(follower_id, followee_id, 1)
         self.db.flush()
+        timeline_fanout.submit(self.db, "backfill_follow", follower_id, followee_id)
 
     def remove_pending_request(self, follower_id: int, followee_id: int) -> None:
         """Remove a pending follow request, either by sender or recipient."""
@@ -73,7 +103,10 @@ class FollowService:
         if follow.accepted:
             raise FollowAlreadyAccepted()
 
-        self.db.delete(follow)
+        # Pending requests are not counted, so no counter changes here; the
+        # condition keeps a concurrently accepted follow (which is) intact
+        if not self._delete_follow(follower_id, followee_id, accepted=False):
+            raise self._lost_race(follower_id, followee_id)
         self.db.flush()
 
     def get_follow_requests(
@@ -115,3 +148,27 @@ class FollowService:
         if not follow:
             raise FollowNotFound()
         return follow
+
+    def _delete_follow(
+        self, follower_id: int, followee_id: int, accepted: bool
+    ) -> bool:
+        """
+        Delete the follow if it is still in the accepted state given; False
+        when a concurrent request changed or deleted it first.
+        """
+        deleted = self.db.execute(
+            delete(Follow)
+            .where(
+                Follow.follower_id == follower_id,
+                Follow.followee_id == followee_id,
+                Follow.accepted.is_(accepted),
+            )
+            .returning(Follow.follower_id)
+            .execution_options(synchronize_session="fetch")
+        ).first()
+        return deleted is not None
+
+    def _lost_race(self, follower_id: int, followee_id: int) -> Exception:
+        """The error for a pending request a concurrent request got to first."""
+        follow = self.db.get(Follow, (follower_id, followee_id), populate_existing=True)
+        return FollowAlreadyAccepted() if follow else FollowNotFound()
@@ -0,0 +1,223 @@
+from sqlalchemy import case, func, insert, or_, select, update
+from sqlalchemy.orm import Session
+
+from app.core.cache.service_cache import post_tag, service_cache, user_tag
+from app.core.enums import ReactionType
+from app.db.models.comment import Comment
+from app.db.models.follow import Follow
+from app.db.models.post import Post
+from app.db.models.post_counters import PostCounters
+from app.db.models.reaction import Reaction
+from app.db.models.user import User
+from app.services.helpers.subqueries.post_subqueries import PostSubqueries
+from app.services.helpers.subqueries.user_subqueries import UserSubqueries
+
+# Bulk updates below touch rows the session may not hold; skip syncing them
+NO_SYNC = {"synchronize_session": False}
+
+
+class CounterHelper:
+    """
+    Keeps the denormalized counters in step with the rows they count.
+    Every adjustment is a relative UPDATE issued in the caller's transaction,
+    so concurrent writers never overwrite each other's increments, and
+    invalidates the cached service results that show the counter.
+    Each adjustment also bumps the row's version, which ETags are built from.
+    """
+
+    def __init__(self, db: Session):
+        self.db = db
+
+    def adjust_posts_count(self, user_id: int, delta: int) -> None:
+        """Add delta to a user's posts_count."""
+        self.db.execute(
+            update(User)
+            .where(User.id == user_id)
+            .values(posts_count=User.posts_count + delta, version=User.version + 1)
+        )
+        service_cache.invalidate_on_commit(self.db, user_tag(user_id))
+
+    def adjust_follow_counts(
+        self, follower_id: int, followee_id: int, delta: int
+    ) -> None:
+        """Add delta to the follower's following_count and followee's followers_count."""
+        self.db.execute(
+            update(User)
+            .where(User.id.in_([follower_id, followee_id]))
+            .values(
+                following_count=User.following_count
+                + case((User.id == follower_id, delta), else_=0),
+                followers_count=User.followers_count
+                + case((User.id == followee_id, delta), else_=0),
+                version=User.version + 1,
+            )
+        )
+        service_cache.invalidate_on_commit(
+            self.db, user_tag(follower_id), user_tag(followee_id)
+        )
+
+    def adjust_comments_count(self, post_id: int, delta: int) -> None:
+        """Add delta to a post's comments_count."""
+        self.db.execute(
+            update(PostCounters)
+            .where(PostCounters.post_id == post_id)
+            .values(
+                comments_count=PostCounters.comments_count + delta,
+                version=PostCounters.version + 1,
+            )
+        )
+        service_cache.invalidate_on_commit(self.db, post_tag(post_id))
+
+    def adjust_reaction_count(
+        self, post_id: int, reaction_type: ReactionType, delta: int
+    ) -> None:
+        """Add delta to a post's counter for reaction_type."""
+        column = PostCounters.reaction_column(reaction_type)
+        self.db.execute(
+            update(PostCounters)
+            .where(PostCounters.post_id == post_id)
+            .values(
+                {column: column + delta, PostCounters.version: PostCounters.version + 1}
+            )
+        )
+        service_cache.invalidate_on_commit(self.db, post_tag(post_id))
+
+    def bump_post_version(self, post_id: int) -> None:
+        """Mark post_id changed for edits that adjust no counter (post or comment)."""
+        self.db.execute(
+            update(PostCounters)
+            .where(PostCounters.post_id == post_id)
+            .values(version=PostCounters.version + 1)
+        )
+
+    def release_user(self, user_id: int) -> None:
+        """
+        Decrement the counters user_id contributes to other rows before the
+        user (and, by cascade, its follows, comments and reactions) is deleted.
+        """
+        accepted = Follow.accepted.is_(True)
+        followees = select(Follow.followee_id).where(
+            Follow.follower_id == user_id, accepted
+        )
+        followers = select(Follow.follower_id).where(
+            Follow.followee_id == user_id, accepted
+        )
+        users = self.db.scalars(
+            update(User)
+            .where(User.id.in_(followees))
+            .values(followers_count=User.followers_count - 1, version=User.version + 1)
+            .returning(User.id),
+            execution_options=NO_SYNC,
+        ).all()
+        users += self.db.scalars(
+            update(User)
+            .where(User.id.in_(followers))
+            .values(following_count=User.following_count - 1, version=User.version + 1)
+            .returning(User.id),
+            execution_options=NO_SYNC,
+        ).all()
+
+        comments = (
+            select(Comment.post_id, func.count(Comment.id).label("n"))
+            .where(Comment.owner_id == user_id)
+            .group_by(Comment.post_id)
+            .subquery()
+        )
+        posts = self.db.scalars(
+            update(PostCounters)
+            .where(PostCounters.post_id == comments.c.post_id)
+            .values(
+                comments_count=PostCounters.comments_count - comments.c.n,
+                version=PostCounters.version + 1,
+            )
+            .returning(PostCounters.post_id),
+            execution_options=NO_SYNC,
+        ).all()
+
+        # At most one reaction per (user, post), so one row per post here
+        reactions = (
+            select(Reaction.post_id, Reaction.type)
+            .where(Reaction.user_id == user_id)
+            .subquery()
+        )
+        posts += self.db.scalars(
+            update(PostCounters)
+            .where(PostCounters.post_id == reactions.c.post_id)
+            .values(
+                {
+                    PostCounters.reaction_column(t): PostCounters.reaction_column(t)
+                    - case((reactions.c.type == t, 1), else_=0)
+                    for t in ReactionType
+                }
+                | {PostCounters.version: PostCounters.version + 1}
+            )
+            .returning(PostCounters.post_id),
+            execution_options=NO_SYNC,
+        ).all()
+
+        service_cache.invalidate_on_commit(
+            self.db, *map(user_tag, users), *map(post_tag, posts)
+        )
+
+    def reconcile_user_counters(self) -> int:
+        """Recount every user's counters from source rows; return rows fixed."""
+        posts = UserSubqueries.posts_count_subq(self.db)
+        followers = UserSubqueries.followers_count_subq(self.db)
+        following = UserSubqueries.following_count_subq(self.db)
+
+        result = self.db.execute(
+            update(User)
+            .where(
+                or_(
+                    User.posts_count != posts,
+                    User.followers_count != followers,
+                    User.following_count != following,
+                )
+            )
+            .values(
+                posts_count=posts,
+                followers_count=followers,
+                following_count=following,
+                version=User.version + 1,
+            ),
+            execution_options=NO_SYNC,
+        )
+        self.db.expire_all()
+        return result.rowcount
+
+    def reconcile_post_counters(self) -> int:
+        """
+        Create missing counters rows and recount drifted ones from source rows;
+        return the number of rows created or fixed.
+        """
+        # Read before inserting: an INSERT ... SELECT anti-joined to the table
+        # it fills rescans its own new rows when post_counters starts empty
+        missing = self.db.scalars(
+            select(Post.id).where(
+                ~select(PostCounters.post_id)
+                .where(PostCounters.post_id == Post.id)
+                .exists()
+            )
+        ).all()
+        if missing:
+            self.db.execute(
+                insert(PostCounters), [{"post_id": post_id} for post_id in missing]
+            )
+        created = len(missing)
+
+        expected = {
+            PostCounters.comments_count: PostSubqueries.comments_count_subq(self.db)
+        }
+        for reaction_type in ReactionType:
+            expected[PostCounters.reaction_column(reaction_type)] = (
+                PostSubqueries.reactions_count_subq(self.db, reaction_type)
+            )
+
+        result = self.db.execute(
+            update(PostCounters)
+            .where(or_(*(column != count for column, count in expected.items())))
+            .values({**expected, PostCounters.version: PostCounters.version + 1}),
+            execution_options=NO_SYNC,
+        )
+        self.db.expire_all()
+        return created + result.rowcount
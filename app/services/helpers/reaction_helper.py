@@ -1,30 +1,30 @@
 from typing import Dict
 
-from sqlalchemy import func
 from sqlalchemy.orm import Session
 
+from app.core.cache.service_cache import post_tag, service_cache
 from app.core.enums import ReactionType
-from app.db.models import Reaction
+from app.db.models import PostCounters
 
 
 class ReactionHelper:
     def __init__(self, db: Session):
         self.db = db
 
+    @service_cache.cached(
+        "reactions_by_type", tags=lambda reactions, post_id: [post_tag(post_id)]
+    )
     def get_reactions_by_type(self, post_id: int) -> Dict[ReactionType, int]:
         """
-        Return reactions grouped by type for a given post.
+        Return reactions grouped by type for a given post, read from its counters.
         Example output: {ReactionType.like: 10, ReactionType.heart: 2}
         """
-        reactions_by_type_rows = (
-            self.db.query(Reaction.type, func.count(Reaction.user_id).label("count"))
-            .filter(Reaction.post_id == post_id)
-            .group_by(Reaction.type)
-            .all()
-        )
-        reactions_by_type = {r.type.value: r.count for r in reactions_by_type_rows}
+        counters = self.db.get(PostCounters, post_id)
 
-        for r_type in ReactionType:
-            reactions_by_type.setdefault(r_type.value, 0)
+        if not counters:
+            return {r_type.value: 0 for r_type in ReactionType}
 
-        return reactions_by_type
+        return {
+            r_type.value: getattr(counters, PostCounters.reaction_column(r_type).key)
+            for r_type in ReactionType
+        }
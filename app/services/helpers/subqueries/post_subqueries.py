@@ -1,7 +1,9 @@
 from sqlalchemy import func
 from sqlalchemy.orm import Session
 
+from app.core.enums import ReactionType
 from app.db.models.comment import Comment
+from app.db.models.post_counters import PostCounters
 from app.db.models.reaction import Reaction
 
 
@@ -9,26 +11,25 @@ class PostSubqueries:
 
     @staticmethod
     def comments_count_subq(db: Session):
-        """Return a correlated subquery for comments count per post."""
+        """Return a correlated subquery for comments count per counters row."""
         return (
-            db.query(
-                Comment.post_id,
-                func.count(Comment.id).label("comments_count"),
-            )
-            .group_by(Comment.post_id)
-            .subquery()
+            db.query(func.count(Comment.id))
+            .filter(Comment.post_id == PostCounters.post_id)
+            .correlate(PostCounters)
+            .scalar_subquery()
         )
 
     @staticmethod
-    def reactions_count_subq(db: Session):
-        """Return a correlated subquery for reactions count per post."""
+    def reactions_count_subq(db: Session, reaction_type: ReactionType):
+        """Return a correlated subquery for reactions of one type per counters row."""
         return (
-            db.query(
-                Reaction.post_id,
-                func.count(Reaction.user_id).label("reactions_count"),
+            db.query(func.count(Reaction.user_id))
+            .filter(
+                Reaction.post_id == PostCounters.post_id,
+                Reaction.type == reaction_type,
             )
-            .group_by(Reaction.post_id)
-            .subquery()
+            .correlate(PostCounters)
+            .scalar_subquery()
         )
 
     @staticmethod
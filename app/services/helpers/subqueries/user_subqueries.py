@@ -1,5 +1,5 @@
-from sqlalchemy import func
-from sqlalchemy.orm import Session
+from sqlalchemy import exists, func, or_
+from sqlalchemy.orm import Session, aliased
 
 from app.db.models.follow import Follow
 from app.db.models.post import Post
@@ -45,15 +45,37 @@ class UserSubqueries:
         )
 
     @staticmethod
-    def is_following_subq(db: Session, current_user_id: int):
-        """Return a correlated subquery to check if current user follows this user."""
+    def is_following_subq(db: Session, current_user_id: int, followee_id=User.id):
+        """
+        Return a correlated subquery to check if current user follows this
+        user, or the user followee_id when given a plain id.
+        """
         return (
             db.query(Follow)
             .filter(
                 Follow.follower_id == current_user_id,
-                Follow.followee_id == User.id,
+                Follow.followee_id == followee_id,
                 Follow.accepted.is_(True),
             )
             .correlate(User)
             .exists()
         )
+
+    @staticmethod
+    def can_view_content(current_user_id: int, owner_id):
+        """
+        Return a predicate that is true when the current user may see content
+        owned by owner_id, a column such as Post.owner_id or User.id: the owner
+        is the current user, is public, or has accepted their follow request.
+        Usable in WHERE to filter whole sets of rows in SQL.
+        """
+        owner = aliased(User)
+        return or_(
+            owner_id == current_user_id,
+            exists().where(owner.id == owner_id, owner.is_private.is_(False)),
+            exists().where(
+                Follow.follower_id == current_user_id,
+                Follow.followee_id == owner_id,
+                Follow.accepted.is_(True),
+            ),
+        )
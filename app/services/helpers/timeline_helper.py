@@ -0,0 +1,157 @@
+from typing import Any, Sequence
+
+from sqlalchemy import delete, insert, literal, select, union_all
+from sqlalchemy.orm import Session
+
+from app.core.config import settings
+from app.db.models.follow import Follow
+from app.db.models.post import Post
+from app.db.models.timeline_entry import TimelineEntry
+from app.db.models.user import User
+from app.utils.pagination import keyset_filter, order_by_keys
+
+ENTRY_KEYS = [(TimelineEntry.created_at, True), (TimelineEntry.post_id, True)]
+POST_KEYS = [(Post.created_at, True), (Post.id, True)]
+
+
+class TimelineHelper:
+    """
+    Maintains the materialized home timelines with hybrid fan-out.
+    Posts by accounts below max_followers followers are written into every
+    accepted follower's timeline; posts by larger accounts are never copied
+    and are merged in when the timeline is read.
+    """
+
+    def __init__(
+        self,
+        db: Session,
+        max_followers: int = settings.TIMELINE_FANOUT_MAX_FOLLOWERS,
+        backfill_posts: int = settings.TIMELINE_BACKFILL_POSTS,
+    ):
+        self.db = db
+        self.max_followers = max_followers
+        self.backfill_posts = backfill_posts
+
+    def _accepted_follow(self, follower_id: Any, followee_id: Any):
+        return (
+            select(Follow.followee_id)
+            .where(
+                Follow.follower_id == follower_id,
+                Follow.followee_id == followee_id,
+                Follow.accepted.is_(True),
+            )
+            .exists()
+        )
+
+    def _insert_entries(self, rows) -> int:
+        """INSERT rows (user_id, post_id, owner_id, created_at), skipping existing ones."""
+        rows = rows.where(
+            ~select(TimelineEntry.post_id)
+            .where(
+                TimelineEntry.user_id == rows.selected_columns[0],
+                TimelineEntry.post_id == rows.selected_columns[1],
+            )
+            .exists()
+        )
+        # Counted from RETURNING: an ORM INSERT ... SELECT reports rowcount -1
+        written = self.db.scalars(
+            insert(TimelineEntry)
+            .from_select(["user_id", "post_id", "owner_id", "created_at"], rows)
+            .returning(TimelineEntry.post_id)
+        )
+        return len(written.all())
+
+    def fan_out_post(self, post_id: int) -> int:
+        """Write post_id into its owner's followers' timelines; return rows written."""
+        rows = (
+            select(Follow.follower_id, Post.id, Post.owner_id, Post.created_at)
+            .join(Post, Post.owner_id == Follow.followee_id)
+            .join(User, User.id == Post.owner_id)
+            .where(
+                Post.id == post_id,
+                Follow.accepted.is_(True),
+                User.followers_count < self.max_followers,
+            )
+        )
+        return self._insert_entries(rows)
+
+    def backfill_follow(self, follower_id: int, followee_id: int) -> int:
+        """Copy the followee's latest posts into a new follower's timeline."""
+        latest = (
+            select(Post.id, Post.owner_id, Post.created_at)
+            .join(User, User.id == Post.owner_id)
+            .where(
+                Post.owner_id == followee_id,
+                User.followers_count < self.max_followers,
+                self._accepted_follow(follower_id, followee_id),
+            )
+            .order_by(*order_by_keys(POST_KEYS))
+            .limit(self.backfill_posts)
+            .subquery()
+        )
+        rows = select(
+            literal(follower_id), latest.c.id, latest.c.owner_id, latest.c.created_at
+        )
+        return self._insert_entries(rows)
+
+    def remove_follow(self, follower_id: int, followee_id: int) -> int:
+        """Drop the followee's posts from the follower's timeline."""
+        return self.db.execute(
+            delete(TimelineEntry).where(
+                TimelineEntry.user_id == follower_id,
+                TimelineEntry.owner_id == followee_id,
+            ),
+            execution_options={"synchronize_session": False},
+        ).rowcount
+
+    def rebuild(self, user_id: int) -> int:
+        """Rematerialize user_id's timeline from its accepted follows."""
+        self.remove_all(user_id)
+        followees = self.db.scalars(
+            select(Follow.followee_id).where(
+                Follow.follower_id == user_id, Follow.accepted.is_(True)
+            )
+        ).all()
+        return sum(self.backfill_follow(user_id, followee) for followee in followees)
+
+    def remove_all(self, user_id: int) -> None:
+        self.db.execute(
+            delete(TimelineEntry).where(TimelineEntry.user_id == user_id),
+            execution_options={"synchronize_session": False},
+        )
+
+    def feed_post_ids(
+        self, user_id: int, limit: int, after: Sequence[Any] | None = None
+    ):
+        """
+        Return a SELECT of at most 2 * limit post ids: the next limit entries
+        of user_id's materialized timeline after the (created_at, id) bound,
+        plus the next limit posts of followed accounts too large to fan out.
+        Both branches are index range scans; the caller orders and trims them.
+        """
+        materialized = select(TimelineEntry.post_id.label("post_id")).where(
+            TimelineEntry.user_id == user_id,
+            # Entries can briefly outlive an unfollow written concurrently
+            self._accepted_follow(user_id, TimelineEntry.owner_id),
+        )
+        merged = (
+            select(Post.id.label("post_id"))
+            .select_from(Follow)
+            .join(User, User.id == Follow.followee_id)
+            .join(Post, Post.owner_id == Follow.followee_id)
+            .where(
+                Follow.follower_id == user_id,
+                Follow.accepted.is_(True),
+                User.followers_count >= self.max_followers,
+            )
+        )
+        if after:
+            materialized = materialized.where(keyset_filter(ENTRY_KEYS, after))
+            merged = merged.where(keyset_filter(POST_KEYS, after))
+
+        branches = [
+            materialized.order_by(*order_by_keys(ENTRY_KEYS)).limit(limit).subquery(),
+            merged.order_by(*order_by_keys(POST_KEYS)).limit(limit).subquery(),
+        ]
+        # Wrapped so each branch keeps its own ORDER BY/LIMIT on every dialect
+        return union_all(*(select(branch.c.post_id) for branch in branches))
@@ -1,3 +1,5 @@
+from typing import Dict, Iterable
+
 from sqlalchemy.orm import Session
 
 from app.api.v1.schemas.user import UserListItemOut
@@ -33,7 +35,7 @@ class UserHelper:
             self.db.query(
                 User.id,
                 User.username,
-                UserSubqueries.followers_count_subq(self.db).label("followers_count"),
+                User.followers_count,
                 UserSubqueries.is_following_subq(self.db, current_user_id).label(
                     "is_following"
                 ),
@@ -51,3 +53,34 @@ class UserHelper:
             is_following=owner_row.is_following,
             followers_count=owner_row.followers_count,
         )
+
+    def get_user_list_items_out(
+        self, user_ids: Iterable[int], current_user_id: int
+    ) -> Dict[int, UserListItemOut]:
+        """Fetch minimal user info for many users in one query, keyed by user id."""
+        user_ids = set(user_ids)
+        if not user_ids:
+            return {}
+
+        rows = (
+            self.db.query(
+                User.id,
+                User.username,
+                User.followers_count,
+                UserSubqueries.is_following_subq(self.db, current_user_id).label(
+                    "is_following"
+                ),
+            )
+            .filter(User.id.in_(user_ids))
+            .all()
+        )
+
+        return {
+            row.id: UserListItemOut(
+                id=row.id,
+                username=row.username,
+                is_following=row.is_following,
+                followers_count=row.followers_count,
+            )
+            for row in rows
+        }
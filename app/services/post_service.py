@@ -1,20 +1,32 @@
-from typing import List
+from datetime import datetime
+from typing import Optional
 
-from sqlalchemy import func
+from sqlalchemy import and_, func, select
 from sqlalchemy.orm import Session
 
 from app.api.v1.schemas.post import (
     PostCreate,
     PostCreatedOut,
     PostEdit,
-    PostListItemOut,
     PostOut,
 )
+from app.api.v1.schemas.user import UserListItemOut
+from app.core.cache.service_cache import post_tag, service_cache, user_tag
+from app.core.enums import ReactionType
 from app.core.exceptions.post import PostNotFound, PostUserNotAllowed
+from app.core.exceptions.user import UserNotAllowedToViewResource
 from app.db.models.post import Post
+from app.db.models.post_counters import PostCounters
+from app.db.models.reaction import Reaction
+from app.db.models.user import User
+from app.services.helpers.counter_helper import CounterHelper
 from app.services.helpers.reaction_helper import ReactionHelper
 from app.services.helpers.subqueries.post_subqueries import PostSubqueries
+from app.services.helpers.subqueries.user_subqueries import UserSubqueries
+from app.services.helpers.timeline_helper import TimelineHelper
 from app.services.helpers.user_helper import UserHelper
+from app.services.timeline_fanout import timeline_fanout
+from app.utils.pagination import Page, decode_cursor, paginate_query
 
 
 class PostService:
@@ -22,6 +34,8 @@ class PostService:
         self.db = db
         self.user_helper = UserHelper(db)
         self.reaction_helper = ReactionHelper(db)
+        self.counter_helper = CounterHelper(db)
+        self.timeline_helper = TimelineHelper(db)
 
     def create_post(
         self, current_user_id: int, post_create: PostCreate
@@ -29,8 +43,10 @@ class PostService:
         """Create a new post and return it."""
         new_post = Post(**post_create.model_dump(), owner_id=current_user_id)
         self.db.add(new_post)
+        self.counter_helper.adjust_posts_count(current_user_id, 1)
         self.db.flush()
         self.db.refresh(new_post)
+        timeline_fanout.submit(self.db, "fan_out_post", new_post.id)
         return new_post
 
     def get_user_posts(
@@ -39,17 +55,47 @@ class PostService:
         target_user_id: int,
         limit: int,
         offset: int,
-    ) -> List[PostListItemOut]:
-        """Get posts for a given user with pagination."""
+        cursor: Optional[str] = None,
+    ) -> Page:
+        """Get posts for a given user, newest first, with pagination."""
 
-        return (
-            self._build_post_base_query(current_user_id)
-            .filter(Post.owner_id == target_user_id)
-            .order_by(Post.created_at.desc())
-            .limit(limit)
-            .offset(offset)
-        ).all()
+        query = self._build_post_base_query(current_user_id).filter(
+            Post.owner_id == target_user_id
+        )
+        return paginate_query(
+            query,
+            [(Post.created_at, True), (Post.id, True)],
+            [datetime, int],
+            limit,
+            offset,
+            cursor,
+        )
+
+    def get_feed(
+        self, current_user_id: int, limit: int, cursor: Optional[str] = None
+    ) -> Page:
+        """
+        Get posts from the accounts current_user_id follows (accepted follows
+        only), newest first: the materialized timeline merged with the posts
+        of followed accounts too large to fan out (see TimelineHelper).
+        """
+        keys = [(Post.created_at, True), (Post.id, True)]
+        types = [datetime, int]
+        after = decode_cursor(cursor, types) if cursor else None
 
+        post_ids = self.timeline_helper.feed_post_ids(current_user_id, limit + 1, after)
+        query = self._build_post_base_query(current_user_id).filter(
+            Post.id.in_(post_ids)
+        )
+        return paginate_query(query, keys, types, limit, cursor=cursor)
+
+    @service_cache.cached(
+        "post",
+        tags=lambda post, current_user_id, post_id: [
+            post_tag(post_id),
+            user_tag(post.owner_id),
+        ],
+    )
     def get_post(self, current_user_id: int, post_id: int) -> PostOut:
         """Get a single post by ID."""
 
@@ -84,6 +130,68 @@ class PostService:
             reactions_by_type=reactions_by_type,
         )
 
+    @service_cache.cached(
+        "post_detail",
+        tags=lambda post, current_user_id, post_id: [
+            post_tag(post_id),
+            # The owner's privacy and follows decide visibility
+            user_tag(post.owner_id),
+        ],
+    )
+    def get_post_detail(self, current_user_id: int, post_id: int) -> PostOut:
+        """
+        Get a single post with its visibility check folded in: one statement
+        returns the post, the owner summary, the counters, the per-type
+        reaction breakdown and the caller's reaction.
+        Raises PostNotFound or UserNotAllowedToViewResource.
+        """
+        row = (
+            self._post_detail_query(current_user_id).filter(Post.id == post_id).first()
+        )
+
+        if not row:
+            raise PostNotFound()
+
+        if not row.can_view:
+            raise UserNotAllowedToViewResource()
+
+        return self._post_detail_out(row)
+
+    def get_posts_detail(
+        self, current_user_id: int, post_ids: list[int]
+    ) -> list[PostOut]:
+        """
+        Get many posts as get_post_detail would, in the order of post_ids, in
+        one statement regardless of their number. Visibility is a WHERE
+        clause, so posts that are missing or hidden from the caller are
+        left out rather than raised.
+        """
+        rows = (
+            self._post_detail_query(current_user_id)
+            .filter(
+                Post.id.in_(post_ids),
+                UserSubqueries.can_view_content(current_user_id, Post.owner_id),
+            )
+            .all()
+        )
+        posts = {row.id: self._post_detail_out(row) for row in rows}
+        return [posts[post_id] for post_id in post_ids if post_id in posts]
+
+    def get_post_version(self, post_id: int) -> Optional[tuple[int, int]]:
+        """
+        Return a cheap change signal for get_post_detail: the post's version,
+        bumped by edits, comments and reactions, and its owner's, bumped by
+        profile, privacy and follow changes. None when the post does not exist.
+        """
+        row = self.db.execute(
+            select(PostCounters.version, User.version)
+            .select_from(Post)
+            .join(User, User.id == Post.owner_id)
+            .join(PostCounters, PostCounters.post_id == Post.id)
+            .where(Post.id == post_id)
+        ).first()
+        return tuple(row) if row else None
+
     def update_post(
         self,
         current_user_id: int,
@@ -100,8 +208,10 @@ class PostService:
         if post_update.content is not None:
             post.content = post_update.content
 
+        self.counter_helper.bump_post_version(post_id)
         self.db.flush()
         self.db.refresh(post)
+        service_cache.invalidate_on_commit(self.db, post_tag(post_id))
         return post
 
     def delete_post(self, current_user_id: int, post_id: int) -> None:
@@ -110,12 +220,12 @@ class PostService:
         post = self._get_post_for_user(current_user_id, post_id)
 
         self.db.delete(post)
+        self.counter_helper.adjust_posts_count(current_user_id, -1)
         self.db.flush()
+        service_cache.invalidate_on_commit(self.db, post_tag(post_id))
 
     def _build_post_base_query(self, current_user_id: int):
         """Build a base query for posts."""
-        comments_count_sq = PostSubqueries.comments_count_subq(self.db)
-        reactions_count_sq = PostSubqueries.reactions_count_subq(self.db)
         user_reaction_sq = PostSubqueries.user_reaction_subq(self.db, current_user_id)
 
         query = (
@@ -125,21 +235,77 @@ class PostService:
                 Post.content,
                 Post.owner_id,
                 Post.created_at,
-                func.coalesce(comments_count_sq.c.comments_count, 0).label(
-                    "comments_count"
-                ),
-                func.coalesce(reactions_count_sq.c.reactions_count, 0).label(
+                func.coalesce(PostCounters.comments_count, 0).label("comments_count"),
+                func.coalesce(PostCounters.reactions_total(), 0).label(
                     "reactions_count"
                 ),
                 user_reaction_sq.c.user_reacted,
             )
-            .outerjoin(comments_count_sq, comments_count_sq.c.post_id == Post.id)
-            .outerjoin(reactions_count_sq, reactions_count_sq.c.post_id == Post.id)
+            .outerjoin(PostCounters, PostCounters.post_id == Post.id)
             .outerjoin(user_reaction_sq, user_reaction_sq.c.post_id == Post.id)
         )
 
         return query
 
+    def _post_detail_query(self, current_user_id: int):
+        """
+        Select a post with its owner summary, counters, per-type reactions,
+        the caller's reaction and whether the caller may view it (can_view).
+        """
+        is_following = UserSubqueries.is_following_subq(self.db, current_user_id)
+        reaction_columns = [
+            func.coalesce(PostCounters.reaction_column(r_type), 0).label(r_type.value)
+            for r_type in ReactionType
+        ]
+
+        return (
+            self.db.query(
+                Post.id,
+                Post.title,
+                Post.content,
+                Post.owner_id,
+                Post.created_at,
+                User.username.label("owner_username"),
+                User.followers_count.label("owner_followers_count"),
+                is_following.label("owner_is_following"),
+                UserSubqueries.can_view_content(current_user_id, Post.owner_id).label(
+                    "can_view"
+                ),
+                func.coalesce(PostCounters.comments_count, 0).label("comments_count"),
+                *reaction_columns,
+                Reaction.type.label("user_reacted"),
+            )
+            .join(User, User.id == Post.owner_id)
+            .outerjoin(PostCounters, PostCounters.post_id == Post.id)
+            .outerjoin(
+                Reaction,
+                and_(Reaction.post_id == Post.id, Reaction.user_id == current_user_id),
+            )
+        )
+
+    def _post_detail_out(self, row) -> PostOut:
+        reactions_by_type = {
+            r_type.value: getattr(row, r_type.value) for r_type in ReactionType
+        }
+
+        return PostOut(
+            id=row.id,
+            title=row.title,
+            content=row.content,
+            owner_id=row.owner_id,
+            created_at=row.created_at,
+            comments_count=row.comments_count,
+            reactions_count=sum(reactions_by_type.values()),
+            user_reacted=row.user_reacted,
+            owner=UserListItemOut(
+                id=row.owner_id,
+                username=row.owner_username,
+                is_following=row.owner_is_following,
+                followers_count=row.owner_followers_count,
+            ),
+            reactions_by_type=reactions_by_type,
+        )
+
     def _get_post_for_user(self, current_user_id: int, post_id: int) -> Post:
         """Fetch a post and ensure the current user is allowed to modify it."""
         post = self.db.get(Post, post_id)
@@ -1,5 +1,6 @@
-from typing import List
+from typing import Optional
 
+from sqlalchemy import delete, update
 from sqlalchemy.orm import Session
 
 from app.api.v1.schemas.reaction import (
@@ -13,13 +14,16 @@ from app.core.exceptions.reaction import (
     ReactionNotFound,
 )
 from app.db.models.reaction import Reaction
+from app.services.helpers.counter_helper import CounterHelper
 from app.services.helpers.user_helper import UserHelper
+from app.utils.pagination import Page, paginate_query
 
 
 class ReactionService:
     def __init__(self, db: Session):
         self.db = db
         self.user_helper = UserHelper(db)
+        self.counter_helper = CounterHelper(db)
 
     def add_post_reaction(
         self, current_user_id: int, post_id: int, reaction: ReactionCreate
@@ -35,6 +39,7 @@ class ReactionService:
         )
 
         self.db.add(new_reaction)
+        self.counter_helper.adjust_reaction_count(post_id, reaction.type, 1)
         self.db.flush()
         self.db.refresh(new_reaction)
 
@@ -46,49 +51,68 @@ class ReactionService:
         post_id: int,
         limit: int = 10,
         offset: int = 0,
-    ) -> List[ReactionOut]:
+        cursor: Optional[str] = None,
+    ) -> Page:
         """Get reactions for a given post with minimal owner info and pagination."""
 
-        reactions = (
-            self.db.query(Reaction)
-            .filter(Reaction.post_id == post_id)
-            .order_by(Reaction.user_id)
-            .limit(limit)
-            .offset(offset)
-            .all()
+        # A user reacts at most once per post, so user_id alone is a unique key
+        reactions = paginate_query(
+            self.db.query(Reaction).filter(Reaction.post_id == post_id),
+            [(Reaction.user_id, False)],
+            [int],
+            limit,
+            offset,
+            cursor,
         )
 
-        result: List[ReactionOut] = []
-
-        for reaction in reactions:
-            owner_out = self.user_helper.get_user_list_item_out(
-                user_id=reaction.user_id,
-                current_user_id=current_user_id,
-            )
+        owners = self.user_helper.get_user_list_items_out(
+            (reaction.user_id for reaction in reactions), current_user_id
+        )
 
-            result.append(
+        return Page(
+            (
                 ReactionOut(
                     user_id=reaction.user_id,
                     post_id=reaction.post_id,
                     type=reaction.type,
-                    owner=owner_out,
+                    owner=owners[reaction.user_id],
                 )
-            )
-
-        return result
+                for reaction in reactions
+            ),
+            next_cursor=reactions.next_cursor,
+        )
 
     def update_post_reaction(
         self, current_user_id: int, post_id: int, reaction_update: ReactionEdit
     ) -> ReactionCreatedOut:
         """Update an existing reaction on a post and return it."""
         reaction = self._get_reaction(current_user_id, post_id)
-
-        # If the reaction type is the same, no update is needed
-        if reaction.type == reaction_update.type:
-            return reaction
-
-        if reaction_update.type is not None:
-            reaction.type = reaction_update.type
+        new_type = reaction_update.type
+
+        # Nothing to update when the type is unchanged
+        while new_type is not None and reaction.type != new_type:
+            old_type = reaction.type
+            # Conditional on the type read, so each switch that lands moves
+            # exactly one count even when requests race
+            switched = self.db.execute(
+                update(Reaction)
+                .where(
+                    Reaction.user_id == current_user_id,
+                    Reaction.post_id == post_id,
+                    Reaction.type == old_type,
+                )
+                .values(type=new_type)
+                .returning(Reaction.user_id)
+                .execution_options(synchronize_session="fetch")
+            ).first()
+            if switched is not None:
+                self.counter_helper.adjust_reaction_count(post_id, old_type, -1)
+                self.counter_helper.adjust_reaction_count(post_id, new_type, 1)
+                break
+            # A concurrent request switched or deleted it first; start over
+            # from what it left
+            self.db.expire(reaction)
+            reaction = self._get_reaction(current_user_id, post_id)
 
         self.db.flush()
         self.db.refresh(reaction)
@@ -97,9 +121,19 @@ class ReactionService:
 
     def delete_post_reaction(self, current_user_id: int, post_id: int) -> None:
         """Delete a reaction from a post."""
-        reaction = self._get_reaction(current_user_id, post_id)
+        # Only the request whose DELETE removed the row adjusts the counters,
+        # and by the type it actually had
+        deleted = self.db.execute(
+            delete(Reaction)
+            .where(Reaction.user_id == current_user_id, Reaction.post_id == post_id)
+            .returning(Reaction.type)
+            .execution_options(synchronize_session="fetch")
+        ).first()
+
+        if deleted is None:
+            raise ReactionNotFound()
 
-        self.db.delete(reaction)
+        self.counter_helper.adjust_reaction_count(post_id, deleted.type, -1)
         self.db.flush()
 
     def _get_reaction(self, current_user_id: int, post_id: int) -> Reaction:
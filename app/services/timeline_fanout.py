@@ -0,0 +1,140 @@
+import queue
+import threading
+import time
+from collections import deque
+from typing import Any, Callable
+
+from sqlalchemy import event
+from sqlalchemy.orm import Session
+
+from app.core.config import settings
+from app.core.logger import logger
+from app.db.database import SessionLocal
+from app.services.helpers.timeline_helper import TimelineHelper
+from app.utils.stats import SAMPLE_SIZE, percentile
+
+_STOP = object()
+
+
+class TimelineFanout:
+    """
+    Runs TimelineHelper jobs (fan_out_post, backfill_follow, ...) on background
+    threads so writes that touch thousands of timelines do not add to request
+    latency. Jobs are queued only once the request transaction commits, and
+    each runs in its own session and transaction.
+    workers=0 runs jobs inline in the request transaction instead.
+    A full queue drops the job and counts it; scripts/rebuild_timelines.py
+    repairs the timelines it would have written.
+    """
+
+    def __init__(
+        self,
+        workers: int,
+        queue_size: int,
+        session_factory: Callable[[], Session] = SessionLocal,
+    ):
+        self.workers = workers
+        self.session_factory = session_factory
+        self._queue: queue.Queue = queue.Queue(maxsize=queue_size)
+        self._lock = threading.Lock()
+        self._threads: list[threading.Thread] = []
+        self.completed = 0
+        self.failed = 0
+        self.dropped = 0
+        self.rows_written = 0
+        self._job_times: deque[float] = deque(maxlen=SAMPLE_SIZE)
+
+    def submit(self, db: Session, job: str, *args: Any) -> None:
+        """Run TimelineHelper.job(*args) once db's transaction commits."""
+        if self.workers <= 0:
+            rows = getattr(TimelineHelper(db), job)(*args)
+            with self._lock:
+                self.rows_written += rows or 0
+            return
+        event.listen(db, "after_commit", lambda _: self._enqueue(job, args), once=True)
+
+    def _enqueue(self, job: str, args: tuple) -> None:
+        self._start()
+        try:
+            self._queue.put_nowait((job, args))
+        except queue.Full:
+            with self._lock:
+                self.dropped += 1
+            logger.warning(f"Timeline fan-out queue full, dropped {job}{args}")
+
+    def _start(self) -> None:
+        with self._lock:
+            if self._threads:
+                return
+            for i in range(self.workers):
+                thread = threading.Thread(
+                    target=self._run, name=f"timeline-fanout-{i}", daemon=True
+                )
+                thread.start()
+                self._threads.append(thread)
+
+    def _run(self) -> None:
+        while True:
+            item = self._queue.get()
+            try:
+                if item is _STOP:
+                    return
+                self._execute(*item)
+            finally:
+                self._queue.task_done()
+
+    def _execute(self, job: str, args: tuple) -> None:
+        start = time.perf_counter()
+        try:
+            with self.session_factory() as db:
+                rows = getattr(TimelineHelper(db), job)(*args)
+                db.commit()
+        except Exception:
+            # Counted and logged: letting it escape would kill this worker
+            # thread and strand every job queued behind it
+            with self._lock:
+                self.failed += 1
+            logger.exception(f"Timeline fan-out job {job}{args} failed")
+            return
+        with self._lock:
+            self.completed += 1
+            self.rows_written += rows or 0
+            self._job_times.append(time.perf_counter() - start)
+
+    def join(self) -> None:
+        """Block until every queued job has run."""
+        self._queue.join()
+
+    def shutdown(self) -> None:
+        """Finish queued jobs, then stop the threads."""
+        with self._lock:
+            threads, self._threads = self._threads, []
+        for _ in threads:
+            self._queue.put(_STOP)
+        for thread in threads:
+            thread.join()
+
+    def status(self) -> dict:
+        with self._lock:
+            times = list(self._job_times)
+            return {
+                "workers": self.workers,
+                "queued": self._queue.qsize(),
+                "completed": self.completed,
+                "failed": self.failed,
+                "dropped": self.dropped,
+                "rows_written": self.rows_written,
+                "job_ms": {
+                    "avg": sum(times) / len(times) * 1000 if times else 0.0,
+                    "p50": percentile(times, 50) * 1000,
+                    "p99": percentile(times, 99) * 1000,
+                    "max": max(times, default=0.0) * 1000,
+                },
+            }
+
+
+# Per worker process; threads start with the first committed job
+timeline_fanout = TimelineFanout(
+    workers=settings.TIMELINE_FANOUT_WORKERS,
+    queue_size=settings.TIMELINE_FANOUT_QUEUE_SIZE,
+)
@@ -1,6 +1,7 @@
-from typing import List, Optional
+from decimal import Decimal
+from typing import Optional
 
-from sqlalchemy import case, func
+from sqlalchemy import Numeric, case, cast, func, select
 from sqlalchemy.orm import Session
 
 from app.api.v1.schemas.user import (
@@ -8,10 +9,11 @@ from app.api.v1.schemas.user import (
     UserCreate,
     UserCreatedOut,
     UserEdit,
-    UserListItemOut,
     UserPublicOut,
     UserSettingsOut,
 )
+from app.core.cache.backends import MISSING
+from app.core.cache.service_cache import service_cache, user_tag
 from app.core.exceptions.user import (
     UserEmailAlreadyExists,
     UserInvalidPassword,
@@ -20,16 +22,32 @@ from app.core.exceptions.user import (
     UserPasswordUnchanged,
 )
 from app.core.security.password import hash_password, verify_password
+from app.core.security.principal import invalidate_principal
 from app.db.models import User
 from app.db.models.follow import Follow
+from app.services.helpers.counter_helper import CounterHelper
 from app.services.helpers.subqueries.user_subqueries import UserSubqueries
 from app.services.helpers.user_helper import UserHelper
+from app.utils.pagination import Page, paginate_query
+from app.utils.sql import escape_like
+
+# The viewer-independent columns of UserPublicOut, cached as one profile
+PROFILE_FIELDS = (
+    "id",
+    "username",
+    "bio",
+    "is_private",
+    "posts_count",
+    "followers_count",
+    "following_count",
+)
 
 
 class UserService:
     def __init__(self, db: Session):
         self.db = db
         self.user_helper = UserHelper(db)
+        self.counter_helper = CounterHelper(db)
 
     def create_user(self, user_create: UserCreate) -> UserCreatedOut:
         """Create a new user and hash password; raises UserEmailAlreadyExists on duplicate email."""
@@ -62,11 +80,20 @@ class UserService:
         return self.user_helper.get_user_by_id(user_id)
 
     def search_users(
-        self, current_user_id: int, query: str, limit: int = 10
-    ) -> List[UserListItemOut]:
-        """Search users by username with pagination."""
+        self,
+        current_user_id: int,
+        query: str,
+        limit: int = 10,
+        offset: int = 0,
+        cursor: Optional[str] = None,
+    ) -> Page:
+        """Search users by username, best matches first, with pagination."""
         return self._query_users(
-            current_user_id=current_user_id, search=query, limit=limit
+            current_user_id=current_user_id,
+            search=query,
+            limit=limit,
+            offset=offset,
+            cursor=cursor,
         )
 
     def get_user_by_username(
@@ -75,6 +102,37 @@ class UserService:
         """Get user by username; raises UserNotFound if not found."""
         return self._get_public_user(current_user_id=current_user_id, username=username)
 
+    def get_users_by_usernames(
+        self, current_user_id: int, usernames: list[str]
+    ) -> list[UserPublicOut]:
+        """
+        Get many public profiles in one statement regardless of their number,
+        in the order of usernames. Unknown usernames are left out.
+        """
+        rows = self.db.query(
+            *(getattr(User, field) for field in PROFILE_FIELDS),
+            UserSubqueries.is_following_subq(self.db, current_user_id).label(
+                "is_following"
+            ),
+        ).filter(User.username.in_(usernames))
+
+        users = {}
+        for row in rows:
+            user_dict = dict(row._mapping)
+            # Hide is_following for current user
+            if user_dict["id"] == current_user_id:
+                user_dict["is_following"] = None
+            users[row.username] = UserPublicOut(**user_dict)
+        return [users[username] for username in usernames if username in users]
+
+    def get_profile_version(self, username: str) -> Optional[int]:
+        """
+        Return a cheap change signal for get_user_by_username: the user's
+        version, bumped by profile edits, new posts and follows in either
+        direction. None when the user does not exist.
+        """
+        return self.db.scalar(select(User.version).where(User.username == username))
+
     def get_user_followers(
         self,
         current_user_id: int,
@@ -82,7 +140,8 @@ class UserService:
         limit: int = 10,
         offset: int = 0,
         search: Optional[str] = "",
-    ) -> List[UserListItemOut]:
+        cursor: Optional[str] = None,
+    ) -> Page:
         """Get followers of the target user."""
         return self._query_users(
             current_user_id=current_user_id,
@@ -95,6 +154,7 @@ class UserService:
             ],
             limit=limit,
             offset=offset,
+            cursor=cursor,
         )
 
     def get_user_following(
@@ -104,7 +164,8 @@ class UserService:
         limit: int = 10,
         offset: int = 0,
         search: Optional[str] = "",
-    ) -> List[UserListItemOut]:
+        cursor: Optional[str] = None,
+    ) -> Page:
         """Get users that the target user is following."""
         return self._query_users(
             current_user_id=current_user_id,
@@ -117,6 +178,7 @@ class UserService:
             ],
             limit=limit,
             offset=offset,
+            cursor=cursor,
         )
 
     def update_user(self, user_id: int, data: UserEdit) -> User:
@@ -135,7 +197,10 @@ class UserService:
         if data.is_private is not None:
             user.is_private = data.is_private
 
+        user.version = User.version + 1
         self.db.flush()
+        invalidate_principal(self.db, user_id)
+        service_cache.invalidate_on_commit(self.db, user_tag(user_id))
         return user
 
     def change_password(self, user_id: int, data: UserChangePassword) -> None:
@@ -150,28 +215,45 @@ class UserService:
 
         user.hashed_password = hash_password(data.new_password)
         self.db.flush()
+        invalidate_principal(self.db, user_id)
 
     def delete_user(self, user_id: int) -> None:
         """Delete user"""
         user = self.user_helper.get_user_by_id(user_id)
+        self.counter_helper.release_user(user_id)
         self.db.delete(user)
         self.db.flush()
+        invalidate_principal(self.db, user_id)
+        service_cache.invalidate_on_commit(self.db, user_tag(user_id))
 
     def _get_public_user(
         self,
         current_user_id: int,
         username: str,
     ) -> UserPublicOut:
-        """Get public user info by user_id or username."""
+        """
+        Get public user info by username. The viewer-independent part comes
+        from service_cache when possible, leaving only is_following to query.
+        """
+        profile = service_cache.get("profile", username)
+        if profile is MISSING:
+            return self._load_public_user(current_user_id, username)
+
+        is_following = None
+        # Hide is_following for current user
+        if profile["id"] != current_user_id:
+            is_following = self.db.query(
+                UserSubqueries.is_following_subq(
+                    self.db, current_user_id, profile["id"]
+                )
+            ).scalar()
+        return UserPublicOut(**profile, is_following=is_following)
+
+    def _load_public_user(self, current_user_id: int, username: str) -> UserPublicOut:
+        """Query the whole profile in one statement and cache its shared part."""
         user = (
             self.db.query(
-                User.id,
-                User.username,
-                User.bio,
-                User.is_private,
-                UserSubqueries.posts_count_subq(self.db).label("posts_count"),
-                UserSubqueries.followers_count_subq(self.db).label("followers_count"),
-                UserSubqueries.following_count_subq(self.db).label("following_count"),
+                *(getattr(User, field) for field in PROFILE_FIELDS),
                 UserSubqueries.is_following_subq(self.db, current_user_id).label(
                     "is_following"
                 ),
@@ -183,8 +265,15 @@ class UserService:
         if not user:
             raise UserNotFound()
 
-        # Hide is_following for current user
         user_dict = dict(user._mapping)
+        service_cache.set(
+            "profile",
+            username,
+            {field: user_dict[field] for field in PROFILE_FIELDS},
+            tags=[user_tag(user_dict["id"])],
+        )
+
+        # Hide is_following for current user
         if user_dict["id"] == current_user_id:
             user_dict["is_following"] = None
 
@@ -199,22 +288,50 @@ class UserService:
         join_filters=None,
         limit: int = 10,
         offset: int = 0,
-    ) -> List[UserListItemOut]:
+        cursor: Optional[str] = None,
+    ) -> Page:
         """
         Centralized user query logic.
         - join_model: SQLAlchemy model to join (e.g., Follow)
         - join_condition: the ON condition for join
         - join_filters: additional filters after join
+        - cursor: opaque keyset cursor from a previous page; overrides offset
+        Searches match substrings of the lowercased username (served by the
+        pg_trgm index) and rank exact, then prefix, then by trigram similarity.
         """
         q = (search or "").strip().lower()
+        lowered = func.lower(User.username)
+
+        # (sort key, descending) pairs; the cursor stores one value per key
+        sort_keys = [(User.username, False), (User.id, False)]
+        key_names = ["username", "id"]
+        key_types = [str, int]
+        rank_columns = []
+
+        if q:
+            escaped = escape_like(q)
+            match_rank = case(
+                (lowered == q, 0),
+                (lowered.like(f"{escaped}%", escape="\\"), 1),
+                else_=2,
+            )
+            similarity = func.round(cast(func.similarity(lowered, q), Numeric), 4)
+            sort_keys = [(match_rank, False), (similarity, True)] + sort_keys
+            key_names = ["match_rank", "similarity"] + key_names
+            key_types = [int, Decimal] + key_types
+            rank_columns = [
+                match_rank.label("match_rank"),
+                similarity.label("similarity"),
+            ]
 
         query = self.db.query(
             User.id,
             User.username,
-            UserSubqueries.followers_count_subq(self.db).label("followers_count"),
+            User.followers_count,
             UserSubqueries.is_following_subq(self.db, current_user_id).label(
                 "is_following"
             ),
+            *rank_columns,
         )
 
         if join_model:
@@ -223,15 +340,8 @@ class UserService:
             query = query.filter(*join_filters)
 
         if q:
-            query = query.filter(User.username.ilike(f"%{q}%"))
+            query = query.filter(lowered.like(f"%{escaped}%", escape="\\"))
 
-        query = query.order_by(
-            case(
-                (func.lower(User.username) == q, 0),
-                (func.lower(User.username).like(f"{q}%"), 1),
-                else_=2,
-            ),
-            User.username.asc(),
+        return paginate_query(
+            query, sort_keys, key_types, limit, offset, cursor, names=key_names
         )
-
-        return query.limit(limit).offset(offset).all()
@@ -0,0 +1,71 @@
+from typing import Callable, Iterator, TypeVar
+
+from app.core.exceptions.batch import (
+    BatchBaseException,
+    BatchEmpty,
+    BatchInvalidItem,
+    BatchTooLarge,
+)
+
+T = TypeVar("T")
+
+# Ids are int4 columns; larger values would fail in Postgres with a DataError
+MAX_ID = 2**31 - 1
+
+
+def positive_id(raw: str) -> int:
+    """Cast a batch item to an id that fits an int4 primary key."""
+    value = int(raw)
+    if not 1 <= value <= MAX_ID:
+        raise ValueError(raw)
+    return value
+
+
+def parse_batch(
+    values: list[str], field: str, max_items: int, cast: Callable[[str], T] = str
+) -> list[T]:
+    """
+    Parse a batch query parameter given repeated (?ids=1&ids=2), comma
+    separated (?ids=1,2) or both. Duplicates are dropped keeping the first
+    occurrence, so the result is in request order. Items are counted as they
+    are split, duplicates included, so an oversized batch stops parsing at
+    the first item over max_items. Raises BatchEmpty, BatchTooLarge or
+    BatchInvalidItem with field set to the parameter name.
+    """
+    items: dict[T, None] = {}
+    count = 0
+    for raw in _split(values):
+        raw = raw.strip()
+        if not raw:
+            continue
+        count += 1
+        if count > max_items:
+            raise _for_field(
+                BatchTooLarge(f"At most {max_items} items can be requested at once."),
+                field,
+            )
+        try:
+            items[cast(raw)] = None
+        except ValueError:
+            raise _for_field(
+                BatchInvalidItem(f"{raw[:32]!r} is not a valid item."), field
+            ) from None
+
+    if not items:
+        raise _for_field(BatchEmpty(), field)
+    return list(items)
+
+
+def _split(values: list[str]) -> Iterator[str]:
+    """Yield the comma separated pieces of values lazily, unlike str.split."""
+    for value in values:
+        start = 0
+        while (end := value.find(",", start)) >= 0:
+            yield value[start:end]
+            start = end + 1
+        yield value[start:]
+
+
+def _for_field(exc: BatchBaseException, field: str) -> BatchBaseException:
+    exc.field = field
+    return exc
@@ -0,0 +1,45 @@
+import hashlib
+from typing import Any
+
+from fastapi import Request, Response, status
+
+# Responses depend on the caller, so shared caches must not store them, and
+# private caches must revalidate them before reuse
+CACHE_CONTROL = "private, no-cache"
+
+
+def make_etag(*parts: Any) -> str:
+    """
+    Build a weak ETag from the values a response is derived from (endpoint,
+    viewer, version counters, query parameters). Weak because the same
+    representation may be sent with different content encodings.
+    """
+    digest = hashlib.sha256(repr(parts).encode()).hexdigest()[:32]
+    return f'W/"{digest}"'
+
+
+def etag_matches(if_none_match: str | None, etag: str) -> bool:
+    """Weak comparison of an If-None-Match header against etag (RFC 9110 13.1.2)."""
+    if not if_none_match:
+        return False
+    if if_none_match.strip() == "*":
+        return True
+    opaque = etag.removeprefix("W/")
+    return any(
+        candidate.strip().removeprefix("W/") == opaque
+        for candidate in if_none_match.split(",")
+    )
+
+
+def check_not_modified(
+    request: Request, response: Response, etag: str
+) -> Response | None:
+    """
+    Return a bodiless 304 when the request already holds etag; otherwise
+    tag response with it and return None so the caller builds the body.
+    """
+    headers = {"ETag": etag, "Cache-Control": CACHE_CONTROL}
+    if etag_matches(request.headers.get("if-none-match"), etag):
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+    response.headers.update(headers)
+    return None
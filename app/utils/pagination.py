@@ -0,0 +1,133 @@
+import base64
+import json
+from datetime import datetime
+from decimal import Decimal, InvalidOperation
+from typing import Any, Iterable, Sequence
+
+from fastapi import Response
+from sqlalchemy import and_, or_, tuple_
+from sqlalchemy.orm import Query
+from sqlalchemy.sql import ColumnElement
+
+from app.core.exceptions.pagination import PaginationInvalidCursor
+
+NEXT_CURSOR_HEADER = "X-Next-Cursor"
+HAS_MORE_HEADER = "X-Has-More"
+
+# (sort expression, descending)
+SortKey = tuple[ColumnElement, bool]
+
+
+class Page(list):
+    """A list of results plus the opaque cursor of the following page."""
+
+    def __init__(self, items: Iterable = (), next_cursor: str | None = None):
+        super().__init__(items)
+        self.next_cursor = next_cursor
+
+    @property
+    def has_more(self) -> bool:
+        return self.next_cursor is not None
+
+
+def encode_cursor(values: Sequence[Any]) -> str:
+    """Encode sort key values into an opaque, URL-safe cursor."""
+    payload = json.dumps(
+        [v.isoformat() if isinstance(v, datetime) else v for v in values],
+        default=str,
+        separators=(",", ":"),
+    )
+    return base64.urlsafe_b64encode(payload.encode()).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str, types: Sequence[type]) -> list:
+    """Decode a cursor into values coerced to types; raises PaginationInvalidCursor."""
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        values = json.loads(base64.urlsafe_b64decode(padded.encode()))
+        if not isinstance(values, list) or len(values) != len(types):
+            raise PaginationInvalidCursor()
+        return [_coerce(value, type_) for value, type_ in zip(values, types)]
+    except (ValueError, TypeError, InvalidOperation):
+        raise PaginationInvalidCursor()
+
+
+def _coerce(value: Any, type_: type) -> Any:
+    if type_ is datetime:
+        return datetime.fromisoformat(value)
+    if type_ is Decimal:
+        return Decimal(str(value))
+    if type_ is int and isinstance(value, bool):
+        raise TypeError("bool is not a valid integer key")
+    if not isinstance(value, type_):
+        raise TypeError(f"expected {type_.__name__}")
+    return value
+
+
+def order_by_keys(keys: Sequence[SortKey]) -> list:
+    return [expr.desc() if desc else expr.asc() for expr, desc in keys]
+
+
+def keyset_filter(keys: Sequence[SortKey], values: Sequence[Any]):
+    """
+    Return a predicate selecting rows strictly after values in keys order.
+    When every key sorts the same way this is a row comparison such as
+    (k1, k2) < (v1, v2), which Postgres serves with one index range scan.
+    Mixed ASC/DESC orderings expand to (k1 > v1) OR (k1 = v1 AND k2 > v2) ...
+    """
+    directions = {desc for _, desc in keys}
+    if len(keys) > 1 and len(directions) == 1:
+        row = tuple_(*(expr for expr, _ in keys))
+        bound = tuple_(*values)
+        return row < bound if directions.pop() else row > bound
+
+    clauses = []
+    for i, (expr, desc) in enumerate(keys):
+        equal_prefix = [keys[j][0] == values[j] for j in range(i)]
+        after = expr < values[i] if desc else expr > values[i]
+        clauses.append(and_(*equal_prefix, after))
+    return or_(*clauses)
+
+
+def paginate(rows: Sequence, limit: int, cursor_values) -> Page:
+    """
+    Build a Page from up to limit + 1 fetched rows.
+    cursor_values(row) returns the sort key values of a row.
+    """
+    has_more = len(rows) > limit
+    items = rows[:limit]
+    next_cursor = encode_cursor(cursor_values(items[-1])) if has_more else None
+    return Page(items, next_cursor)
+
+
+def paginate_query(
+    query: Query,
+    keys: Sequence[SortKey],
+    types: Sequence[type],
+    limit: int,
+    offset: int = 0,
+    cursor: str | None = None,
+    names: Sequence[str] | None = None,
+) -> Page:
+    """
+    Order query by keys, continue after cursor (or skip offset rows without
+    one), and return a Page of at most limit rows. One extra row is fetched
+    to tell whether another page exists, so no COUNT query is needed.
+    names are the row attributes holding each key; defaults to the key names.
+    """
+    names = names or [expr.key for expr, _ in keys]
+    query = query.order_by(*order_by_keys(keys))
+    if cursor:
+        query = query.filter(keyset_filter(keys, decode_cursor(cursor, types)))
+    else:
+        query = query.offset(offset)
+
+    rows = query.limit(limit + 1).all()
+    return paginate(rows, limit, lambda row: [getattr(row, name) for name in names])
+
+
+def set_page_headers(response: Response, page: Page) -> None:
+    """Expose the next cursor of a page through response headers."""
+    response.headers[HAS_MORE_HEADER] = "true" if page.has_more else "false"
+    if page.next_cursor:
+        response.headers[NEXT_CURSOR_HEADER] = page.next_cursor
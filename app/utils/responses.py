@@ -0,0 +1,37 @@
+import functools
+from typing import Any, Iterable
+
+from fastapi import Response
+from pydantic import BaseModel, TypeAdapter
+
+from app.utils.pagination import Page, set_page_headers
+
+
+@functools.cache
+def _list_adapter(model: type[BaseModel]) -> TypeAdapter:
+    return TypeAdapter(list[model])
+
+
+def list_response(
+    model: type[BaseModel], items: Iterable[Any], response: Response | None = None
+) -> Response:
+    """
+    Render a list endpoint's body in one pydantic-core pass, in place of the
+    response_model path (validate, serialize to Python objects, json.dumps).
+    Items that are already model instances pass through without being
+    revalidated; ORM rows are validated from their attributes once.
+    For a Page the pagination headers are set, and headers the route already
+    set on its injected response (ETag) are kept.
+    """
+    adapter = _list_adapter(model)
+    body = adapter.dump_json(adapter.validate_python(list(items), from_attributes=True))
+    fast = Response(body, media_type="application/json")
+    if isinstance(items, Page):
+        set_page_headers(fast, items)
+    if response is not None:
+        fast.raw_headers.extend(
+            (name, value)
+            for name, value in response.headers.raw
+            if name != b"content-length"
+        )
+    return fast
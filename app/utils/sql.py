@@ -0,0 +1,7 @@
+def escape_like(value: str, escape: str = "\\") -> str:
+    """Escape LIKE wildcards in value so it matches literally."""
+    return (
+        value.replace(escape, escape * 2)
+        .replace("%", f"{escape}%")
+        .replace("_", f"{escape}_")
+    )
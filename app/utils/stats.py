@@ -0,0 +1,10 @@
+# Number of recent samples kept for latency percentiles
+SAMPLE_SIZE = 1000
+
+
+def percentile(samples: list[float], pct: float) -> float:
+    if not samples:
+        return 0.0
+    ordered = sorted(samples)
+    index = min(len(ordered) - 1, round(pct / 100 * (len(ordered) - 1)))
+    return ordered[index]
@@ -0,0 +1,134 @@
+"""
+Compare request throughput of the sync (threadpool) and async database modes.
+
+Starts one uvicorn server per mode against the database configured in .env,
+signs up a benchmark user and hammers GET /api/v1/users/{username} with many
+concurrent clients.
+
+Usage:
+    uv run python -m benchmarks.async_db_benchmark --concurrency 200 --duration 15
+"""
+
+import argparse
+import asyncio
+import os
+import statistics
+import subprocess
+import sys
+import time
+import uuid
+
+import httpx
+
+API = "/api/v1"
+PASSWORD = "Bench1Pass!"
+
+
+async def wait_until_up(base_url: str, timeout: float = 30.0) -> None:
+    deadline = time.monotonic() + timeout
+    async with httpx.AsyncClient(base_url=base_url) as client:
+        while time.monotonic() < deadline:
+            try:
+                if (await client.get(f"{API}/health")).status_code == 200:
+                    return
+            except httpx.TransportError:
+                pass
+            await asyncio.sleep(0.2)
+    raise RuntimeError(f"Server at {base_url} did not start")
+
+
+async def login(client: httpx.AsyncClient) -> str:
+    """Create a throwaway user and return its username with auth headers set."""
+    username = f"bench{uuid.uuid4().hex[:12]}"
+    email = f"{username}@bench.local"
+    await client.post(
+        f"{API}/users",
+        json={"email": email, "username": username, "password": PASSWORD},
+    )
+    response = await client.post(
+        f"{API}/auth/login", data={"username": email, "password": PASSWORD}
+    )
+    token = response.json()["access_token"]
+    client.headers.update({"Authorization": f"Bearer {token}"})
+    return username
+
+
+async def run_load(base_url: str, concurrency: int, duration: float) -> dict:
+    limits = httpx.Limits(max_connections=concurrency)
+    async with httpx.AsyncClient(
+        base_url=base_url, limits=limits, timeout=60.0
+    ) as client:
+        username = await login(client)
+        url = f"{API}/users/{username}"
+        latencies: list[float] = []
+        errors = 0
+        deadline = time.monotonic() + duration
+
+        async def worker():
+            nonlocal errors
+            while time.monotonic() < deadline:
+                start = time.perf_counter()
+                response = await client.get(url)
+                latencies.append(time.perf_counter() - start)
+                if response.status_code != 200:
+                    errors += 1
+
+        started = time.monotonic()
+        await asyncio.gather(*(worker() for _ in range(concurrency)))
+        elapsed = time.monotonic() - started
+
+    latencies.sort()
+    return {
+        "requests": len(latencies),
+        "errors": errors,
+        "rps": len(latencies) / elapsed,
+        "p50_ms": statistics.median(latencies) * 1000,
+        "p99_ms": latencies[int(len(latencies) * 0.99) - 1] * 1000,
+    }
+
+
+def start_server(port: int, async_mode: bool) -> subprocess.Popen:
+    env = {**os.environ, "DATABASE_ASYNC": str(async_mode).lower()}
+    return subprocess.Popen(
+        [
+            sys.executable,
+            "-m",
+            "uvicorn",
+            "app.main:app",
+            "--port",
+            str(port),
+            "--log-level",
+            "warning",
+        ],
+        env=env,
+    )
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--concurrency", type=int, default=200)
+    parser.add_argument("--duration", type=float, default=15.0)
+    parser.add_argument("--port", type=int, default=8100)
+    args = parser.parse_args()
+
+    for offset, async_mode in enumerate((False, True)):
+        port = args.port + offset
+        server = start_server(port, async_mode)
+        try:
+            base_url = f"http://127.0.0.1:{port}"
+            await wait_until_up(base_url)
+            result = await run_load(base_url, args.concurrency, args.duration)
+        finally:
+            server.terminate()
+            server.wait()
+
+        mode = "async" if async_mode else "sync"
+        print(
+            f"{mode:>5}: {result['rps']:8.1f} req/s  "
+            f"p50 {result['p50_ms']:7.1f} ms  p99 {result['p99_ms']:7.1f} ms  "
+            f"({result['requests']} requests, {result['errors']} errors)"
+        )
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
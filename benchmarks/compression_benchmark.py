@@ -0,0 +1,327 @@
+"""
+Weigh the CPU cost of each response compression setting against the bytes it
+saves, on payloads shaped like our list and detail responses.
+
+Renders pages of 50 followers, comments and user posts (full content) and a
+single post detail through the same serializer as the API, then compresses
+each with every available encoding at a few levels and reports
+    bytes:  compressed size and ratio
+    cpu:    microseconds per response
+    saved:  KB saved per millisecond of CPU, the number to maximise
+Encodings without their package installed (br, zstd) are skipped.
+
+Usage:
+    uv run python -m benchmarks.compression_benchmark --levels gzip=1,6,9
+"""
+
+import argparse
+import random
+import time
+from datetime import datetime, timezone
+from types import SimpleNamespace
+
+from app.api.v1.schemas.comment import CommentOut
+from app.api.v1.schemas.post import PostListItemOut, PostOut
+from app.api.v1.schemas.user import UserListItemOut
+from app.core.compression import get_encoders
+from app.core.enums import ReactionType
+from app.utils.responses import list_response
+
+WORDS = [
+    "the",
+    "a",
+    "to",
+    "and",
+    "of",
+    "in",
+    "is",
+    "it",
+    "you",
+    "that",
+    "for",
+    "on",
+    "was",
+    "with",
+    "are",
+    "this",
+    "be",
+    "at",
+    "have",
+    "not",
+    "but",
+    "what",
+    "all",
+    "were",
+    "when",
+    "we",
+    "there",
+    "can",
+    "an",
+    "your",
+    "which",
+    "their",
+    "said",
+    "if",
+    "do",
+    "will",
+    "each",
+    "about",
+    "how",
+    "up",
+    "out",
+    "them",
+    "then",
+    "she",
+    "many",
+    "some",
+    "so",
+    "these",
+    "would",
+    "other",
+    "into",
+    "has",
+    "more",
+    "her",
+    "two",
+    "like",
+    "him",
+    "see",
+    "time",
+    "could",
+    "no",
+    "make",
+    "than",
+    "first",
+    "been",
+    "its",
+    "who",
+    "now",
+    "people",
+    "my",
+    "made",
+    "over",
+    "did",
+    "down",
+    "only",
+    "way",
+    "find",
+    "use",
+    "may",
+    "water",
+    "long",
+    "little",
+    "very",
+    "after",
+    "words",
+    "called",
+    "just",
+    "where",
+    "most",
+    "know",
+    "get",
+    "through",
+    "back",
+    "much",
+    "go",
+    "good",
+    "new",
+    "write",
+    "our",
+    "me",
+    "man",
+    "too",
+    "any",
+    "day",
+    "same",
+    "right",
+    "look",
+    "think",
+    "also",
+    "around",
+    "another",
+    "came",
+    "come",
+    "work",
+    "three",
+    "word",
+    "must",
+    "because",
+    "does",
+    "part",
+    "even",
+    "place",
+    "well",
+    "such",
+    "here",
+    "take",
+    "why",
+    "things",
+    "help",
+    "put",
+    "years",
+    "different",
+    "away",
+    "again",
+    "off",
+    "went",
+    "old",
+    "number",
+    "great",
+    "tell",
+    "men",
+    "say",
+    "small",
+    "every",
+    "found",
+    "still",
+    "between",
+    "name",
+    "should",
+    "home",
+    "big",
+    "give",
+    "air",
+    "line",
+    "set",
+    "own",
+    "under",
+    "read",
+    "last",
+    "never",
+    "us",
+    "left",
+    "end",
+    "along",
+    "while",
+    "might",
+    "next",
+    "sound",
+    "below",
+    "saw",
+    "something",
+    "thought",
+    "both",
+    "few",
+    "those",
+    "always",
+    "looked",
+    "show",
+    "large",
+    "often",
+    "together",
+    "asked",
+    "house",
+    "world",
+    "going",
+    "want",
+    "school",
+    "important",
+    "until",
+]
+
+NOW = datetime(2026, 1, 2, 3, 4, 5, tzinfo=timezone.utc)
+
+
+def text(rng: random.Random, words: int) -> str:
+    return " ".join(rng.choice(WORDS) for _ in range(words)).capitalize() + "."
+
+
+def user(rng: random.Random, i: int) -> UserListItemOut:
+    return UserListItemOut(
+        id=1000 + i,
+        username=f"{rng.choice(WORDS)}_{rng.choice(WORDS)}{rng.randint(1, 999)}",
+        is_following=rng.random() < 0.3,
+        followers_count=rng.randint(0, 5000),
+    )
+
+
+def payloads(items: int) -> dict[str, bytes]:
+    rng = random.Random(0)
+    followers = [user(rng, i) for i in range(items)]
+    comments = [
+        CommentOut(
+            id=i,
+            content=text(rng, rng.randint(5, 40)),
+            created_at=NOW,
+            post_id=1,
+            owner=user(rng, i),
+        )
+        for i in range(items)
+    ]
+    posts = [
+        PostListItemOut(
+            id=i,
+            title=text(rng, 4)[:40],
+            content=text(rng, rng.randint(30, 250)),
+            owner_id=1,
+            created_at=NOW,
+            comments_count=rng.randint(0, 100),
+            reactions_count=rng.randint(0, 500),
+            user_reacted=rng.choice([None, *ReactionType]),
+        )
+        for i in range(items)
+    ]
+    detail = PostOut(
+        **posts[0].model_dump(),
+        owner=followers[0],
+        reactions_by_type={r_type: rng.randint(0, 100) for r_type in ReactionType},
+    )
+    return {
+        "followers": list_response(UserListItemOut, followers).body,
+        "comments": list_response(CommentOut, comments).body,
+        "user posts": list_response(PostListItemOut, posts).body,
+        "post detail": detail.model_dump_json().encode(),
+    }
+
+
+def compress(factory, body: bytes) -> bytes:
+    compressor = factory()
+    return compressor.compress(body) + compressor.flush()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--items", type=int, default=50)
+    parser.add_argument("--iterations", type=int, default=300)
+    parser.add_argument(
+        "--levels",
+        nargs="*",
+        default=["gzip=1,4,6", "br=1,2,4", "zstd=1,3,9"],
+        help="encoding=level,... to compare",
+    )
+    args = parser.parse_args()
+
+    candidates = []
+    for spec in args.levels:
+        name, _, levels = spec.partition("=")
+        for level in map(int, levels.split(",")):
+            settings = SimpleNamespace(
+                COMPRESSION_ENCODINGS=[name],
+                COMPRESSION_GZIP_LEVEL=level,
+                COMPRESSION_BROTLI_QUALITY=level,
+                COMPRESSION_ZSTD_LEVEL=level,
+            )
+            factory = get_encoders(settings).get(name)
+            if factory is None:
+                print(f"{name} unavailable, skipped")
+                break
+            candidates.append((f"{name}-{level}", factory))
+
+    for payload, body in payloads(args.items).items():
+        print(f"\n{payload}: {len(body):,} bytes")
+        for label, factory in candidates:
+            compressed = compress(factory, body)
+            start = time.perf_counter()
+            for _ in range(args.iterations):
+                compress(factory, body)
+            cpu_us = (time.perf_counter() - start) / args.iterations * 1e6
+            saved_kb = (len(body) - len(compressed)) / 1024
+            print(
+                f"  {label:<8} bytes={len(compressed):>7,} "
+                f"ratio={len(body) / len(compressed):>5.2f} "
+                f"cpu={cpu_us:>7.0f}us saved={saved_kb / (cpu_us / 1000):>7.0f}KB/ms"
+            )
+
+
+if __name__ == "__main__":
+    main()
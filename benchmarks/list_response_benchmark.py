@@ -0,0 +1,178 @@
+"""
+Compare the two ways a list endpoint can turn service output into a body.
+
+For every GET route declaring a List[...] response_model, builds a page of
+items shaped like its service's output (ORM rows for the user and post
+lists, validated models for the others) and times, per page:
+    response_model: FastAPI's path (validate, serialize to Python objects,
+                    json.dumps)
+    list_response:  one pydantic-core pass through a cached TypeAdapter
+No database is involved; only serialization is measured.
+
+Usage:
+    uv run python -m benchmarks.list_response_benchmark --items 50
+"""
+
+import argparse
+import asyncio
+import json
+import time
+import typing
+from datetime import datetime, timezone
+from types import SimpleNamespace
+
+from fastapi.responses import JSONResponse
+from fastapi.routing import APIRoute, serialize_response
+
+from app.api.v1.schemas.comment import CommentOut
+from app.api.v1.schemas.follow import FollowRequestOut
+from app.api.v1.schemas.post import PostListItemOut, PostOut
+from app.api.v1.schemas.reaction import ReactionOut
+from app.api.v1.schemas.user import UserListItemOut, UserPublicOut
+from app.core.enums import ReactionType
+from app.main import app
+from app.utils.responses import list_response
+
+NOW = datetime(2026, 1, 2, 3, 4, 5, tzinfo=timezone.utc)
+
+
+def owner(build, i: int):
+    return build(
+        UserListItemOut,
+        id=i,
+        username=f"user{i}",
+        is_following=i % 2 == 0,
+        followers_count=i * 7,
+    )
+
+
+# Keyword arguments of one item per schema; build(model, **fields) makes it
+SAMPLES = {
+    UserListItemOut: owner,
+    UserPublicOut: lambda build, i: build(
+        UserPublicOut,
+        id=i,
+        username=f"user{i}",
+        bio="bio " * 20,
+        is_private=i % 2 == 0,
+        posts_count=i,
+        followers_count=i * 7,
+        following_count=i * 5,
+        is_following=i % 2 == 0,
+    ),
+    PostListItemOut: lambda build, i: build(
+        PostListItemOut,
+        id=i,
+        title=f"Post {i}",
+        content="content " * 40,
+        owner_id=i,
+        created_at=NOW,
+        comments_count=i,
+        reactions_count=i * 3,
+        user_reacted=ReactionType.fire if i % 3 == 0 else None,
+    ),
+    PostOut: lambda build, i: build(
+        PostOut,
+        id=i,
+        title=f"Post {i}",
+        content="content " * 40,
+        owner_id=i,
+        created_at=NOW,
+        comments_count=i,
+        reactions_count=i * 3,
+        user_reacted=ReactionType.fire if i % 3 == 0 else None,
+        owner=owner(build, i),
+        reactions_by_type={r_type: i for r_type in ReactionType},
+    ),
+    CommentOut: lambda build, i: build(
+        CommentOut,
+        id=i,
+        content="comment " * 10,
+        created_at=NOW,
+        post_id=1,
+        owner=owner(build, i),
+    ),
+    ReactionOut: lambda build, i: build(
+        ReactionOut,
+        post_id=1,
+        user_id=i,
+        type=ReactionType.heart,
+        owner=owner(build, i),
+    ),
+    FollowRequestOut: lambda build, i: build(
+        FollowRequestOut,
+        follower_id=i,
+        follower_username=f"user{i}",
+        followee_id=1,
+        followee_username="user1",
+        created_at=NOW,
+        accepted=False,
+    ),
+}
+
+
+def validated(model, **fields):
+    return model(**fields)
+
+
+# Services return raw rows for these and let the response validate them
+ROW_MODELS = {UserListItemOut, PostListItemOut}
+
+
+def row(model, **fields):
+    return SimpleNamespace(**fields)
+
+
+async def timed(fn, iterations: int) -> float:
+    """Return microseconds per call."""
+    await fn()  # warm-up
+    start = time.perf_counter()
+    for _ in range(iterations):
+        await fn()
+    return (time.perf_counter() - start) / iterations * 1e6
+
+
+async def run(items: int, iterations: int) -> None:
+    routes = [
+        route
+        for route in app.routes
+        if isinstance(route, APIRoute)
+        and "GET" in route.methods
+        and typing.get_origin(route.response_model) is list
+    ]
+    print(f"{items} items per page, {iterations} pages per endpoint")
+    for route in routes:
+        model = typing.get_args(route.response_model)[0]
+        build = row if model in ROW_MODELS else validated
+        page = [SAMPLES[model](build, i) for i in range(items)]
+
+        # Defaults bind this iteration's values (no late binding)
+        async def response_model_path(field=route.response_field, page=page):
+            content = await serialize_response(field=field, response_content=page)
+            return JSONResponse(content).body
+
+        async def list_response_path(model=model, page=page):
+            return list_response(model, page).body
+
+        before = await timed(response_model_path, iterations)
+        after = await timed(list_response_path, iterations)
+        # Same document, only whitespace differs
+        assert json.loads(await response_model_path()) == json.loads(
+            await list_response_path()
+        )
+        print(
+            f"{route.path:<40} response_model={before:>6.0f}us "
+            f"list_response={after:>6.0f}us speedup={before / after:>4.1f}x"
+        )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--items", type=int, default=50)
+    parser.add_argument("--iterations", type=int, default=2000)
+    args = parser.parse_args()
+    asyncio.run(run(args.items, args.iterations))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,102 @@
+"""
+Report Argon2id cost for candidate PASSWORD_HASH_* parameter sets.
+
+For each time_cost:memory_cost_kib:parallelism candidate, hashes and verifies
+a password repeatedly on this machine and reports wall-clock hash latency
+plus logins per second per core. The per-core figure divides by CPU time
+rather than wall time, because parallelism > 1 spreads one verification
+over several threads.
+Pick the most expensive set whose latency and throughput fit the login
+budget, then set it in .env; existing hashes upgrade on their next login.
+
+Usage:
+    uv run python -m benchmarks.password_hash_benchmark
+    uv run python -m benchmarks.password_hash_benchmark --params 2:19456:1 3:65536:4
+"""
+
+import argparse
+import statistics
+import time
+
+from pwdlib import PasswordHash
+from pwdlib.hashers.argon2 import Argon2Hasher
+
+from app.core.config import settings
+
+CANDIDATES = [
+    # OWASP minimum for Argon2id
+    (2, 19456, 1),
+    (2, 65536, 1),
+    # pwdlib's defaults
+    (3, 65536, 4),
+    (4, 131072, 4),
+]
+
+
+def parse_params(value: str) -> tuple[int, int, int]:
+    time_cost, memory_cost, parallelism = (int(part) for part in value.split(":"))
+    return time_cost, memory_cost, parallelism
+
+
+def measure(params: tuple[int, int, int], iterations: int) -> dict:
+    time_cost, memory_cost, parallelism = params
+    context = PasswordHash(
+        (
+            Argon2Hasher(
+                time_cost=time_cost,
+                memory_cost=memory_cost,
+                parallelism=parallelism,
+            ),
+        )
+    )
+    hashed = context.hash("benchmark-password")  # warm-up
+
+    timings = []
+    for _ in range(iterations):
+        start = time.perf_counter()
+        context.hash("benchmark-password")
+        timings.append((time.perf_counter() - start) * 1000)
+    timings.sort()
+
+    cpu_start = time.process_time()
+    for _ in range(iterations):
+        context.verify("benchmark-password", hashed)
+    cpu = time.process_time() - cpu_start
+
+    return {
+        "p50": statistics.median(timings),
+        "p99": timings[max(int(len(timings) * 0.99) - 1, 0)],
+        "logins_per_core": iterations / cpu if cpu else float("inf"),
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument(
+        "--params",
+        nargs="+",
+        type=parse_params,
+        default=CANDIDATES,
+        metavar="T:M:P",
+        help="time_cost:memory_cost_kib:parallelism candidates",
+    )
+    parser.add_argument("--iterations", type=int, default=20)
+    args = parser.parse_args()
+
+    configured = (
+        settings.PASSWORD_HASH_TIME_COST,
+        settings.PASSWORD_HASH_MEMORY_COST_KIB,
+        settings.PASSWORD_HASH_PARALLELISM,
+    )
+    for params in args.params:
+        result = measure(params, args.iterations)
+        marker = "  (configured)" if params == configured else ""
+        print(
+            f"t={params[0]:<2} m={params[1]:>7}KiB p={params[2]:<2} "
+            f"hash p50={result['p50']:7.1f}ms p99={result['p99']:7.1f}ms "
+            f"logins/s/core={result['logins_per_core']:7.1f}{marker}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,130 @@
+"""
+Compare the multi-query and single-query GET /posts/{post_id} paths.
+
+Seeds the configured database inside a transaction that is rolled back at the
+end, then serves the same (viewer, post) pairs through both paths and reports
+p50/p99 latency and statements per request:
+
+    current:  get_current_user + can_view_post + PostService.get_post
+    detail:   get_current_user + PostService.get_post_detail
+
+Usage:
+    uv run python -m benchmarks.post_detail_benchmark --requests 2000
+"""
+
+import argparse
+import random
+import statistics
+import time
+from types import SimpleNamespace
+
+from sqlalchemy import create_engine, event, text
+from sqlalchemy.orm import Session
+
+from app.core.config import settings
+from app.core.security.access_controls import can_view_post
+from app.db.models import User
+from app.services.post_service import PostService
+
+SEED_SQL = [
+    """
+    INSERT INTO users (email, username, hashed_password, is_private)
+    SELECT 'detail' || i || '@bench.local', 'detail' || i, 'x', i % 4 = 0
+    FROM generate_series(1, :users) AS i
+    """,
+    """
+    WITH u AS (SELECT array_agg(id) AS ids FROM users WHERE username LIKE 'detail%')
+    INSERT INTO posts (title, content, owner_id)
+    SELECT 'Post ' || i, repeat('content ', 20), u.ids[1 + i % array_length(u.ids, 1)]
+    FROM generate_series(1, :posts) AS i, u
+    """,
+    """
+    INSERT INTO post_counters (post_id)
+    SELECT id FROM posts ON CONFLICT DO NOTHING
+    """,
+    """
+    INSERT INTO follows (follower_id, followee_id, accepted)
+    SELECT a.id, b.id, true
+    FROM users a
+    CROSS JOIN generate_series(1, 10) AS k
+    JOIN users b ON b.id = a.id + k
+    WHERE a.username LIKE 'detail%'
+    ON CONFLICT DO NOTHING
+    """,
+    "ANALYZE",
+]
+
+# Public owners only, so both paths serve every request
+PUBLIC_POSTS_SQL = """
+    SELECT p.id, u.id FROM posts p JOIN users u ON u.id = p.owner_id
+    WHERE NOT u.is_private AND u.username LIKE 'detail%'
+"""
+
+
+def current_path(db: Session, viewer_id: int, post_id: int):
+    viewer = db.get(User, viewer_id)
+    can_view_post(post_id=post_id, current_user=viewer, db=db)
+    return PostService(db).get_post(viewer.id, post_id)
+
+
+def detail_path(db: Session, viewer_id: int, post_id: int):
+    viewer = db.get(User, viewer_id)
+    return PostService(db).get_post_detail(viewer.id, post_id)
+
+
+def measure(db: Session, path, pairs: list, counter: SimpleNamespace) -> dict:
+    timings = []
+    counter.statements = 0
+    for viewer_id, post_id in pairs:
+        # Each request starts with an empty identity map, like a new session
+        db.expunge_all()
+        start = time.perf_counter()
+        path(db, viewer_id, post_id)
+        timings.append((time.perf_counter() - start) * 1000)
+    timings.sort()
+    return {
+        "p50": statistics.median(timings),
+        "p99": timings[int(len(timings) * 0.99) - 1],
+        "statements": counter.statements / len(pairs),
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--database-url", default=settings.database_url)
+    parser.add_argument("--users", type=int, default=10000)
+    parser.add_argument("--posts", type=int, default=100000)
+    parser.add_argument("--requests", type=int, default=2000)
+    args = parser.parse_args()
+
+    engine = create_engine(args.database_url)
+    counter = SimpleNamespace(statements=0)
+
+    @event.listens_for(engine, "before_cursor_execute")
+    def count(conn, cursor, statement, parameters, context, executemany):
+        counter.statements += 1
+
+    with Session(engine) as db:
+        for statement in SEED_SQL:
+            db.execute(text(statement), {"users": args.users, "posts": args.posts})
+
+        rows = db.execute(text(PUBLIC_POSTS_SQL)).all()
+        viewers = [row[1] for row in rows]
+        pairs = [
+            (random.choice(viewers), random.choice(rows)[0])
+            for _ in range(args.requests)
+        ]
+
+        for name, path in (("current", current_path), ("detail", detail_path)):
+            measure(db, path, pairs[:100], counter)  # warm-up
+            result = measure(db, path, pairs, counter)
+            print(
+                f"{name:<8} p50={result['p50']:7.2f}ms p99={result['p99']:7.2f}ms "
+                f"statements/request={result['statements']:.1f}"
+            )
+
+        db.rollback()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,170 @@
+"""
+Measure the write/read trade-off of TIMELINE_FANOUT_MAX_FOLLOWERS.
+
+Seeds the configured database inside a transaction that is rolled back at the
+end: ordinary users who follow their neighbours, plus a few large accounts
+followed by everyone. For each candidate threshold it materializes the
+timelines, then reports
+    write: timeline rows and fan_out_post time per new post
+    read:  p50/p99 latency of a GET /feed page (PostService.get_feed)
+A low threshold keeps writes cheap but merges more posts at read time; a
+threshold above every follower count is pure fan-out on write.
+
+Usage:
+    uv run python -m benchmarks.timeline_benchmark --thresholds 100 1000 100000
+"""
+
+import argparse
+import random
+import statistics
+import time
+
+from sqlalchemy import create_engine, text
+from sqlalchemy.orm import Session
+
+from app.core.config import settings
+from app.db.models import Post
+from app.services.helpers.counter_helper import CounterHelper
+from app.services.helpers.timeline_helper import TimelineHelper
+from app.services.post_service import PostService
+
+SEED_SQL = [
+    """
+    INSERT INTO users (email, username, hashed_password)
+    SELECT 'timeline' || i || '@bench.local', 'timeline' || i, 'x'
+    FROM generate_series(1, :users) AS i
+    """,
+    """
+    WITH u AS (SELECT array_agg(id) AS ids FROM users WHERE username LIKE 'timeline%')
+    INSERT INTO posts (title, content, owner_id, created_at)
+    SELECT 'Post ' || i, repeat('content ', 20),
+           u.ids[1 + i % array_length(u.ids, 1)],
+           now() - make_interval(secs => i)
+    FROM generate_series(1, :posts) AS i, u
+    """,
+    """
+    INSERT INTO post_counters (post_id)
+    SELECT id FROM posts ON CONFLICT DO NOTHING
+    """,
+    # Everyone follows the next :following users...
+    """
+    INSERT INTO follows (follower_id, followee_id, accepted)
+    SELECT a.id, b.id, true
+    FROM users a
+    CROSS JOIN generate_series(1, :following) AS k
+    JOIN users b ON b.id = a.id + k
+    WHERE a.username LIKE 'timeline%' AND b.username LIKE 'timeline%'
+    ON CONFLICT DO NOTHING
+    """,
+    # ...and every :large_every-th user, the large accounts
+    """
+    INSERT INTO follows (follower_id, followee_id, accepted)
+    SELECT a.id, b.id, true
+    FROM users a
+    JOIN users b ON b.id % :large_every = 0 AND b.id <> a.id
+    WHERE a.username LIKE 'timeline%' AND b.username LIKE 'timeline%'
+    ON CONFLICT DO NOTHING
+    """,
+]
+
+MATERIALIZE_SQL = """
+    INSERT INTO timeline_entries (user_id, post_id, owner_id, created_at)
+    SELECT f.follower_id, p.id, p.owner_id, p.created_at
+    FROM follows f
+    JOIN users u ON u.id = f.followee_id
+    JOIN LATERAL (
+        SELECT id, owner_id, created_at FROM posts
+        WHERE owner_id = f.followee_id
+        ORDER BY created_at DESC, id DESC
+        LIMIT :backfill
+    ) p ON true
+    WHERE f.accepted AND u.followers_count < :threshold
+"""
+
+
+def measure_writes(db: Session, helper: TimelineHelper, owners: list) -> dict:
+    timings, rows = [], 0
+    for owner_id in owners:
+        post = Post(title="Benchmark", content="content", owner_id=owner_id)
+        db.add(post)
+        db.flush()
+        start = time.perf_counter()
+        rows += helper.fan_out_post(post.id)
+        timings.append((time.perf_counter() - start) * 1000)
+    return {"rows": rows / len(owners), "ms": statistics.mean(timings)}
+
+
+def measure_reads(db: Session, service: PostService, viewers: list) -> dict:
+    timings = []
+    for viewer_id in viewers:
+        db.expunge_all()
+        start = time.perf_counter()
+        service.get_feed(viewer_id, limit=20)
+        timings.append((time.perf_counter() - start) * 1000)
+    timings.sort()
+    return {
+        "p50": statistics.median(timings),
+        "p99": timings[int(len(timings) * 0.99) - 1],
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--database-url", default=settings.database_url)
+    parser.add_argument("--users", type=int, default=5000)
+    parser.add_argument("--posts", type=int, default=50000)
+    parser.add_argument("--following", type=int, default=50)
+    parser.add_argument("--large-every", type=int, default=500)
+    parser.add_argument("--requests", type=int, default=1000)
+    parser.add_argument("--writes", type=int, default=200)
+    parser.add_argument(
+        "--thresholds", nargs="+", type=int, default=[100, 1000, 10000, 10**9]
+    )
+    args = parser.parse_args()
+
+    engine = create_engine(args.database_url)
+    params = {
+        "users": args.users,
+        "posts": args.posts,
+        "following": args.following,
+        "large_every": args.large_every,
+    }
+
+    with Session(engine) as db:
+        for statement in SEED_SQL:
+            db.execute(text(statement), params)
+        CounterHelper(db).reconcile_user_counters()
+        db.execute(text("ANALYZE"))
+
+        user_ids = db.scalars(
+            text("SELECT id FROM users WHERE username LIKE 'timeline%'")
+        ).all()
+        viewers = [random.choice(user_ids) for _ in range(args.requests)]
+        owners = [random.choice(user_ids) for _ in range(args.writes)]
+
+        for threshold in args.thresholds:
+            db.execute(text("DELETE FROM timeline_entries"))
+            entries = db.execute(
+                text(MATERIALIZE_SQL),
+                {"threshold": threshold, "backfill": settings.TIMELINE_BACKFILL_POSTS},
+            ).rowcount
+            db.execute(text("ANALYZE timeline_entries"))
+
+            helper = TimelineHelper(db, max_followers=threshold)
+            service = PostService(db)
+            service.timeline_helper = helper
+
+            writes = measure_writes(db, helper, owners)
+            measure_reads(db, service, viewers[:100])  # warm-up
+            reads = measure_reads(db, service, viewers)
+            print(
+                f"threshold={threshold:<10} entries={entries:<9} "
+                f"rows/post={writes['rows']:8.1f} fan-out={writes['ms']:7.2f}ms "
+                f"feed p50={reads['p50']:6.2f}ms p99={reads['p99']:6.2f}ms"
+            )
+
+        db.rollback()
+
+
+if __name__ == "__main__":
+    main()
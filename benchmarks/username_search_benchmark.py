@@ -0,0 +1,90 @@
+"""
+Time UserService.search_users on a large users table.
+
+Seeds the configured database with synthetic users inside a transaction that
+is rolled back at the end, then runs a mix of exact, prefix and substring
+searches and reports per-query latency plus the plan's root node. Run it
+with and without the ix_users_username_trgm index to compare.
+
+Usage:
+    uv run python -m benchmarks.username_search_benchmark --users 1000000
+"""
+
+import argparse
+import statistics
+import time
+
+from sqlalchemy import create_engine, event, text
+from sqlalchemy.orm import Session
+
+from app.core.config import settings
+from app.services.user_service import UserService
+
+SEED_SQL = """
+INSERT INTO users (email, username, hashed_password)
+SELECT 'search' || i || '@bench.local',
+       'search' || substr(md5(i::text), 1, 10) || i,
+       'x'
+FROM generate_series(1, :users) AS i
+"""
+
+QUERIES = ["search1a2b", "c4ca4238", "9f8e", "zzzz"]
+
+
+def explain_root(db: Session, service: UserService, viewer_id: int, q: str) -> str:
+    statements = []
+
+    def capture(conn, cursor, statement, parameters, context, executemany):
+        statements.append((statement, parameters))
+
+    connection = db.connection()
+    event.listen(connection, "before_cursor_execute", capture)
+    service.search_users(viewer_id, q)
+    event.remove(connection, "before_cursor_execute", capture)
+
+    statement, parameters = statements[-1]
+    plan = connection.exec_driver_sql(
+        f"EXPLAIN (FORMAT JSON) {statement}", parameters
+    ).scalar()
+    node = plan[0]["Plan"]
+    while node.get("Plans") and node["Node Type"] in ("Limit", "Sort"):
+        node = node["Plans"][0]
+    return node["Node Type"]
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--database-url", default=settings.database_url)
+    parser.add_argument("--users", type=int, default=1_000_000)
+    parser.add_argument("--repeat", type=int, default=20)
+    args = parser.parse_args()
+
+    engine = create_engine(args.database_url)
+    with Session(engine) as db:
+        print(f"Seeding {args.users} users...")
+        start = time.perf_counter()
+        db.execute(text(SEED_SQL), {"users": args.users})
+        db.execute(text("ANALYZE users"))
+        print(f"Seeded in {time.perf_counter() - start:.1f}s\n")
+
+        viewer_id = db.execute(text("SELECT min(id) FROM users")).scalar()
+        service = UserService(db)
+
+        for q in QUERIES:
+            timings = []
+            for _ in range(args.repeat):
+                start = time.perf_counter()
+                page = service.search_users(viewer_id, q, limit=10)
+                timings.append((time.perf_counter() - start) * 1000)
+            plan = explain_root(db, service, viewer_id, q)
+            print(
+                f"{q!r:<14} rows={len(page):<3} "
+                f"p50={statistics.median(timings):8.2f}ms "
+                f"max={max(timings):8.2f}ms  plan={plan}"
+            )
+
+        db.rollback()
+
+
+if __name__ == "__main__":
+    main()
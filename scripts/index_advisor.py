@@ -0,0 +1,305 @@
+"""
+Index advisor: EXPLAIN every query the services build and report sequential scans.
+
+Runs each read path of the services against the configured database, captures
+the SELECT statements they emit, and runs EXPLAIN (FORMAT JSON) on each one.
+With --seed, a realistic dataset is generated first; everything happens in one
+transaction that is rolled back, so the database is left untouched.
+
+Usage:
+    uv run python scripts/index_advisor.py --seed
+    uv run python scripts/index_advisor.py --database-url postgresql+psycopg://...
+
+Exits with status 1 when any statement plans a sequential scan.
+"""
+
+import argparse
+import os
+import sys
+from dataclasses import dataclass, field
+from types import SimpleNamespace
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from sqlalchemy import create_engine, event, select, text
+from sqlalchemy.orm import Session
+
+from app.core.config import settings
+from app.core.security.access_controls import (
+    can_view_post,
+    can_view_target_user,
+)
+from app.db.models import Follow, Post, User
+from app.services.comment_service import CommentService
+from app.services.follow_service import FollowService
+from app.services.helpers.counter_helper import CounterHelper
+from app.services.post_service import PostService
+from app.services.reaction_service import ReactionService
+from app.services.user_service import UserService
+
+SEED_SQL = [
+    """
+    INSERT INTO users (email, username, hashed_password, is_private)
+    SELECT 'advisor' || i || '@example.com', 'advisor' || i, 'x', i % 5 = 0
+    FROM generate_series(1, :users) AS i
+    """,
+    # Fresh statistics after each bulk insert, or the joins that read the new
+    # rows plan as nested loops over what looks like an empty table
+    "ANALYZE users",
+    """
+    WITH u AS (SELECT array_agg(id) AS ids FROM users WHERE username LIKE 'advisor%')
+    INSERT INTO posts (title, content, owner_id, created_at)
+    SELECT 'Post ' || i, repeat('content ', 20),
+           u.ids[1 + i % array_length(u.ids, 1)],
+           now() - (i || ' minutes')::interval
+    FROM generate_series(1, :posts) AS i, u
+    """,
+    "ANALYZE posts",
+    """
+    WITH p AS MATERIALIZED (
+        SELECT posts.id, posts.owner_id,
+               row_number() OVER (ORDER BY posts.id) - 1 AS n
+        FROM posts JOIN users ON users.id = posts.owner_id
+        WHERE users.username LIKE 'advisor%'
+    ), c AS (
+        SELECT i, i % total AS post_n, (i * 7) % total AS author_n
+        FROM generate_series(1, :comments) AS i, (SELECT count(*) AS total FROM p) t
+    )
+    INSERT INTO comments (content, post_id, owner_id, created_at)
+    SELECT 'Comment ' || c.i, post.id, author.owner_id,
+           now() - (c.i || ' seconds')::interval
+    FROM c
+    JOIN p post ON post.n = c.post_n
+    JOIN p author ON author.n = c.author_n
+    """,
+    """
+    INSERT INTO follows (follower_id, followee_id, accepted)
+    SELECT a.id, b.id, (a.id + b.id) % 7 <> 0
+    FROM users a
+    CROSS JOIN generate_series(1, :fanout) AS k
+    JOIN users b ON b.id = a.id + k
+    WHERE a.username LIKE 'advisor%'
+    ON CONFLICT DO NOTHING
+    """,
+    "ANALYZE follows",
+    """
+    INSERT INTO reactions (user_id, post_id, type)
+    SELECT f.follower_id, p.id,
+           (enum_range(NULL::reaction_type))[1 + (p.id % 5)]
+    FROM follows f
+    JOIN LATERAL (
+        SELECT id FROM posts WHERE owner_id = f.followee_id
+        ORDER BY created_at DESC LIMIT 2
+    ) p ON true
+    ON CONFLICT DO NOTHING
+    """,
+]
+
+# Home timelines as rebuild_timelines.py would write them, in one statement
+TIMELINE_SQL = """
+INSERT INTO timeline_entries (user_id, post_id, owner_id, created_at)
+SELECT f.follower_id, p.id, p.owner_id, p.created_at
+FROM follows f
+JOIN users u ON u.id = f.followee_id
+JOIN LATERAL (
+    SELECT id, owner_id, created_at FROM posts
+    WHERE owner_id = f.followee_id
+    ORDER BY created_at DESC, id DESC
+    LIMIT :backfill
+) p ON true
+WHERE f.accepted AND u.followers_count < :max_followers
+"""
+
+GIN_FLUSH_SQL = """
+SELECT gin_clean_pending_list(c.oid)
+FROM pg_class c JOIN pg_am am ON am.oid = c.relam
+WHERE c.relkind = 'i' AND am.amname = 'gin'
+"""
+
+
+@dataclass
+class Finding:
+    label: str
+    statement: str
+    seq_scans: list[str] = field(default_factory=list)
+    total_cost: float = 0.0
+
+
+def seed(db: Session, users: int, fanout: int) -> None:
+    params = {
+        "users": users,
+        "posts": users * 10,
+        "comments": users * 20,
+        "fanout": fanout,
+    }
+    for statement in SEED_SQL:
+        db.execute(text(statement), params)
+    db.execute(text("ANALYZE"))
+    # The raw inserts bypass the services, so backfill the denormalized
+    # counters; otherwise post_counters is planned as an empty table
+    counters = CounterHelper(db)
+    counters.reconcile_user_counters()
+    counters.reconcile_post_counters()
+    db.execute(
+        text(TIMELINE_SQL),
+        {
+            "backfill": settings.TIMELINE_BACKFILL_POSTS,
+            "max_followers": settings.TIMELINE_FANOUT_MAX_FOLLOWERS,
+        },
+    )
+    db.execute(text("ANALYZE users, post_counters, timeline_entries"))
+    # Bulk-inserted rows wait in GIN pending lists, which the planner charges
+    # for until a vacuum flushes them; flush now so trigram plans are real
+    db.execute(text(GIN_FLUSH_SQL))
+
+
+def find_seq_scans(plan: dict) -> list[str]:
+    """Walk an EXPLAIN JSON plan and return the relations read by Seq Scan."""
+    found = []
+    if plan.get("Node Type") == "Seq Scan":
+        found.append(plan.get("Relation Name", "?"))
+    for child in plan.get("Plans", []):
+        found.extend(find_seq_scans(child))
+    return found
+
+
+def explain(db: Session, label: str, statements: list) -> list[Finding]:
+    findings = []
+    for statement, parameters in statements:
+        row = (
+            db.connection()
+            .exec_driver_sql(f"EXPLAIN (FORMAT JSON) {statement}", parameters)
+            .scalar()
+        )
+        plan = row[0]["Plan"]
+        findings.append(
+            Finding(
+                label=label,
+                statement=" ".join(statement.split()),
+                seq_scans=find_seq_scans(plan),
+                total_cost=plan["Total Cost"],
+            )
+        )
+    return findings
+
+
+def service_calls(db: Session) -> dict:
+    """Return the service read paths to analyse, keyed by a readable label."""
+    # A post, its owner, and one of the owner's followers when there is one
+    post = db.query(Post).order_by(Post.id).first()
+    target = db.get(User, post.owner_id)
+    viewer = (
+        db.query(User)
+        .join(Follow, Follow.follower_id == User.id)
+        .filter(Follow.followee_id == target.id, Follow.accepted.is_(True))
+        .order_by(User.id)
+        .first()
+    ) or db.query(User).filter(User.id != target.id).order_by(User.id).first()
+    # The newest username is a substring of few others, unlike "advisor1"
+    search_term = db.query(User.username).order_by(User.id.desc()).limit(1).scalar()
+    current_user = SimpleNamespace(id=viewer.id)
+
+    post_ids = db.scalars(
+        select(Post.id).where(Post.owner_id == target.id).limit(10)
+    ).all()
+
+    users = UserService(db)
+    posts = PostService(db)
+    comments = CommentService(db)
+    return {
+        "can_view_target_user": lambda: can_view_target_user(
+            username=target.username, db=db, current_user=current_user
+        ),
+        "can_view_post": lambda: can_view_post(
+            post_id=post.id, current_user=current_user, db=db
+        ),
+        "UserService.get_user_by_username": lambda: users.get_user_by_username(
+            viewer.id, target.username
+        ),
+        "UserService.get_users_by_usernames": lambda: users.get_users_by_usernames(
+            viewer.id, [target.username, viewer.username]
+        ),
+        "UserService.get_profile_version": lambda: users.get_profile_version(
+            target.username
+        ),
+        "UserService.search_users": lambda: users.search_users(viewer.id, search_term),
+        "UserService.get_user_followers": lambda: users.get_user_followers(
+            viewer.id, target.id
+        ),
+        "UserService.get_user_following": lambda: users.get_user_following(
+            viewer.id, target.id
+        ),
+        "PostService.get_user_posts": lambda: posts.get_user_posts(
+            viewer.id, target.id, limit=10, offset=0
+        ),
+        "PostService.get_post": lambda: posts.get_post(viewer.id, post.id),
+        "PostService.get_post_detail": lambda: posts.get_post_detail(
+            viewer.id, post.id
+        ),
+        "PostService.get_posts_detail": lambda: posts.get_posts_detail(
+            viewer.id, post_ids
+        ),
+        "PostService.get_post_version": lambda: posts.get_post_version(post.id),
+        "PostService.get_feed": lambda: posts.get_feed(viewer.id, limit=10),
+        "CommentService.get_post_comments": lambda: comments.get_post_comments(
+            viewer.id, post.id
+        ),
+        "CommentService.get_post_comments_version": lambda: (
+            comments.get_post_comments_version(post.id)
+        ),
+        "ReactionService.get_post_reactions": lambda: ReactionService(
+            db
+        ).get_post_reactions(viewer.id, post.id),
+        "FollowService.get_follow_requests": lambda: FollowService(
+            db
+        ).get_follow_requests(target.id),
+    }
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--database-url", default=settings.database_url)
+    parser.add_argument("--seed", action="store_true", help="generate a dataset")
+    parser.add_argument("--users", type=int, default=20000)
+    parser.add_argument("--fanout", type=int, default=20)
+    parser.add_argument("--verbose", action="store_true", help="print statements")
+    args = parser.parse_args()
+
+    engine = create_engine(args.database_url)
+    captured: list = []
+    recording = False
+
+    @event.listens_for(engine, "before_cursor_execute")
+    def capture(conn, cursor, statement, parameters, context, executemany):
+        if recording and statement.lstrip().upper().startswith("SELECT"):
+            captured.append((statement, parameters))
+
+    findings: list[Finding] = []
+    with Session(engine) as db:
+        if args.seed:
+            seed(db, args.users, args.fanout)
+
+        for label, call in service_calls(db).items():
+            captured.clear()
+            recording = True
+            call()
+            recording = False
+            findings.extend(explain(db, label, list(captured)))
+
+        db.rollback()
+
+    flagged = [f for f in findings if f.seq_scans]
+    for finding in findings:
+        status = "ok"
+        if finding.seq_scans:
+            status = "SEQ SCAN " + ", ".join(finding.seq_scans)
+        print(f"{finding.label:<40} cost={finding.total_cost:>10.1f}  {status}")
+        if args.verbose or finding.seq_scans:
+            print(f"    {finding.statement[:400]}")
+
+    print(f"\n{len(findings)} statements analysed, {len(flagged)} with seq scans")
+    return 1 if flagged else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
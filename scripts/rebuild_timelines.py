@@ -0,0 +1,56 @@
+"""
+Rebuild materialized home timelines from the follows table.
+
+Rematerializes each user's timeline_entries from their accepted follows,
+copying the latest TIMELINE_BACKFILL_POSTS posts of every followed account
+below TIMELINE_FANOUT_MAX_FOLLOWERS followers. Run it after changing either
+setting, after dropped fan-out jobs, or to populate a new deployment.
+
+Usage:
+    uv run python scripts/rebuild_timelines.py
+    uv run python scripts/rebuild_timelines.py --user-id 42 --dry-run
+"""
+
+import argparse
+import os
+import sys
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from sqlalchemy import create_engine, select
+from sqlalchemy.orm import Session
+
+from app.core.config import settings
+from app.db.models import User
+from app.services.helpers.timeline_helper import TimelineHelper
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--database-url", default=settings.database_url)
+    parser.add_argument("--user-id", type=int, action="append", dest="user_ids")
+    parser.add_argument(
+        "--dry-run", action="store_true", help="report rows without saving"
+    )
+    args = parser.parse_args()
+
+    engine = create_engine(args.database_url)
+    with Session(engine) as db:
+        user_ids = args.user_ids or db.scalars(select(User.id).order_by(User.id)).all()
+        helper = TimelineHelper(db)
+        rows = 0
+        for user_id in user_ids:
+            rows += helper.rebuild(user_id)
+            if args.dry_run:
+                db.rollback()
+            else:
+                # One transaction per user keeps locks short on large tables
+                db.commit()
+
+    verb = "would write" if args.dry_run else "wrote"
+    print(f"timeline_entries: {verb} {rows} rows for {len(user_ids)} users")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
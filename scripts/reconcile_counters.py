@@ -0,0 +1,53 @@
+"""
+Reconcile denormalized counters with the rows they count.
+
+Recomputes users.posts_count, followers_count and following_count from the
+posts and follows tables, and post_counters from comments and reactions,
+rewriting only the rows that drifted.
+
+Usage:
+    uv run python scripts/reconcile_counters.py
+    uv run python scripts/reconcile_counters.py --dry-run
+"""
+
+import argparse
+import os
+import sys
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from sqlalchemy import create_engine
+from sqlalchemy.orm import Session
+
+from app.core.config import settings
+from app.services.helpers.counter_helper import CounterHelper
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--database-url", default=settings.database_url)
+    parser.add_argument(
+        "--dry-run", action="store_true", help="report drift without saving"
+    )
+    args = parser.parse_args()
+
+    engine = create_engine(args.database_url)
+    with Session(engine) as db:
+        helper = CounterHelper(db)
+        fixed = {
+            "users": helper.reconcile_user_counters(),
+            "post_counters": helper.reconcile_post_counters(),
+        }
+        if args.dry_run:
+            db.rollback()
+        else:
+            db.commit()
+
+    verb = "would fix" if args.dry_run else "fixed"
+    for table, count in fixed.items():
+        print(f"{table}: {verb} {count} rows")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
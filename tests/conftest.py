@@ -2,11 +2,20 @@ import pytest
 from fastapi.testclient import TestClient
 from pydantic_settings import SettingsConfigDict
 from sqlalchemy import create_engine
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
 from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import NullPool
 
+from app.core.cache.service_cache import service_cache
 from app.core.config import Settings
-from app.db.database import Base, get_db
+from app.core.security.jwt import verified_tokens
+from app.core.security.principal import principal_cache
+from app.core.security.revocation import revoked_tokens
+from app.db import database
+from app.db.database import Base, get_async_db, get_db, get_session
+from app.db.routing import RoutingSession
 from app.main import app
+from app.services.timeline_fanout import timeline_fanout
 from tests.fixtures.services_fixtures import *  # noqa: F403
 from tests.fixtures.user_fixtures import *  # noqa: F403
 
@@ -24,6 +33,23 @@ engine = create_engine(SQLALCHEMY_DATABASE_URL)
 TestingSessionLocal = sessionmaker(bind=engine, autoflush=False, autocommit=False)
 
 
+@pytest.fixture(autouse=True)
+def clear_process_caches():
+    """Test databases are rebuilt per test, so cached principals go stale."""
+    caches = (principal_cache, service_cache, verified_tokens, revoked_tokens)
+    for cache in caches:
+        cache.clear()
+    yield
+    for cache in caches:
+        cache.clear()
+
+
+@pytest.fixture(autouse=True)
+def inline_timeline_fanout(monkeypatch):
+    """Run fan-out jobs in the request transaction so tests see them at once."""
+    monkeypatch.setattr(timeline_fanout, "workers", 0)
+
+
 @pytest.fixture(scope="function")
 def session():
     """
@@ -52,6 +78,29 @@ def client(session):
     return TestClient(app)
 
 
+@pytest.fixture(scope="function")
+def async_client(session, monkeypatch):
+    """
+    TestClient that serves requests through get_async_db, with AsyncSessions
+    on the test database, whatever DATABASE_ASYNC is set to
+    """
+    # NullPool: connections belong to the TestClient's event loop
+    async_engine = create_async_engine(SQLALCHEMY_DATABASE_URL, poolclass=NullPool)
+    monkeypatch.setattr(
+        database,
+        "AsyncSessionLocal",
+        async_sessionmaker(
+            bind=async_engine,
+            sync_session_class=RoutingSession,
+            autoflush=False,
+            expire_on_commit=False,
+        ),
+    )
+    app.dependency_overrides[get_session] = get_async_db
+    yield TestClient(app)
+    app.dependency_overrides.pop(get_session, None)
+
+
 @pytest.fixture
 def authorized_client(client, test_users):
     """
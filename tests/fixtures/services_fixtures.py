@@ -1,4 +1,7 @@
+from contextlib import contextmanager
+
 import pytest
+from sqlalchemy import event
 from sqlalchemy.orm import Session
 
 from app.services.auth_service import AuthService
@@ -43,3 +46,27 @@ def reaction_service(session: Session) -> ReactionService:
 def follow_service(session: Session) -> FollowService:
     """Provides a FollowService instance with a fresh test session."""
     return FollowService(session)
+
+
+@pytest.fixture
+def count_statements(session: Session):
+    """
+    Provides a context manager that records the SQL statements executed on
+    the test engine while it is active.
+    """
+
+    @contextmanager
+    def _count():
+        statements = []
+
+        def record(conn, cursor, statement, parameters, context, executemany):
+            statements.append(statement)
+
+        engine = session.get_bind()
+        event.listen(engine, "before_cursor_execute", record)
+        try:
+            yield statements
+        finally:
+            event.remove(engine, "before_cursor_execute", record)
+
+    return _count
@@ -6,6 +6,7 @@ from app.core.security.password import hash_password
 from app.db.models.follow import Follow
 from app.db.models.post import Post
 from app.db.models.user import User
+from app.services.helpers.counter_helper import CounterHelper
 from app.services.user_service import UserService
 
 
@@ -77,6 +78,9 @@ def test_users_with_follow(user_service: UserService, session: Session):
             Follow(follower_id=users[4].id, followee_id=users[5].id, accepted=False),
         ]
     )
+    session.flush()
+    # Rows were inserted directly, so bring the counters in line
+    CounterHelper(session).reconcile_user_counters()
 
     session.commit()
 
@@ -102,6 +106,8 @@ def user_with_posts(user_service: UserService, session):
         Post(title="Post 2", content="Content 2", owner_id=user.id),
     ]
     session.add_all(posts)
+    session.flush()
+    CounterHelper(session).reconcile_user_counters()
     session.commit()
 
     return user
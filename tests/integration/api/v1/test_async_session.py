@@ -0,0 +1,80 @@
+import pytest
+from fastapi import status
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.db.models.post import Post
+
+prefix = "/api/v1"
+
+
+@pytest.fixture
+def run_sync_calls(monkeypatch):
+    """Record every sync function run through an AsyncSession."""
+    calls = []
+    original = AsyncSession.run_sync
+
+    async def run_sync(self, fn, *args, **kwargs):
+        calls.append(fn)
+        return await original(self, fn, *args, **kwargs)
+
+    monkeypatch.setattr(AsyncSession, "run_sync", run_sync)
+    return calls
+
+
+def login(async_client, user, password):
+    response = async_client.post(
+        f"{prefix}/auth/login", data={"username": user.email, "password": password}
+    )
+    assert response.status_code == status.HTTP_200_OK
+    async_client.headers.update(
+        {"Authorization": f"Bearer {response.json()['access_token']}"}
+    )
+
+
+# -----------------------------
+# Requests served through get_async_db
+# -----------------------------
+
+
+def test_async_session_serves_reads_and_writes(
+    async_client, session, test_users, run_sync_calls
+):
+    login(async_client, test_users[0], "User1Pass!")
+
+    response = async_client.get(f"{prefix}/users/me")
+    assert response.status_code == status.HTTP_200_OK
+    assert response.json()["username"] == test_users[0].username
+
+    response = async_client.post(
+        f"{prefix}/posts", json={"title": "Async", "content": "Written async"}
+    )
+    assert response.status_code == status.HTTP_201_CREATED
+    post_id = response.json()["id"]
+
+    response = async_client.get(f"{prefix}/posts/{post_id}")
+    assert response.status_code == status.HTTP_200_OK
+    assert response.json()["title"] == "Async"
+
+    # Committed by get_async_db, so visible to a separate session
+    session.expire_all()
+    assert session.get(Post, post_id).content == "Written async"
+    assert run_sync_calls
+
+
+def test_async_session_access_controls(async_client, session, test_users):
+    private_post = Post(title="Title", content="Content", owner_id=test_users[1].id)
+    session.add(private_post)
+    session.commit()
+    login(async_client, test_users[0], "User1Pass!")
+
+    response = async_client.get(f"{prefix}/users/{test_users[1].username}/posts")
+    assert response.status_code == status.HTTP_403_FORBIDDEN
+
+    response = async_client.get(f"{prefix}/posts/{private_post.id}")
+    assert response.status_code == status.HTTP_403_FORBIDDEN
+
+
+def test_async_session_rejects_anonymous_requests(async_client):
+    response = async_client.get(f"{prefix}/users/me")
+
+    assert response.status_code == status.HTTP_401_UNAUTHORIZED
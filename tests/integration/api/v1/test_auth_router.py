@@ -1,7 +1,10 @@
 import pytest  # noqa: F401
 from fastapi import status
 
-route = "/api/v1/auth/login"
+from app.core.security.password import hash_pool
+
+prefix = "/api/v1/auth"
+route = f"{prefix}/login"
 
 # -----------------------------
 # Login user tests
@@ -41,3 +44,89 @@ def test_login_invalid_password(client, test_users):
 
     assert response.status_code == status.HTTP_401_UNAUTHORIZED
     assert response.json()["detail"]["error"] == "invalid_login_credentials"
+
+
+def test_login_hashing_pool_saturated(client, test_users, monkeypatch):
+    monkeypatch.setattr(hash_pool, "max_pending", 0)
+
+    response = client.post(
+        route,
+        data={"username": test_users[0].email, "password": "User1Pass!"},
+    )
+
+    assert response.status_code == status.HTTP_503_SERVICE_UNAVAILABLE
+    assert response.json()["detail"]["error"] == "password_hashing_busy"
+
+
+# -----------------------------
+# Refresh and logout tests
+# -----------------------------
+
+
+def login(client, user):
+    response = client.post(
+        route, data={"username": user.email, "password": "User1Pass!"}
+    )
+    return response.json()
+
+
+def test_login_returns_refresh_token(client, test_users):
+    tokens = login(client, test_users[0])
+
+    assert tokens["refresh_token"]
+    assert tokens["token_type"] == "bearer"
+
+
+def test_refresh_rotates_tokens(client, test_users):
+    tokens = login(client, test_users[0])
+
+    response = client.post(
+        f"{prefix}/refresh", json={"refresh_token": tokens["refresh_token"]}
+    )
+
+    assert response.status_code == status.HTTP_200_OK
+    rotated = response.json()
+    assert rotated["refresh_token"] != tokens["refresh_token"]
+    me = client.get(
+        "/api/v1/users/me",
+        headers={"Authorization": f"Bearer {rotated['access_token']}"},
+    )
+    assert me.status_code == status.HTTP_200_OK
+
+
+def test_refresh_reuse_revokes_session(client, test_users):
+    tokens = login(client, test_users[0])
+    client.post(f"{prefix}/refresh", json={"refresh_token": tokens["refresh_token"]})
+
+    response = client.post(
+        f"{prefix}/refresh", json={"refresh_token": tokens["refresh_token"]}
+    )
+
+    assert response.status_code == status.HTTP_401_UNAUTHORIZED
+    assert response.json()["detail"]["error"] == "refresh_token_reused"
+    me = client.get(
+        "/api/v1/users/me",
+        headers={"Authorization": f"Bearer {tokens['access_token']}"},
+    )
+    assert me.status_code == status.HTTP_401_UNAUTHORIZED
+
+
+def test_refresh_invalid_token(client):
+    response = client.post(f"{prefix}/refresh", json={"refresh_token": "nope"})
+
+    assert response.status_code == status.HTTP_401_UNAUTHORIZED
+    assert response.json()["detail"]["error"] == "invalid_refresh_token"
+
+
+def test_logout_revokes_access_token(client, test_users):
+    tokens = login(client, test_users[0])
+    headers = {"Authorization": f"Bearer {tokens['access_token']}"}
+    assert client.get("/api/v1/users/me", headers=headers).status_code == 200
+
+    response = client.post(
+        f"{prefix}/logout", json={"refresh_token": tokens["refresh_token"]}
+    )
+
+    assert response.status_code == status.HTTP_204_NO_CONTENT
+    me = client.get("/api/v1/users/me", headers=headers)
+    assert me.status_code == status.HTTP_401_UNAUTHORIZED
@@ -0,0 +1,46 @@
+import pytest  # noqa: F401
+from fastapi import status
+
+from app.db.models.post import Post
+
+prefix = "/api/v1/posts/{post_id}/comments"
+
+
+# -----------------------------
+# Get comments tests
+# -----------------------------
+
+
+def test_get_comments_revalidates_with_etag(authorized_client, session, test_users):
+    post = Post(title="Title", content="Content", owner_id=test_users[0].id)
+    session.add(post)
+    session.commit()
+    url = prefix.format(post_id=post.id)
+    comment_id = authorized_client.post(url, json={"content": "First"}).json()["id"]
+
+    response = authorized_client.get(url)
+    etag = response.headers["ETag"]
+    assert [c["content"] for c in response.json()] == ["First"]
+
+    response = authorized_client.get(url, headers={"If-None-Match": etag})
+    assert response.status_code == status.HTTP_304_NOT_MODIFIED
+
+    # Other pages are tagged separately
+    response = authorized_client.get(
+        url, params={"offset": 1}, headers={"If-None-Match": etag}
+    )
+    assert response.status_code == status.HTTP_200_OK
+
+    authorized_client.patch(f"{url}/{comment_id}", json={"content": "Edited"})
+
+    response = authorized_client.get(url, headers={"If-None-Match": etag})
+    assert response.status_code == status.HTTP_200_OK
+    assert response.json()[0]["content"] == "Edited"
+    etag = response.headers["ETag"]
+
+    # Comment owners' summaries are part of the page
+    authorized_client.patch("/api/v1/users/me", json={"username": "renamed"})
+
+    response = authorized_client.get(url, headers={"If-None-Match": etag})
+    assert response.status_code == status.HTTP_200_OK
+    assert response.json()[0]["owner"]["username"] == "renamed"
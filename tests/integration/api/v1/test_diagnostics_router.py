@@ -0,0 +1,125 @@
+import pytest
+from fastapi import status
+from sqlalchemy import create_engine
+
+from app.api.v1.routers import diagnostics_router
+from app.db.pool import InstrumentedQueuePool, instrument_pool
+
+prefix = "/api/v1/diagnostics"
+
+
+# -----------------------------
+# Pool diagnostics tests
+# -----------------------------
+
+
+def test_get_pool_status(authorized_client):
+    response = authorized_client.get(f"{prefix}/pool")
+    assert response.status_code == status.HTTP_200_OK
+
+    data = response.json()
+    assert data["mode"] in ("sync", "async")
+    assert list(data["engines"]) == ["primary"]
+    assert data["engines"]["primary"]["in_use"] >= 0
+    assert "p99" in data["engines"]["primary"]["checkout_wait_ms"]
+
+
+def test_get_pool_status_includes_replicas(authorized_client, monkeypatch, tmp_path):
+    replicas = []
+    for number in range(2):
+        replica = create_engine(
+            f"sqlite:///{tmp_path / f'replica{number}.db'}",
+            poolclass=InstrumentedQueuePool,
+        )
+        instrument_pool(replica, -1)
+        replicas.append(replica)
+    with replicas[1].connect():
+        monkeypatch.setattr(diagnostics_router, "replica_engines", replicas)
+        monkeypatch.setattr(diagnostics_router, "async_replica_engines", replicas)
+
+        response = authorized_client.get(f"{prefix}/pool")
+    assert response.status_code == status.HTTP_200_OK
+
+    engines = response.json()["engines"]
+    assert list(engines) == ["primary", "replica-1", "replica-2"]
+    assert engines["replica-1"]["in_use"] == 0
+    assert engines["replica-2"]["in_use"] == 1
+
+
+# -----------------------------
+# Principal cache diagnostics tests
+# -----------------------------
+
+
+def test_get_principal_cache_stats(authorized_client):
+    authorized_client.get("/api/v1/users/me")
+    authorized_client.get("/api/v1/users/me")
+
+    response = authorized_client.get(f"{prefix}/principal-cache")
+    assert response.status_code == status.HTTP_200_OK
+
+    data = response.json()
+    # The diagnostics request itself is authenticated from the cache too
+    assert data["misses"] == 1
+    assert data["hits"] == 2
+    assert data["size"] == 1
+
+
+# -----------------------------
+# Service cache diagnostics tests
+# -----------------------------
+
+
+def test_get_service_cache_stats(authorized_client, test_users):
+    authorized_client.get(f"/api/v1/users/{test_users[1].username}")
+    authorized_client.get(f"/api/v1/users/{test_users[1].username}")
+
+    response = authorized_client.get(f"{prefix}/service-cache")
+    assert response.status_code == status.HTTP_200_OK
+
+    data = response.json()
+    assert data["backend"] == "memory"
+    assert data["namespaces"]["profile"] == {"hits": 1, "misses": 1}
+    assert data["size"] == 1
+
+
+# -----------------------------
+# Password hashing diagnostics tests
+# -----------------------------
+
+
+def test_get_password_hashing_status(authorized_client):
+    response = authorized_client.get(f"{prefix}/password-hashing")
+    assert response.status_code == status.HTTP_200_OK
+
+    data = response.json()
+    assert data["pending"] == 0
+    assert data["completed"] >= 1
+    assert "p99" in data["queue_wait_ms"]
+    assert data["hash_ms"]["max"] > 0
+
+
+def test_get_timeline_fanout_status(authorized_client):
+    response = authorized_client.get(f"{prefix}/timeline-fanout")
+    assert response.status_code == status.HTTP_200_OK
+
+    data = response.json()
+    assert data["workers"] == 0
+    assert data["queued"] == 0
+    assert "p99" in data["job_ms"]
+
+
+@pytest.mark.parametrize(
+    "path",
+    [
+        "/pool",
+        "/principal-cache",
+        "/service-cache",
+        "/password-hashing",
+        "/timeline-fanout",
+    ],
+)
+def test_diagnostics_unauthorized(client, path):
+    response = client.get(f"{prefix}{path}")
+
+    assert response.status_code == status.HTTP_401_UNAUTHORIZED
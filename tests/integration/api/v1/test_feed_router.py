@@ -0,0 +1,52 @@
+import pytest  # noqa: F401
+from fastapi import status
+
+from app.api.v1.schemas.post import PostCreate
+from app.services.post_service import PostService
+
+prefix = "/api/v1/feed"
+
+
+# -----------------------------
+# Get feed tests
+# -----------------------------
+
+
+def test_get_feed(authorized_client, session, test_users_with_follow):
+    users = test_users_with_follow
+    authorized_client.login_as(users["user1"].email, "User1Pass!")
+    post_service = PostService(session)
+    for owner, title in (
+        ("user2", "Followed"),
+        ("user3", "Followed"),
+        ("user4", "Unfollowed"),
+    ):
+        post_service.create_post(users[owner].id, PostCreate(title=title, content="C"))
+    session.commit()
+
+    response = authorized_client.get(prefix, params={"limit": 1})
+
+    assert response.status_code == status.HTTP_200_OK
+    assert len(response.json()) == 1
+    assert response.headers["X-Has-More"] == "true"
+
+    response = authorized_client.get(
+        prefix, params={"limit": 5, "cursor": response.headers["X-Next-Cursor"]}
+    )
+    data = response.json()
+    assert len(data) == 1
+    assert data[0]["title"] == "Followed"
+    assert response.headers["X-Has-More"] == "false"
+
+
+def test_get_feed_invalid_cursor(authorized_client):
+    response = authorized_client.get(prefix, params={"cursor": "garbage"})
+
+    assert response.status_code == status.HTTP_400_BAD_REQUEST
+    assert response.json()["detail"]["error"] == "invalid_cursor"
+
+
+def test_get_feed_unauthorized(client):
+    response = client.get(prefix)
+
+    assert response.status_code == status.HTTP_401_UNAUTHORIZED
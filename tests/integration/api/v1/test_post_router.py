@@ -0,0 +1,126 @@
+import pytest
+from fastapi import status
+
+from app.core.enums import ReactionType
+from app.db.models.post import Post
+from app.db.models.reaction import Reaction
+
+prefix = "/api/v1/posts"
+
+# -----------------------------
+# Get post tests
+# -----------------------------
+
+
+def test_get_post_success(authorized_client, session, test_users):
+    owner = test_users[0]
+    post = Post(title="Title", content="Content", owner_id=owner.id)
+    session.add(post)
+    session.flush()
+    session.add(Reaction(user_id=owner.id, post_id=post.id, type=ReactionType.fire))
+    post.counters.fire_count = 1
+    session.commit()
+
+    response = authorized_client.get(f"{prefix}/{post.id}")
+
+    assert response.status_code == status.HTTP_200_OK
+    data = response.json()
+    assert data["id"] == post.id
+    assert data["owner"]["username"] == owner.username
+    assert data["reactions_count"] == 1
+    assert data["reactions_by_type"]["fire"] == 1
+    assert data["user_reacted"] == "fire"
+
+
+def test_get_post_not_found(authorized_client):
+    response = authorized_client.get(f"{prefix}/9999")
+
+    assert response.status_code == status.HTTP_404_NOT_FOUND
+
+
+def test_get_post_private_owner_forbidden(authorized_client, session, test_users):
+    private_owner = test_users[1]
+    post = Post(title="Title", content="Content", owner_id=private_owner.id)
+    session.add(post)
+    session.commit()
+
+    response = authorized_client.get(f"{prefix}/{post.id}")
+
+    assert response.status_code == status.HTTP_403_FORBIDDEN
+
+
+def test_get_post_revalidates_with_etag(authorized_client, session, test_users):
+    post = Post(title="Title", content="Content", owner_id=test_users[0].id)
+    session.add(post)
+    session.commit()
+    url = f"{prefix}/{post.id}"
+
+    response = authorized_client.get(url)
+    etag = response.headers["ETag"]
+    assert response.headers["Cache-Control"] == "private, no-cache"
+
+    response = authorized_client.get(url, headers={"If-None-Match": etag})
+    assert response.status_code == status.HTTP_304_NOT_MODIFIED
+    assert response.content == b""
+    assert response.headers["ETag"] == etag
+
+    authorized_client.patch(url, json={"title": "Edited", "content": "Content"})
+
+    response = authorized_client.get(url, headers={"If-None-Match": etag})
+    assert response.status_code == status.HTTP_200_OK
+    assert response.json()["title"] == "Edited"
+    assert response.headers["ETag"] != etag
+
+
+def test_get_post_etag_changes_when_access_is_lost(
+    authorized_client, session, test_users
+):
+    owner = test_users[0]
+    post = Post(title="Title", content="Content", owner_id=owner.id)
+    session.add(post)
+    session.commit()
+    url = f"{prefix}/{post.id}"
+    authorized_client.login_as(test_users[1].email, "User2Pass!")
+    etag = authorized_client.get(url).headers["ETag"]
+
+    authorized_client.login_as(owner.email, "User1Pass!")
+    authorized_client.patch("/api/v1/users/me", json={"is_private": True})
+    authorized_client.login_as(test_users[1].email, "User2Pass!")
+
+    response = authorized_client.get(url, headers={"If-None-Match": etag})
+    assert response.status_code == status.HTTP_403_FORBIDDEN
+
+
+# -----------------------------
+# Get posts batch tests
+# -----------------------------
+
+
+def test_get_posts_batch(authorized_client, session, test_users):
+    public_post = Post(title="Title", content="Content", owner_id=test_users[0].id)
+    private_post = Post(title="Title", content="Content", owner_id=test_users[1].id)
+    session.add_all([public_post, private_post])
+    session.commit()
+    url = f"{prefix}:batch?ids={private_post.id},9999&ids={public_post.id}"
+
+    response = authorized_client.get(url)
+
+    assert response.status_code == status.HTTP_200_OK
+    data = response.json()
+    # The private owner's post is filtered out rather than failing the batch
+    assert [post["id"] for post in data] == [public_post.id]
+    assert data[0]["owner"]["username"] == test_users[0].username
+    assert data[0]["reactions_by_type"]["fire"] == 0
+
+    authorized_client.login_as(test_users[1].email, "User2Pass!")
+    data = authorized_client.get(url).json()
+    assert [post["id"] for post in data] == [private_post.id, public_post.id]
+
+
+@pytest.mark.parametrize("ids", ["1,abc", "1,0", "2147483648"])
+def test_get_posts_batch_invalid_id(authorized_client, ids):
+    response = authorized_client.get(f"{prefix}:batch?ids={ids}")
+
+    assert response.status_code == status.HTTP_422_UNPROCESSABLE_CONTENT
+    assert response.json()["detail"]["error"] == "batch_invalid_item"
+    assert response.json()["field"] == "ids"
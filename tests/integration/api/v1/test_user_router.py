@@ -1,6 +1,8 @@
 import pytest  # noqa: F401
 from fastapi import status
 
+from app.core.config import settings
+
 prefix = "/api/v1/users"
 
 # -----------------------------
@@ -91,6 +93,28 @@ def test_search_users(authorized_client):
     assert isinstance(data, list)
 
 
+def test_search_users_cursor_pagination(authorized_client, test_users):
+    response = authorized_client.get(f"{prefix}?query=example&limit=1")
+
+    assert response.status_code == status.HTTP_200_OK
+    assert len(response.json()) == 1
+    assert response.headers["X-Has-More"] == "true"
+
+    cursor = response.headers["X-Next-Cursor"]
+    response = authorized_client.get(f"{prefix}?query=example&limit=1&cursor={cursor}")
+
+    assert response.status_code == status.HTTP_200_OK
+    assert len(response.json()) == 1
+    assert response.headers["X-Has-More"] == "false"
+
+
+def test_search_users_invalid_cursor(authorized_client):
+    response = authorized_client.get(f"{prefix}?query=example&cursor=bogus")
+
+    assert response.status_code == status.HTTP_400_BAD_REQUEST
+    assert response.json()["detail"]["error"] == "invalid_cursor"
+
+
 # -----------------------------
 # Get user by username tests
 # -----------------------------
@@ -110,6 +134,54 @@ def test_get_user_by_username_not_found(authorized_client):
     assert response.json()["detail"]["error"] == "user_not_found"
 
 
+def test_get_user_by_username_revalidates_with_etag(authorized_client, test_users):
+    url = f"{prefix}/{test_users[1].username}"
+    etag = authorized_client.get(url).headers["ETag"]
+
+    response = authorized_client.get(url, headers={"If-None-Match": etag})
+    assert response.status_code == status.HTTP_304_NOT_MODIFIED
+
+    authorized_client.post(f"/api/v1/follows/{test_users[1].id}/follow")
+    authorized_client.login_as(test_users[1].email, "User2Pass!")
+    authorized_client.patch(f"/api/v1/follows/requests/{test_users[0].id}/accept")
+    authorized_client.login_as(test_users[0].email, "User1Pass!")
+
+    response = authorized_client.get(url, headers={"If-None-Match": etag})
+    assert response.status_code == status.HTTP_200_OK
+    assert response.json()["is_following"] is True
+    assert response.headers["ETag"] != etag
+
+
+# -----------------------------
+# Get users batch tests
+# -----------------------------
+
+
+def test_get_users_batch(authorized_client, test_users):
+    usernames = [test_users[1].username, "non_existent_user", test_users[0].username]
+
+    response = authorized_client.get(
+        f"{prefix}:batch",
+        params={"usernames": [",".join(usernames[:2]), usernames[2]]},
+    )
+
+    assert response.status_code == status.HTTP_200_OK
+    data = response.json()
+    assert [user["username"] for user in data] == [usernames[0], usernames[2]]
+    assert data[0]["is_following"] is False
+    assert data[1]["is_following"] is None
+
+
+def test_get_users_batch_too_large(authorized_client):
+    usernames = ",".join(f"user{i}" for i in range(settings.BATCH_MAX_ITEMS + 1))
+
+    response = authorized_client.get(f"{prefix}:batch?usernames={usernames}")
+
+    assert response.status_code == status.HTTP_400_BAD_REQUEST
+    assert response.json()["detail"]["error"] == "batch_too_large"
+    assert response.json()["field"] == "usernames"
+
+
 # -----------------------------
 # Get user followers tests
 # -----------------------------
@@ -152,6 +224,24 @@ def test_get_user_posts(authorized_client, user_with_posts):
     assert isinstance(data, list)
 
 
+def test_get_user_posts_cursor_pagination(authorized_client, user_with_posts):
+    url = f"{prefix}/{user_with_posts.username}/posts"
+    first = authorized_client.get(f"{url}?limit=1")
+
+    assert first.status_code == status.HTTP_200_OK
+    assert first.headers["X-Has-More"] == "true"
+
+    second = authorized_client.get(
+        f"{url}?limit=1&cursor={first.headers['X-Next-Cursor']}"
+    )
+
+    assert second.status_code == status.HTTP_200_OK
+    assert second.headers["X-Has-More"] == "false"
+    assert "X-Next-Cursor" not in second.headers
+    ids = [first.json()[0]["id"], second.json()[0]["id"]]
+    assert ids == sorted(ids, reverse=True)
+
+
 # -----------------------------
 # Update user tests
 # -----------------------------
@@ -0,0 +1,109 @@
+import pytest  # noqa: F401
+from sqlalchemy import create_engine, text
+
+from app.db.pool import InstrumentedQueuePool, instrument_pool, pool_status
+from app.db.routing import read_only_engine
+
+
+def make_engine(tmp_path, pre_ping_idle_seconds: int):
+    engine = create_engine(
+        f"sqlite:///{tmp_path / 'pool.db'}",
+        poolclass=InstrumentedQueuePool,
+        pool_size=2,
+        max_overflow=1,
+    )
+    instrument_pool(engine, pre_ping_idle_seconds)
+    return engine
+
+
+# -----------------------------
+# Pool metrics tests
+# -----------------------------
+
+
+def test_pool_status_tracks_checkouts_and_in_use(tmp_path):
+    engine = make_engine(tmp_path, pre_ping_idle_seconds=-1)
+
+    with engine.connect() as conn:
+        conn.execute(text("SELECT 1"))
+        status = pool_status(engine)
+        assert status["in_use"] == 1
+        assert status["size"] == 2
+
+    status = pool_status(engine)
+    assert status["in_use"] == 0
+    assert status["checkouts"] == 1
+    assert status["connections_opened"] == 1
+    assert status["checkout_wait_ms"]["max"] >= 0
+
+
+def test_pool_status_reports_overflow(tmp_path):
+    engine = make_engine(tmp_path, pre_ping_idle_seconds=-1)
+
+    connections = [engine.connect() for _ in range(3)]
+    assert pool_status(engine)["overflow"] == 1
+
+    for conn in connections:
+        conn.close()
+
+
+def test_pool_records_connection_lifetime_on_dispose(tmp_path):
+    engine = make_engine(tmp_path, pre_ping_idle_seconds=-1)
+
+    with engine.connect():
+        pass
+    engine.dispose()
+
+    status = pool_status(engine)
+    assert status["connections_closed"] == 1
+    assert status["checkouts"] == 1
+
+
+# -----------------------------
+# Idle-based pre-ping tests
+# -----------------------------
+
+
+def test_pre_ping_skipped_for_recently_used_connections(tmp_path):
+    engine = make_engine(tmp_path, pre_ping_idle_seconds=60)
+
+    for _ in range(3):
+        with engine.connect():
+            pass
+
+    assert pool_status(engine)["pre_pings"] == 0
+
+
+def test_pre_ping_on_every_checkout_when_threshold_is_zero(tmp_path):
+    engine = make_engine(tmp_path, pre_ping_idle_seconds=0)
+
+    with engine.connect():
+        pass
+    with engine.connect():
+        pass
+
+    status = pool_status(engine)
+    assert status["pre_pings"] >= 1
+    assert status["pre_ping_failures"] == 0
+
+
+def test_pre_ping_uses_dialect_ping_for_read_only_checkouts(tmp_path, monkeypatch):
+    engine = make_engine(tmp_path, pre_ping_idle_seconds=0)
+    with engine.connect():
+        pass
+    pre_pings = pool_status(engine)["pre_pings"]
+    pings = []
+
+    def do_ping(dbapi_connection):
+        pings.append(dbapi_connection)
+        # A raw ping would leave psycopg INTRANS and break SET read_only
+        assert not dbapi_connection.in_transaction
+        return True
+
+    monkeypatch.setattr(engine.dialect, "do_ping", do_ping)
+
+    with read_only_engine(engine).connect() as conn:
+        assert conn.execute(text("SELECT 1")).scalar() == 1
+
+    assert len(pings) == 1
+    assert pool_status(engine)["pre_pings"] == pre_pings + 1
@@ -0,0 +1,113 @@
+import time
+
+import pytest  # noqa: F401
+from fastapi import Request, Response
+from sqlalchemy import create_engine, text
+from sqlalchemy.orm import sessionmaker
+
+from app.db.routing import (
+    PRIMARY_UNTIL_COOKIE,
+    PRIMARY_UNTIL_HEADER,
+    RoutingSession,
+    route_request,
+)
+
+
+def make_request(method: str = "GET", headers: dict | None = None) -> Request:
+    raw_headers = [
+        (name.lower().encode(), value.encode())
+        for name, value in (headers or {}).items()
+    ]
+    return Request({"type": "http", "method": method, "headers": raw_headers})
+
+
+def make_database(tmp_path, name: str):
+    engine = create_engine(f"sqlite:///{tmp_path / name}.db")
+    with engine.begin() as conn:
+        conn.execute(text("CREATE TABLE marker (name TEXT)"))
+        conn.execute(text("INSERT INTO marker VALUES (:name)"), {"name": name})
+    return engine
+
+
+# -----------------------------
+# Request routing tests
+# -----------------------------
+
+
+def test_route_request_without_replicas_uses_primary():
+    info = route_request(make_request("GET"), Response(), [], sticky_seconds=10)
+    assert info == {}
+
+
+def test_route_request_read_goes_to_replica():
+    replica = object()
+    info = route_request(make_request("GET"), Response(), [replica], 10)
+    assert info == {"replica": replica}
+
+
+def test_route_request_write_goes_to_primary_and_sets_sticky_marker():
+    response = Response()
+    info = route_request(make_request("POST"), response, [object()], 10)
+
+    assert info == {}
+    assert PRIMARY_UNTIL_COOKIE in response.headers["set-cookie"]
+    assert float(response.headers[PRIMARY_UNTIL_HEADER]) > time.time()
+
+
+def test_route_request_read_after_write_sticks_to_primary():
+    until = f"{time.time() + 10:.3f}"
+    cookie_request = make_request("GET", {"cookie": f"{PRIMARY_UNTIL_COOKIE}={until}"})
+    header_request = make_request("GET", {PRIMARY_UNTIL_HEADER: until})
+
+    assert route_request(cookie_request, Response(), [object()], 10) == {}
+    assert route_request(header_request, Response(), [object()], 10) == {}
+
+
+def test_route_request_expired_sticky_marker_uses_replica():
+    expired = f"{time.time() - 1:.3f}"
+    request = make_request("GET", {"cookie": f"{PRIMARY_UNTIL_COOKIE}={expired}"})
+    replica = object()
+
+    assert route_request(request, Response(), [replica], 10) == {"replica": replica}
+
+
+# -----------------------------
+# Routing session tests
+# -----------------------------
+
+
+def test_routing_session_reads_from_assigned_replica(tmp_path):
+    primary = make_database(tmp_path, "primary")
+    replica = make_database(tmp_path, "replica")
+    SessionLocal = sessionmaker(class_=RoutingSession, bind=primary)
+
+    with SessionLocal(info={"replica": replica}) as db:
+        assert db.execute(text("SELECT name FROM marker")).scalar() == "replica"
+
+    with SessionLocal() as db:
+        assert db.execute(text("SELECT name FROM marker")).scalar() == "primary"
+
+
+# -----------------------------
+# Read-only transaction tests
+# -----------------------------
+
+
+def test_route_request_marks_reads_read_only():
+    info = route_request(make_request("GET"), Response(), [], 10, True)
+    assert info == {"read_only": True}
+
+
+def test_route_request_never_marks_writes_read_only():
+    info = route_request(make_request("PATCH"), Response(), [], 10, True)
+    assert info == {}
+
+
+def test_routing_session_read_only_binds_read_only_engine(tmp_path):
+    primary = make_database(tmp_path, "primary")
+    SessionLocal = sessionmaker(class_=RoutingSession, bind=primary)
+
+    with SessionLocal(info={"read_only": True}) as db:
+        bind = db.get_bind()
+        assert bind.get_execution_options()["postgresql_readonly"] is True
+        assert db.execute(text("SELECT name FROM marker")).scalar() == "primary"
@@ -0,0 +1,51 @@
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+ROOT = Path(__file__).resolve().parents[3]
+
+# -----------------------------
+# Script smoke tests
+# -----------------------------
+
+
+@pytest.mark.parametrize(
+    "script", ["index_advisor.py", "rebuild_timelines.py", "reconcile_counters.py"]
+)
+def test_script_imports_and_parses_arguments(script):
+    # A fresh interpreter, since the test session has already imported app
+    # and would hide import cycles the script runs into on its own
+    result = subprocess.run(
+        [sys.executable, str(ROOT / "scripts" / script), "--help"],
+        capture_output=True,
+        text=True,
+        timeout=60,
+        check=False,
+    )
+
+    assert result.returncode == 0, result.stderr
+    assert "usage:" in result.stdout
+
+
+@pytest.mark.parametrize(
+    "module",
+    [
+        "benchmarks.post_detail_benchmark",
+        "benchmarks.timeline_benchmark",
+        "benchmarks.username_search_benchmark",
+    ],
+)
+def test_benchmark_imports_and_parses_arguments(module):
+    result = subprocess.run(
+        [sys.executable, "-m", module, "--help"],
+        capture_output=True,
+        text=True,
+        timeout=60,
+        check=False,
+        cwd=ROOT,
+    )
+
+    assert result.returncode == 0, result.stderr
+    assert "usage:" in result.stdout
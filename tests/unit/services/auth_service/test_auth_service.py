@@ -1,8 +1,19 @@
+from datetime import datetime, timedelta, timezone
 from unittest.mock import Mock
 
 import pytest
+from pwdlib import PasswordHash
+from pwdlib.hashers.argon2 import Argon2Hasher
 
-from app.core.exceptions.auth import AuthInvalidLoginCredentials
+from app.core.exceptions.auth import (
+    AuthInvalidJWT,
+    AuthInvalidLoginCredentials,
+    AuthInvalidRefreshToken,
+    AuthRefreshTokenReused,
+)
+from app.core.security.jwt import verify_access_token
+from app.core.security.password import pwd_context, verify_password
+from app.db.models import RefreshToken
 from app.services.auth_service import AuthService
 
 # -----------------------------
@@ -41,3 +52,115 @@ def test_login_user_incorrect_password(auth_service: AuthService, test_users):
 
     with pytest.raises(AuthInvalidLoginCredentials):
         auth_service.login_user(credentials)
+
+
+def test_login_user_rehashes_outdated_hash(auth_service, session, test_users):
+    user = test_users[0]
+    weak_context = PasswordHash((Argon2Hasher(time_cost=1, memory_cost=8192),))
+    outdated = weak_context.hash("User1Pass!")
+    user.hashed_password = outdated
+    session.flush()
+
+    credentials = Mock()
+    credentials.username = user.email
+    credentials.password = "User1Pass!"
+    auth_service.login_user(credentials)
+
+    assert user.hashed_password != outdated
+    assert not pwd_context.current_hasher.check_needs_rehash(user.hashed_password)
+    assert verify_password("User1Pass!", user.hashed_password)
+
+
+def test_login_user_keeps_current_hash(auth_service, test_users):
+    user = test_users[0]
+    current = user.hashed_password
+
+    credentials = Mock()
+    credentials.username = user.email
+    credentials.password = "User1Pass!"
+    auth_service.login_user(credentials)
+
+    assert user.hashed_password == current
+
+
+# -----------------------------
+# Refresh token tests
+# -----------------------------
+
+
+def login(auth_service, user):
+    credentials = Mock()
+    credentials.username = user.email
+    credentials.password = "User1Pass!"
+    return auth_service.login_user(credentials)
+
+
+def test_login_user_starts_token_family(auth_service, session, test_users):
+    tokens = login(auth_service, test_users[0])
+
+    row = session.query(RefreshToken).one()
+    assert tokens["refresh_token"]
+    assert row.token_hash != tokens["refresh_token"]
+    assert row.user_id == test_users[0].id
+    assert row.used_at is None
+
+
+def test_refresh_tokens_rotates(auth_service, session, test_users):
+    tokens = login(auth_service, test_users[0])
+
+    rotated = auth_service.refresh_tokens(tokens["refresh_token"])
+
+    assert rotated["refresh_token"] != tokens["refresh_token"]
+    assert verify_access_token(rotated["access_token"]).user_id == test_users[0].id
+    rows = session.query(RefreshToken).order_by(RefreshToken.id).all()
+    assert len(rows) == 2
+    assert rows[0].used_at is not None
+    assert rows[0].family_id == rows[1].family_id
+
+
+def test_refresh_tokens_reuse_revokes_family(auth_service, session, test_users):
+    tokens = login(auth_service, test_users[0])
+    rotated = auth_service.refresh_tokens(tokens["refresh_token"])
+
+    with pytest.raises(AuthRefreshTokenReused):
+        auth_service.refresh_tokens(tokens["refresh_token"])
+
+    session.expire_all()
+    assert all(row.revoked_at for row in session.query(RefreshToken))
+    # Both access tokens of the family are revoked without a DB lookup
+    for access_token in (tokens["access_token"], rotated["access_token"]):
+        with pytest.raises(AuthInvalidJWT):
+            verify_access_token(access_token)
+    # The newest refresh token is dead too
+    with pytest.raises(AuthInvalidRefreshToken):
+        auth_service.refresh_tokens(rotated["refresh_token"])
+
+
+def test_refresh_tokens_unknown(auth_service):
+    with pytest.raises(AuthInvalidRefreshToken):
+        auth_service.refresh_tokens("not-a-token")
+
+
+def test_refresh_tokens_expired(auth_service, session, test_users):
+    tokens = login(auth_service, test_users[0])
+    row = session.query(RefreshToken).one()
+    row.expires_at = datetime.now(timezone.utc) - timedelta(seconds=1)
+    session.flush()
+
+    with pytest.raises(AuthInvalidRefreshToken):
+        auth_service.refresh_tokens(tokens["refresh_token"])
+
+
+def test_logout_user_revokes_family_only(auth_service, test_users):
+    first = login(auth_service, test_users[0])
+    second = login(auth_service, test_users[0])
+
+    auth_service.logout_user(first["refresh_token"])
+
+    with pytest.raises(AuthInvalidJWT):
+        verify_access_token(first["access_token"])
+    with pytest.raises(AuthInvalidRefreshToken):
+        auth_service.refresh_tokens(first["refresh_token"])
+    # Another login of the same user is untouched
+    assert verify_access_token(second["access_token"]).user_id == test_users[0].id
+    assert auth_service.refresh_tokens(second["refresh_token"])
@@ -0,0 +1,119 @@
+import pytest
+from sqlalchemy.orm import Session
+
+from app.api.v1.schemas.comment import CommentCreate
+from app.api.v1.schemas.post import PostCreate
+from app.core.exceptions.comment import CommentNotFound
+from app.db.models.post_counters import PostCounters
+from app.services.comment_service import CommentService
+from app.services.post_service import PostService
+
+# -----------------------------
+# Get post comments tests
+# -----------------------------
+
+
+def test_get_post_comments_cursor_pagination(
+    comment_service: CommentService, post_service: PostService, test_users
+):
+    user = test_users[0]
+    post = post_service.create_post(user.id, PostCreate(title="Title", content="C"))
+    created = [
+        comment_service.add_post_comment(
+            user.id, post.id, CommentCreate(content=f"Comment {i}")
+        )
+        for i in range(5)
+    ]
+
+    seen = []
+    cursor = None
+    while True:
+        page = comment_service.get_post_comments(
+            user.id, post.id, limit=2, cursor=cursor
+        )
+        seen.extend(comment.id for comment in page)
+        if not page.has_more:
+            break
+        cursor = page.next_cursor
+
+    # Comments share a created_at within the transaction, so id breaks ties
+    assert seen == sorted((c.id for c in created), reverse=True)
+
+
+def test_get_post_comments_offset_pagination(
+    comment_service: CommentService, post_service: PostService, test_users
+):
+    user = test_users[0]
+    post = post_service.create_post(user.id, PostCreate(title="Title", content="C"))
+    for i in range(3):
+        comment_service.add_post_comment(
+            user.id, post.id, CommentCreate(content=f"Comment {i}")
+        )
+
+    page = comment_service.get_post_comments(user.id, post.id, limit=2, offset=2)
+
+    assert len(page) == 1
+    assert page.has_more is False
+
+
+def test_get_post_comments_statement_count_is_fixed(
+    session,
+    count_statements,
+    comment_service: CommentService,
+    post_service: PostService,
+    test_users,
+):
+    user_ids = [user.id for user in test_users]
+    post = post_service.create_post(user_ids[0], PostCreate(title="Title", content="C"))
+    for i in range(6):
+        comment_service.add_post_comment(
+            user_ids[i % 2], post.id, CommentCreate(content=f"Comment {i}")
+        )
+    post_id = post.id
+    session.commit()
+
+    with count_statements() as statements:
+        page = comment_service.get_post_comments(user_ids[0], post_id, limit=5)
+
+    assert len(page) == 5
+    # One query for the page, one for all of its owners
+    assert len(statements) == 2
+
+
+# -----------------------------
+# Delete post comment tests
+# -----------------------------
+
+
+def test_delete_post_comment_concurrent_delete_adjusts_count_once(
+    session,
+    monkeypatch,
+    comment_service: CommentService,
+    post_service: PostService,
+    test_users,
+):
+    user_id = test_users[0].id
+    post_id = post_service.create_post(
+        user_id, PostCreate(title="Title", content="C")
+    ).id
+    comment_id = comment_service.add_post_comment(
+        user_id, post_id, CommentCreate(content="Comment")
+    ).id
+    session.commit()
+    get_comment = comment_service._get_comment
+
+    def get_comment_then_lose_race(*args):
+        # A concurrent request deletes the comment right after this one read it
+        comment = get_comment(*args)
+        with Session(session.get_bind()) as other:
+            CommentService(other).delete_post_comment(user_id, post_id, comment_id)
+            other.commit()
+        return comment
+
+    monkeypatch.setattr(comment_service, "_get_comment", get_comment_then_lose_race)
+
+    with pytest.raises(CommentNotFound):
+        comment_service.delete_post_comment(user_id, post_id, comment_id)
+
+    post_counters = session.get(PostCounters, post_id, populate_existing=True)
+    assert post_counters.comments_count == 0
@@ -1,4 +1,5 @@
-import pytest  # noqa: F401
+import pytest
+from sqlalchemy.orm import Session
 
 from app.core.exceptions.follow import (
     FollowAlreadyAccepted,
@@ -76,6 +77,11 @@ def test_follow_user_public_user(session, follow_service: FollowService, test_us
     assert follow is not None
     assert follow.accepted
 
+    session.refresh(current_user)
+    session.refresh(public_user)
+    assert current_user.following_count == 1
+    assert public_user.followers_count == 1
+
 
 def test_follow_user_user_is_self(follow_service: FollowService, test_users):
     current_user = test_users[0]
@@ -116,6 +122,11 @@ def test_unfollow_user_success(
     follow = session.get(Follow, (current_user.id, user_to_unfollow.id))
     assert follow is None
 
+    session.refresh(current_user)
+    session.refresh(user_to_unfollow)
+    assert current_user.following_count == 1
+    assert user_to_unfollow.followers_count == 0
+
 
 def test_unfollow_follow_not_accepted(
     follow_service: FollowService, test_users_with_follow
@@ -129,12 +140,35 @@ def test_unfollow_follow_not_accepted(
         )
 
 
+def test_unfollow_user_concurrent_unfollow_adjusts_counts_once(
+    session, follow_service: FollowService, test_users_with_follow
+):
+    current_user = test_users_with_follow["user1"]
+    user_to_unfollow = test_users_with_follow["user2"]
+    # This request has read the follow when a concurrent one removes it
+    follow = follow_service._get_follow(current_user.id, user_to_unfollow.id)
+    with Session(session.get_bind()) as other:
+        FollowService(other).unfollow_user(current_user.id, user_to_unfollow.id)
+        other.commit()
+    assert follow.accepted  # Still the stale read
+
+    with pytest.raises(FollowNotFound):
+        follow_service.unfollow_user(current_user.id, user_to_unfollow.id)
+
+    session.refresh(current_user)
+    session.refresh(user_to_unfollow)
+    assert current_user.following_count == 1
+    assert user_to_unfollow.followers_count == 0
+
+
 # -----------------------------
 # Accept follow tests
 # -----------------------------
 
 
-def test_accept_follow_success(follow_service: FollowService, test_users_with_follow):
+def test_accept_follow_success(
+    session, follow_service: FollowService, test_users_with_follow
+):
     current_user = test_users_with_follow["user1"]
     follower_user = test_users_with_follow["user5"]  # This user sent the follow request
 
@@ -148,6 +182,11 @@ def test_accept_follow_success(follow_service: FollowService, test_users_with_fo
 
     assert follow.accepted
 
+    session.refresh(current_user)
+    session.refresh(follower_user)
+    assert current_user.followers_count == 1
+    assert follower_user.following_count == 1
+
 
 def test_accept_follow_already_accepted(
     follow_service: FollowService, test_users_with_follow
@@ -161,6 +200,26 @@ def test_accept_follow_already_accepted(
         )
 
 
+def test_accept_follow_concurrent_accept_adjusts_counts_once(
+    session, follow_service: FollowService, test_users_with_follow
+):
+    current_user = test_users_with_follow["user1"]
+    follower_user = test_users_with_follow["user5"]
+    follow = follow_service._get_follow(follower_user.id, current_user.id)
+    with Session(session.get_bind()) as other:
+        FollowService(other).accept_follow_request(follower_user.id, current_user.id)
+        other.commit()
+    assert not follow.accepted  # Still the stale read
+
+    with pytest.raises(FollowAlreadyAccepted):
+        follow_service.accept_follow_request(follower_user.id, current_user.id)
+
+    session.refresh(current_user)
+    session.refresh(follower_user)
+    assert current_user.followers_count == 1
+    assert follower_user.following_count == 1
+
+
 # -----------------------------
 # Reject follow tests
 # -----------------------------
@@ -192,6 +251,25 @@ def test_reject_follow_already_accepted(
         )
 
 
+def test_reject_follow_concurrently_accepted_keeps_follow(
+    session, follow_service: FollowService, test_users_with_follow
+):
+    current_user = test_users_with_follow["user1"]
+    follower_user = test_users_with_follow["user5"]
+    follow = follow_service._get_follow(follower_user.id, current_user.id)
+    with Session(session.get_bind()) as other:
+        FollowService(other).accept_follow_request(follower_user.id, current_user.id)
+        other.commit()
+    assert not follow.accepted  # Still the stale read
+
+    with pytest.raises(FollowAlreadyAccepted):
+        follow_service.remove_pending_request(follower_user.id, current_user.id)
+
+    assert follow_service._get_follow(follower_user.id, current_user.id).accepted
+    session.refresh(current_user)
+    assert current_user.followers_count == 1
+
+
 # -----------------------------
 # Get follow tests
 # -----------------------------
@@ -0,0 +1,162 @@
+from app.api.v1.schemas.comment import CommentCreate
+from app.api.v1.schemas.post import PostCreate
+from app.api.v1.schemas.reaction import ReactionCreate, ReactionEdit
+from app.core.enums import ReactionType
+from app.db.models import Post, PostCounters
+from app.services.comment_service import CommentService
+from app.services.helpers.counter_helper import CounterHelper
+from app.services.post_service import PostService
+from app.services.reaction_service import ReactionService
+from app.services.user_service import UserService
+
+# -----------------------------
+# Posts count tests
+# -----------------------------
+
+
+def test_posts_count_follows_create_and_delete(
+    session, post_service: PostService, test_users
+):
+    user = test_users[0]
+
+    post = post_service.create_post(
+        user.id, PostCreate(title="Title", content="Content")
+    )
+    session.refresh(user)
+    assert user.posts_count == 1
+
+    post_service.delete_post(user.id, post.id)
+    session.refresh(user)
+    assert user.posts_count == 0
+
+
+# -----------------------------
+# Post counters tests
+# -----------------------------
+
+
+def test_post_counters_follow_comments(
+    session, comment_service: CommentService, post_service: PostService, test_users
+):
+    user = test_users[0]
+    post = post_service.create_post(user.id, PostCreate(title="Title", content="C"))
+
+    comment = comment_service.add_post_comment(
+        user.id, post.id, CommentCreate(content="Nice")
+    )
+    comment_service.add_post_comment(user.id, post.id, CommentCreate(content="Again"))
+    assert post_service.get_post(user.id, post.id).comments_count == 2
+
+    comment_service.delete_post_comment(user.id, post.id, comment.id)
+    assert post_service.get_post(user.id, post.id).comments_count == 1
+
+
+def test_post_counters_follow_reactions(
+    reaction_service: ReactionService, post_service: PostService, test_users
+):
+    user1, user2 = test_users
+    post = post_service.create_post(user1.id, PostCreate(title="Title", content="C"))
+
+    reaction_service.add_post_reaction(
+        user1.id, post.id, ReactionCreate(type=ReactionType.like)
+    )
+    reaction_service.add_post_reaction(
+        user2.id, post.id, ReactionCreate(type=ReactionType.like)
+    )
+    reaction_service.update_post_reaction(
+        user2.id, post.id, ReactionEdit(type=ReactionType.fire)
+    )
+
+    post_out = post_service.get_post(user1.id, post.id)
+    assert post_out.reactions_count == 2
+    assert post_out.reactions_by_type[ReactionType.like] == 1
+    assert post_out.reactions_by_type[ReactionType.fire] == 1
+
+    reaction_service.delete_post_reaction(user1.id, post.id)
+
+    post_out = post_service.get_post(user1.id, post.id)
+    assert post_out.reactions_count == 1
+    assert post_out.reactions_by_type[ReactionType.like] == 0
+
+
+# -----------------------------
+# Delete user tests
+# -----------------------------
+
+
+def test_delete_user_releases_follow_counts(
+    session, user_service: UserService, test_users_with_follow
+):
+    user1 = test_users_with_follow["user1"]
+    user2 = test_users_with_follow["user2"]
+    user3 = test_users_with_follow["user3"]
+
+    user_service.delete_user(user1.id)
+
+    session.refresh(user2)
+    session.refresh(user3)
+    assert user2.followers_count == 0
+    assert user3.followers_count == 1
+    assert CounterHelper(session).reconcile_user_counters() == 0
+
+
+def test_delete_user_releases_post_counters(
+    session,
+    user_service: UserService,
+    comment_service: CommentService,
+    reaction_service: ReactionService,
+    post_service: PostService,
+    test_users,
+):
+    owner, other = test_users
+    post = post_service.create_post(owner.id, PostCreate(title="Title", content="C"))
+    comment_service.add_post_comment(other.id, post.id, CommentCreate(content="Hi"))
+    reaction_service.add_post_reaction(
+        other.id, post.id, ReactionCreate(type=ReactionType.heart)
+    )
+
+    user_service.delete_user(other.id)
+
+    post_out = post_service.get_post(owner.id, post.id)
+    assert post_out.comments_count == 0
+    assert post_out.reactions_count == 0
+
+
+# -----------------------------
+# Reconcile tests
+# -----------------------------
+
+
+def test_reconcile_user_counters_fixes_drift(session, test_users_with_follow):
+    user1 = test_users_with_follow["user1"]
+    user3 = test_users_with_follow["user3"]
+    user1.following_count = 7
+    user3.followers_count = 0
+    session.flush()
+
+    fixed = CounterHelper(session).reconcile_user_counters()
+
+    assert fixed == 2
+    session.refresh(user1)
+    session.refresh(user3)
+    assert user1.following_count == 2
+    assert user3.followers_count == 2
+
+
+def test_reconcile_user_counters_noop_when_consistent(session, user_with_posts):
+    assert CounterHelper(session).reconcile_user_counters() == 0
+    session.refresh(user_with_posts)
+    assert user_with_posts.posts_count == 2
+
+
+def test_reconcile_post_counters_creates_and_fixes_rows(session, user_with_posts):
+    posts = session.query(Post).filter(Post.owner_id == user_with_posts.id).all()
+    session.delete(posts[0].counters)
+    posts[1].counters.like_count = 4
+    session.flush()
+
+    fixed = CounterHelper(session).reconcile_post_counters()
+
+    assert fixed == 2
+    assert session.query(PostCounters).count() == 2
+    assert session.get(PostCounters, posts[1].id).like_count == 0
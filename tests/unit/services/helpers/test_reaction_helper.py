@@ -12,13 +12,12 @@ from app.services.helpers.reaction_helper import ReactionHelper
 
 
 def test_get_reactions_by_type_with_some_reactions():
-    fake_rows = [
-        SimpleNamespace(type=ReactionType.like, count=3),
-        SimpleNamespace(type=ReactionType.heart, count=2),
-    ]
+    fake_counters = SimpleNamespace(
+        like_count=3, wow_count=0, heart_count=2, fire_count=0, sad_count=0
+    )
 
     db = Mock()
-    db.query().filter().group_by().all.return_value = fake_rows
+    db.get.return_value = fake_counters
 
     helper = ReactionHelper(db)
 
@@ -34,7 +33,7 @@ def test_get_reactions_by_type_with_some_reactions():
 
 def test_get_reactions_by_type_with_no_reactions():
     db = Mock()
-    db.query().filter().group_by().all.return_value = []
+    db.get.return_value = None
 
     helper = ReactionHelper(db)
 
@@ -0,0 +1,205 @@
+from sqlalchemy import func, select
+
+from app.api.v1.schemas.post import PostCreate
+from app.db.models import TimelineEntry
+from app.services.follow_service import FollowService
+from app.services.helpers.timeline_helper import TimelineHelper
+from app.services.post_service import PostService
+from app.services.timeline_fanout import TimelineFanout
+from tests.conftest import TestingSessionLocal
+
+
+def timeline(session, user_id):
+    return set(
+        session.scalars(
+            select(TimelineEntry.post_id).where(TimelineEntry.user_id == user_id)
+        )
+    )
+
+
+def create_post(post_service, owner, title="Title"):
+    return post_service.create_post(owner.id, PostCreate(title=title, content="C"))
+
+
+# -----------------------------
+# Fan-out on write tests
+# -----------------------------
+
+
+def test_create_post_fans_out_to_accepted_followers(
+    session, post_service: PostService, test_users_with_follow
+):
+    users = test_users_with_follow
+
+    post = create_post(post_service, users["user3"])
+    pending = create_post(post_service, users["user1"])
+
+    assert post.id in timeline(session, users["user1"].id)
+    assert post.id in timeline(session, users["user2"].id)
+    # user5's request to user1 is still pending
+    assert pending.id not in timeline(session, users["user5"].id)
+    assert timeline(session, users["user3"].id) == set()
+
+
+def test_fan_out_post_is_idempotent(
+    session, post_service: PostService, test_users_with_follow
+):
+    users = test_users_with_follow
+    post = create_post(post_service, users["user3"])
+
+    assert TimelineHelper(session).fan_out_post(post.id) == 0
+    assert session.scalar(select(func.count()).select_from(TimelineEntry)) == 2
+
+
+def test_large_accounts_are_not_fanned_out(
+    session, post_service: PostService, test_users_with_follow
+):
+    users = test_users_with_follow
+    post = create_post(post_service, users["user3"])
+    session.query(TimelineEntry).delete()
+
+    # user3 has two followers, so a threshold of two skips it
+    assert TimelineHelper(session, max_followers=2).fan_out_post(post.id) == 0
+    assert TimelineHelper(session, max_followers=3).fan_out_post(post.id) == 2
+
+
+def test_delete_post_removes_entries(
+    session, post_service: PostService, test_users_with_follow
+):
+    users = test_users_with_follow
+    post = create_post(post_service, users["user3"])
+
+    post_service.delete_post(users["user3"].id, post.id)
+    session.expire_all()
+
+    assert timeline(session, users["user1"].id) == set()
+
+
+# -----------------------------
+# Follow lifecycle tests
+# -----------------------------
+
+
+def test_follow_backfills_latest_posts(session, test_users_with_follow):
+    users = test_users_with_follow
+    post_service = PostService(session)
+    posts = [create_post(post_service, users["user6"], f"Post {i}") for i in range(3)]
+
+    helper = TimelineHelper(session, backfill_posts=2)
+    FollowService(session).follow_user(users["user4"].id, users["user6"].id)
+    session.query(TimelineEntry).delete()
+
+    assert helper.backfill_follow(users["user4"].id, users["user6"].id) == 2
+    assert timeline(session, users["user4"].id) == {p.id for p in posts[1:]}
+
+
+def test_accepting_request_backfills_and_unfollow_removes(
+    session, test_users_with_follow
+):
+    users = test_users_with_follow
+    follow_service = FollowService(session)
+    post = create_post(PostService(session), users["user1"])
+    assert timeline(session, users["user5"].id) == set()
+
+    follow_service.accept_follow_request(users["user5"].id, users["user1"].id)
+    assert timeline(session, users["user5"].id) == {post.id}
+
+    follow_service.unfollow_user(users["user5"].id, users["user1"].id)
+    assert timeline(session, users["user5"].id) == set()
+
+
+def test_rebuild_rematerializes_timeline(
+    session, post_service: PostService, test_users_with_follow
+):
+    users = test_users_with_follow
+    posts = {create_post(post_service, users[name]).id for name in ("user2", "user3")}
+    session.query(TimelineEntry).delete()
+
+    assert TimelineHelper(session).rebuild(users["user1"].id) == 2
+    assert timeline(session, users["user1"].id) == posts
+
+
+# -----------------------------
+# Hybrid read tests
+# -----------------------------
+
+
+def test_feed_merges_large_accounts_at_read_time(session, test_users_with_follow):
+    users = test_users_with_follow
+    post_service = PostService(session)
+    # user3 (two followers) is over the threshold, user2 (one) is not
+    post_service.timeline_helper = TimelineHelper(session, max_followers=2)
+    small = create_post(post_service, users["user2"])
+    large = create_post(post_service, users["user3"])
+    session.query(TimelineEntry).filter(TimelineEntry.post_id == large.id).delete()
+
+    feed = post_service.get_feed(users["user1"].id, limit=1)
+    assert [post.id for post in feed] == [large.id]
+    assert feed.has_more
+
+    feed = post_service.get_feed(users["user1"].id, limit=5, cursor=feed.next_cursor)
+    assert [post.id for post in feed] == [small.id]
+    assert not feed.has_more
+
+
+def test_feed_skips_entries_of_ended_follows(
+    session, post_service: PostService, test_users_with_follow
+):
+    users = test_users_with_follow
+    post = create_post(post_service, users["user2"])
+    FollowService(session).unfollow_user(users["user1"].id, users["user2"].id)
+    # As if a fan-out job committed after the unfollow removed the entries
+    TimelineHelper(session).backfill_follow(users["user1"].id, users["user2"].id)
+    session.add(
+        TimelineEntry(
+            user_id=users["user1"].id,
+            post_id=post.id,
+            owner_id=post.owner_id,
+            created_at=post.created_at,
+        )
+    )
+    session.flush()
+
+    assert post_service.get_feed(users["user1"].id, limit=5) == []
+
+
+# -----------------------------
+# Background worker tests
+# -----------------------------
+
+
+def test_fanout_worker_runs_jobs_after_commit(session, test_users_with_follow):
+    users = test_users_with_follow
+    fanout = TimelineFanout(
+        workers=1, queue_size=10, session_factory=TestingSessionLocal
+    )
+    post = create_post(PostService(session), users["user3"])
+    session.query(TimelineEntry).delete()
+    session.commit()
+
+    fanout.submit(session, "fan_out_post", post.id)
+    fanout.join()
+    assert fanout.status()["completed"] == 0
+
+    session.commit()
+    fanout.join()
+    fanout.shutdown()
+
+    status = fanout.status()
+    assert status["completed"] == 1
+    assert status["rows_written"] == 2
+    assert timeline(session, users["user1"].id) == {post.id}
+
+
+def test_fanout_worker_drops_jobs_when_queue_full(session, test_users_with_follow):
+    fanout = TimelineFanout(
+        workers=1, queue_size=1, session_factory=TestingSessionLocal
+    )
+    fanout._start = lambda: None  # keep the queue from draining
+
+    fanout.submit(session, "fan_out_post", 1)
+    fanout.submit(session, "fan_out_post", 2)
+    session.commit()
+
+    assert fanout.status()["queued"] == 1
+    assert fanout.status()["dropped"] == 1
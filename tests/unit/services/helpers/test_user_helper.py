@@ -92,3 +92,35 @@ def test_get_user_list_item_out_not_found():
 
     with pytest.raises(UserNotFound):
         helper.get_user_list_item_out(user_id=1, current_user_id=2)
+
+
+# -----------------------------
+# Get user list items tests
+# -----------------------------
+
+
+def test_get_user_list_items_out_success():
+    fake_rows = [
+        SimpleNamespace(id=1, username="alice", is_following=True, followers_count=5),
+        SimpleNamespace(id=2, username="bob", is_following=False, followers_count=0),
+    ]
+
+    db = Mock()
+    db.query().filter().all.return_value = fake_rows
+
+    helper = UserHelper(db)
+    result = helper.get_user_list_items_out([1, 2, 1], current_user_id=3)
+
+    assert set(result) == {1, 2}
+    assert result[1].username == "alice"
+    assert result[1].is_following is True
+    assert result[2].followers_count == 0
+
+
+def test_get_user_list_items_out_empty_ids():
+    db = Mock()
+
+    helper = UserHelper(db)
+
+    assert helper.get_user_list_items_out([], current_user_id=1) == {}
+    db.query.assert_not_called()
@@ -0,0 +1,275 @@
+import pytest
+
+from app.api.v1.schemas.comment import CommentCreate
+from app.api.v1.schemas.post import PostCreate, PostEdit
+from app.api.v1.schemas.reaction import ReactionCreate
+from app.api.v1.schemas.user import UserEdit
+from app.core.enums import ReactionType
+from app.core.exceptions.post import PostNotFound
+from app.core.exceptions.user import UserNotAllowedToViewResource
+from app.services.comment_service import CommentService
+from app.services.follow_service import FollowService
+from app.services.post_service import PostService
+from app.services.reaction_service import ReactionService
+from app.services.user_service import UserService
+
+# -----------------------------
+# Get post detail tests
+# -----------------------------
+
+
+def test_get_post_detail_matches_get_post(
+    post_service: PostService, test_users_with_follow
+):
+    owner = test_users_with_follow["user3"]
+    viewer = test_users_with_follow["user1"]
+    post = post_service.create_post(owner.id, PostCreate(title="Title", content="C"))
+
+    detail = post_service.get_post_detail(viewer.id, post.id)
+
+    assert detail == post_service.get_post(viewer.id, post.id)
+    assert detail.owner.is_following is True
+    assert detail.owner.followers_count == 2
+
+
+def test_get_post_detail_private_owner_follower_allowed(
+    session, post_service: PostService, test_users_with_follow
+):
+    owner = test_users_with_follow["user3"]
+    owner.is_private = True
+    session.flush()
+    post = post_service.create_post(owner.id, PostCreate(title="Title", content="C"))
+
+    detail = post_service.get_post_detail(test_users_with_follow["user2"].id, post.id)
+
+    assert detail.id == post.id
+
+
+def test_get_post_detail_private_owner_forbidden(
+    post_service: PostService, test_users_with_follow
+):
+    owner = test_users_with_follow["user4"]
+    post = post_service.create_post(owner.id, PostCreate(title="Title", content="C"))
+
+    with pytest.raises(UserNotAllowedToViewResource):
+        post_service.get_post_detail(test_users_with_follow["user1"].id, post.id)
+
+    # The owner can always see their own post
+    assert post_service.get_post_detail(owner.id, post.id).id == post.id
+
+
+def test_get_post_detail_not_found(post_service: PostService, test_users):
+    with pytest.raises(PostNotFound):
+        post_service.get_post_detail(test_users[0].id, 9999)
+
+
+def test_get_post_detail_runs_one_statement(
+    session, count_statements, post_service: PostService, test_users
+):
+    user_id = test_users[0].id
+    post_id = post_service.create_post(
+        user_id, PostCreate(title="Title", content="C")
+    ).id
+    session.commit()
+
+    with count_statements() as statements:
+        post_service.get_post_detail(user_id, post_id)
+
+    assert len(statements) == 1
+
+
+# -----------------------------
+# Get posts detail tests
+# -----------------------------
+
+
+def test_get_posts_detail_matches_get_post_detail_in_request_order(
+    post_service: PostService, test_users_with_follow
+):
+    viewer = test_users_with_follow["user1"]
+    post_ids = [
+        post_service.create_post(
+            test_users_with_follow[name].id, PostCreate(title=name, content="C")
+        ).id
+        for name in ("user2", "user3", "user1")
+    ]
+    post_ids.reverse()
+
+    details = post_service.get_posts_detail(viewer.id, post_ids)
+
+    assert details == [
+        post_service.get_post_detail(viewer.id, post_id) for post_id in post_ids
+    ]
+
+
+def test_get_posts_detail_omits_missing_and_hidden_posts(
+    post_service: PostService, test_users_with_follow
+):
+    viewer = test_users_with_follow["user1"]
+    private_owner = test_users_with_follow["user4"]
+    visible = post_service.create_post(
+        test_users_with_follow["user2"].id, PostCreate(title="Title", content="C")
+    )
+    hidden = post_service.create_post(
+        private_owner.id, PostCreate(title="Title", content="C")
+    )
+
+    details = post_service.get_posts_detail(viewer.id, [hidden.id, 9999, visible.id])
+
+    assert [detail.id for detail in details] == [visible.id]
+    # The owner can always see their own post
+    assert [
+        detail.id
+        for detail in post_service.get_posts_detail(private_owner.id, [hidden.id])
+    ] == [hidden.id]
+
+
+def test_get_posts_detail_runs_one_statement_for_any_batch_size(
+    session, count_statements, post_service: PostService, test_users_with_follow
+):
+    viewer_id = test_users_with_follow["user1"].id
+    post_ids = [
+        post_service.create_post(user.id, PostCreate(title="Title", content="C")).id
+        for user in test_users_with_follow.values()
+    ]
+    session.commit()
+
+    for batch in (post_ids[:1], post_ids):
+        with count_statements() as statements:
+            post_service.get_posts_detail(viewer_id, batch)
+        assert len(statements) == 1
+
+
+# -----------------------------
+# Post detail cache tests
+# -----------------------------
+
+
+def test_get_post_detail_is_served_from_cache(
+    session, count_statements, post_service: PostService, test_users
+):
+    user_id = test_users[0].id
+    post_id = post_service.create_post(
+        user_id, PostCreate(title="Title", content="C")
+    ).id
+    session.commit()
+    post_service.get_post_detail(user_id, post_id)
+
+    with count_statements() as statements:
+        post_service.get_post_detail(user_id, post_id)
+
+    assert statements == []
+
+
+def test_reactions_and_comments_invalidate_cached_detail(
+    comment_service: CommentService,
+    reaction_service: ReactionService,
+    post_service: PostService,
+    test_users_with_follow,
+):
+    owner = test_users_with_follow["user3"]
+    viewer = test_users_with_follow["user1"]
+    post = post_service.create_post(owner.id, PostCreate(title="Title", content="C"))
+    post_service.get_post_detail(viewer.id, post.id)
+
+    reaction_service.add_post_reaction(
+        viewer.id, post.id, ReactionCreate(type=ReactionType.like)
+    )
+    comment_service.add_post_comment(owner.id, post.id, CommentCreate(content="Hi"))
+
+    detail = post_service.get_post_detail(viewer.id, post.id)
+    assert detail.user_reacted == ReactionType.like
+    assert detail.reactions_by_type["like"] == 1
+    assert detail.comments_count == 1
+
+
+def test_edits_and_privacy_invalidate_cached_detail(
+    session,
+    follow_service: FollowService,
+    post_service: PostService,
+    user_service: UserService,
+    test_users_with_follow,
+):
+    owner = test_users_with_follow["user3"]
+    viewer = test_users_with_follow["user1"]
+    post = post_service.create_post(owner.id, PostCreate(title="Title", content="C"))
+    post_service.get_post_detail(viewer.id, post.id)
+
+    post_service.update_post(owner.id, post.id, PostEdit(title="Edited", content="C"))
+    assert post_service.get_post_detail(viewer.id, post.id).title == "Edited"
+
+    user_service.update_user(owner.id, UserEdit(is_private=True))
+    follow_service.unfollow_user(viewer.id, owner.id)
+    with pytest.raises(UserNotAllowedToViewResource):
+        post_service.get_post_detail(viewer.id, post.id)
+
+    post_service.delete_post(owner.id, post.id)
+    with pytest.raises(PostNotFound):
+        post_service.get_post_detail(owner.id, post.id)
+
+
+# -----------------------------
+# Get feed tests
+# -----------------------------
+
+
+def make_posts(post_service, owner, count):
+    return [
+        post_service.create_post(
+            owner.id, PostCreate(title=f"{owner.username} {i}", content="C")
+        )
+        for i in range(count)
+    ]
+
+
+def test_get_feed_returns_accepted_followees_posts(
+    post_service: PostService, test_users_with_follow
+):
+    users = test_users_with_follow
+    followed = make_posts(post_service, users["user2"], 2) + make_posts(
+        post_service, users["user3"], 2
+    )
+    # Own posts, unfollowed users and pending requests stay out of the feed
+    make_posts(post_service, users["user1"], 1)
+    make_posts(post_service, users["user4"], 1)
+    make_posts(post_service, users["user6"], 1)
+
+    feed = post_service.get_feed(users["user1"].id, limit=10)
+
+    assert {post.id for post in feed} == {post.id for post in followed}
+    assert [post.id for post in feed] == sorted(
+        (post.id for post in feed), reverse=True
+    )
+    assert not feed.has_more
+    assert post_service.get_feed(users["user5"].id, limit=10) == []
+
+
+def test_get_feed_pages_with_cursor(post_service: PostService, test_users_with_follow):
+    users = test_users_with_follow
+    posts = make_posts(post_service, users["user2"], 3) + make_posts(
+        post_service, users["user3"], 2
+    )
+
+    seen, cursor = [], None
+    while True:
+        page = post_service.get_feed(users["user1"].id, limit=2, cursor=cursor)
+        seen.extend(post.id for post in page)
+        if not page.has_more:
+            break
+        cursor = page.next_cursor
+
+    assert len(seen) == len(set(seen)) == len(posts)
+
+
+def test_get_feed_runs_one_statement(
+    session, count_statements, post_service: PostService, test_users_with_follow
+):
+    users = test_users_with_follow
+    make_posts(post_service, users["user2"], 3)
+    viewer_id = users["user1"].id
+    session.commit()
+
+    with count_statements() as statements:
+        post_service.get_feed(viewer_id, limit=2)
+
+    assert len(statements) == 1
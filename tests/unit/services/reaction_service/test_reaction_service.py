@@ -0,0 +1,150 @@
+import pytest
+from sqlalchemy.orm import Session
+
+from app.api.v1.schemas.post import PostCreate
+from app.api.v1.schemas.reaction import ReactionCreate, ReactionEdit
+from app.core.enums import ReactionType
+from app.core.exceptions.reaction import ReactionNotFound
+from app.db.models.post_counters import PostCounters
+from app.services.post_service import PostService
+from app.services.reaction_service import ReactionService
+
+# -----------------------------
+# Get post reactions tests
+# -----------------------------
+
+
+def test_get_post_reactions_cursor_pagination(
+    reaction_service: ReactionService, post_service: PostService, test_users
+):
+    user1, user2 = test_users
+    post = post_service.create_post(user1.id, PostCreate(title="Title", content="C"))
+    for user in test_users:
+        reaction_service.add_post_reaction(
+            user.id, post.id, ReactionCreate(type=ReactionType.like)
+        )
+
+    first_page = reaction_service.get_post_reactions(user1.id, post.id, limit=1)
+    second_page = reaction_service.get_post_reactions(
+        user1.id, post.id, limit=1, cursor=first_page.next_cursor
+    )
+
+    assert [r.user_id for r in first_page] == [user1.id]
+    assert first_page.has_more is True
+    assert [r.user_id for r in second_page] == [user2.id]
+    assert second_page.has_more is False
+
+
+def test_get_post_reactions_statement_count_is_fixed(
+    session,
+    count_statements,
+    reaction_service: ReactionService,
+    post_service: PostService,
+    test_users,
+):
+    user_ids = [user.id for user in test_users]
+    post = post_service.create_post(user_ids[0], PostCreate(title="Title", content="C"))
+    for user_id in user_ids:
+        reaction_service.add_post_reaction(
+            user_id, post.id, ReactionCreate(type=ReactionType.wow)
+        )
+    post_id = post.id
+    session.commit()
+
+    with count_statements() as statements:
+        page = reaction_service.get_post_reactions(user_ids[0], post_id)
+
+    assert len(page) == 2
+    # One query for the page, one for all of its owners
+    assert len(statements) == 2
+
+
+# -----------------------------
+# Concurrent reaction change tests
+# -----------------------------
+
+
+@pytest.fixture
+def hearted_post(session, reaction_service: ReactionService, post_service, test_users):
+    """A committed post of test_users[0] with their heart reaction on it."""
+    user_id = test_users[0].id
+    post_id = post_service.create_post(
+        user_id, PostCreate(title="Title", content="C")
+    ).id
+    reaction_service.add_post_reaction(
+        user_id, post_id, ReactionCreate(type=ReactionType.heart)
+    )
+    session.commit()
+    return user_id, post_id
+
+
+def commit_concurrently(session, change) -> None:
+    """Run change(ReactionService) in another session and commit it."""
+    with Session(session.get_bind()) as other:
+        change(ReactionService(other))
+        other.commit()
+
+
+def counters(session, post_id: int) -> PostCounters:
+    return session.get(PostCounters, post_id, populate_existing=True)
+
+
+def test_delete_post_reaction_concurrent_delete_adjusts_count_once(
+    session, reaction_service: ReactionService, hearted_post
+):
+    user_id, post_id = hearted_post
+    # This request has read the reaction when a concurrent one deletes it
+    reaction = reaction_service._get_reaction(user_id, post_id)
+    commit_concurrently(
+        session, lambda other: other.delete_post_reaction(*hearted_post)
+    )
+    assert reaction.type == ReactionType.heart  # Still the stale read
+
+    with pytest.raises(ReactionNotFound):
+        reaction_service.delete_post_reaction(user_id, post_id)
+
+    assert counters(session, post_id).heart_count == 0
+
+
+def test_update_post_reaction_after_concurrent_switch_moves_one_count(
+    session, reaction_service: ReactionService, hearted_post
+):
+    user_id, post_id = hearted_post
+    reaction = reaction_service._get_reaction(user_id, post_id)
+    commit_concurrently(
+        session,
+        lambda other: other.update_post_reaction(
+            user_id, post_id, ReactionEdit(type=ReactionType.fire)
+        ),
+    )
+    assert reaction.type == ReactionType.heart  # Still the stale read
+
+    updated = reaction_service.update_post_reaction(
+        user_id, post_id, ReactionEdit(type=ReactionType.like)
+    )
+
+    assert updated.type == ReactionType.like
+    post_counters = counters(session, post_id)
+    assert post_counters.heart_count == 0
+    assert post_counters.fire_count == 0
+    assert post_counters.like_count == 1
+
+
+def test_update_post_reaction_after_concurrent_delete(
+    session, reaction_service: ReactionService, hearted_post
+):
+    user_id, post_id = hearted_post
+    reaction = reaction_service._get_reaction(user_id, post_id)
+    commit_concurrently(
+        session, lambda other: other.delete_post_reaction(*hearted_post)
+    )
+    assert reaction.type == ReactionType.heart  # Still the stale read
+
+    with pytest.raises(ReactionNotFound):
+        reaction_service.update_post_reaction(
+            user_id, post_id, ReactionEdit(type=ReactionType.like)
+        )
+
+    post_counters = counters(session, post_id)
+    assert post_counters.heart_count == 0
+    assert post_counters.like_count == 0
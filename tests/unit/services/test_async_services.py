@@ -0,0 +1,30 @@
+import asyncio
+from types import SimpleNamespace
+from unittest.mock import Mock
+
+import pytest
+
+from app.services.async_services import AsyncUserService
+
+# -----------------------------
+# Async service facade tests
+# -----------------------------
+
+
+def test_async_service_runs_sync_method_on_session():
+    fake_user = SimpleNamespace(id=1, username="alice")
+    db = Mock()
+    db.get.return_value = fake_user
+
+    service = AsyncUserService(db)
+    result = asyncio.run(service.get_current_user_settings(1))
+
+    assert result == fake_user
+    db.get.assert_called_once()
+
+
+def test_async_service_hides_private_methods():
+    service = AsyncUserService(Mock())
+
+    with pytest.raises(AttributeError):
+        getattr(service, "_get_public_user")
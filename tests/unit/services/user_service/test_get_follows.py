@@ -143,3 +143,25 @@ def test_get_user_following_target_has_no_followings(
 
     assert following == []
     assert len(following) == 0
+
+
+def test_get_user_followers_cursor_pagination(
+    user_service: UserService, test_users_with_follow
+):
+    target_user = test_users_with_follow["user3"]
+    current_user = test_users_with_follow["user4"]
+
+    first_page = user_service.get_user_followers(
+        current_user_id=current_user.id, target_user_id=target_user.id, limit=1
+    )
+    second_page = user_service.get_user_followers(
+        current_user_id=current_user.id,
+        target_user_id=target_user.id,
+        limit=1,
+        cursor=first_page.next_cursor,
+    )
+
+    assert [user.username for user in first_page] == ["user1"]
+    assert first_page.has_more is True
+    assert [user.username for user in second_page] == ["user2"]
+    assert second_page.has_more is False
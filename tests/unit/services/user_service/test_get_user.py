@@ -1,8 +1,13 @@
 import pytest
 
+from app.api.v1.schemas.post import PostCreate
+from app.api.v1.schemas.user import UserEdit
+from app.core.cache.service_cache import service_cache
 from app.core.exceptions.user import (
     UserNotFound,
 )
+from app.services.follow_service import FollowService
+from app.services.post_service import PostService
 from app.services.user_service import UserService
 
 # -----------------------------
@@ -40,6 +45,79 @@ def test_get_public_user_not_found(user_service: UserService, test_users):
         )
 
 
+# -----------------------------
+# Profile cache tests
+# -----------------------------
+
+
+def test_get_public_user_serves_cached_profile_per_viewer(
+    count_statements, user_service: UserService, test_users_with_follow
+):
+    users = test_users_with_follow
+    follower_id, target_id = users["user1"].id, users["user3"].id
+    user_service._get_public_user(users["user4"].id, "user3")
+
+    with count_statements() as statements:
+        follower = user_service._get_public_user(follower_id, "user3")
+    assert len(statements) == 1
+    assert follower.is_following is True
+    assert follower.followers_count == 2
+
+    with count_statements() as statements:
+        own = user_service._get_public_user(target_id, "user3")
+    assert statements == []
+    assert own.is_following is None
+    assert service_cache.stats()["namespaces"]["profile"]["hits"] == 2
+
+
+def test_follow_and_post_invalidate_cached_profiles(
+    session, user_service: UserService, test_users_with_follow
+):
+    users = test_users_with_follow
+    viewer, target = users["user4"], users["user3"]
+    user_service._get_public_user(viewer.id, target.username)
+    user_service._get_public_user(viewer.id, viewer.username)
+
+    FollowService(session).follow_user(viewer.id, target.id)
+    PostService(session).create_post(
+        target.id, PostCreate(title="Title", content="Content")
+    )
+
+    target_out = user_service._get_public_user(viewer.id, target.username)
+    assert target_out.followers_count == 3
+    assert target_out.posts_count == 1
+    assert target_out.is_following is True
+    assert (
+        user_service._get_public_user(viewer.id, viewer.username).following_count == 1
+    )
+
+
+def test_rename_invalidates_cached_profile(
+    user_service: UserService, test_users_with_follow
+):
+    users = test_users_with_follow
+    user = users["user2"]
+    user_service._get_public_user(user.id, "user2")
+
+    user_service.update_user(user.id, UserEdit(username="renamed"))
+
+    with pytest.raises(UserNotFound):
+        user_service._get_public_user(user.id, "user2")
+    assert user_service._get_public_user(user.id, "renamed").id == user.id
+
+
+def test_delete_user_invalidates_followed_profiles(
+    user_service: UserService, test_users_with_follow
+):
+    users = test_users_with_follow
+    viewer = users["user4"]
+    user_service._get_public_user(viewer.id, "user3")
+
+    user_service.delete_user(users["user1"].id)
+
+    assert user_service._get_public_user(viewer.id, "user3").followers_count == 1
+
+
 # -----------------------------
 # Get current user tests
 # -----------------------------
@@ -103,6 +181,58 @@ def test_search_users_not_found(user_service: UserService, test_users):
     assert results == []
 
 
+def test_search_users_ranks_exact_then_prefix_matches(
+    user_service: UserService, test_users_with_follow
+):
+    current_user = test_users_with_follow["user1"]
+
+    results = user_service.search_users(current_user.id, "USER2")
+
+    assert [user_out.username for user_out in results] == ["user2"]
+
+    results = user_service.search_users(current_user.id, "user")
+
+    assert len(results) == 6
+    assert results.has_more is False
+
+
+def test_search_users_cursor_pagination(
+    user_service: UserService, test_users_with_follow
+):
+    current_user = test_users_with_follow["user1"]
+
+    first_page = user_service.search_users(current_user.id, "user", limit=4)
+    second_page = user_service.search_users(
+        current_user.id, "user", limit=4, cursor=first_page.next_cursor
+    )
+
+    assert len(first_page) == 4
+    assert first_page.has_more is True
+    assert len(second_page) == 2
+    assert second_page.has_more is False
+
+    usernames = [u.username for u in first_page] + [u.username for u in second_page]
+    assert sorted(usernames) == [f"user{i}" for i in range(1, 7)]
+
+
+def test_search_users_offset_pagination(
+    user_service: UserService, test_users_with_follow
+):
+    current_user = test_users_with_follow["user1"]
+
+    results = user_service.search_users(current_user.id, "user", limit=2, offset=4)
+
+    assert len(results) == 2
+
+
+def test_search_users_escapes_like_wildcards(user_service: UserService, test_users):
+    current_user = test_users[0]
+
+    results = user_service.search_users(current_user.id, "%")
+
+    assert results == []
+
+
 # -----------------------------
 # Get user by username tests
 # -----------------------------
@@ -120,3 +250,43 @@ def test_get_user_by_username_success(user_service: UserService, test_users):
     assert user_out.posts_count == 0
     assert user_out.following_count == 0
     assert user_out.followers_count == 0
+
+
+# -----------------------------
+# Get users by usernames tests
+# -----------------------------
+
+
+def test_get_users_by_usernames_in_request_order(
+    user_service: UserService, test_users_with_follow
+):
+    viewer = test_users_with_follow["user1"]
+    usernames = ["user4", "user1", "user3"]
+
+    users = user_service.get_users_by_usernames(viewer.id, usernames)
+
+    assert users == [
+        user_service.get_user_by_username(viewer.id, username) for username in usernames
+    ]
+    assert [user.is_following for user in users] == [False, None, True]
+
+
+def test_get_users_by_usernames_omits_unknown(user_service: UserService, test_users):
+    current_user = test_users[0]
+
+    users = user_service.get_users_by_usernames(
+        current_user.id, ["nonexistent", test_users[1].username]
+    )
+
+    assert [user.id for user in users] == [test_users[1].id]
+
+
+def test_get_users_by_usernames_runs_one_statement_for_any_batch_size(
+    count_statements, user_service: UserService, test_users_with_follow
+):
+    viewer_id = test_users_with_follow["user1"].id
+
+    for usernames in (["user2"], list(test_users_with_follow)):
+        with count_statements() as statements:
+            user_service.get_users_by_usernames(viewer_id, usernames)
+        assert len(statements) == 1
@@ -6,6 +6,7 @@ from app.core.exceptions.user import (
     UsernameAlreadyExists,
     UserPasswordUnchanged,
 )
+from app.core.security.principal import load_principal, principal_cache
 from app.services.user_service import UserService
 
 # -----------------------------
@@ -28,6 +29,19 @@ def test_update_user_success(user_service: UserService, test_users):
     assert updated_user.is_private
 
 
+def test_update_user_invalidates_cached_principal(
+    session, user_service: UserService, test_users
+):
+    current_user = test_users[0]
+    load_principal(session, current_user.id)
+
+    user_service.update_user(current_user.id, UserEdit(username="renamed"))
+    session.commit()
+
+    assert principal_cache.stats()["size"] == 0
+    assert load_principal(session, current_user.id).username == "renamed"
+
+
 def test_update_user_username_already_exists(user_service: UserService, test_users):
     current_user = test_users[0]
     existent_username = test_users[1].username
@@ -111,3 +125,15 @@ def test_delete_user_success(user_service: UserService, test_users):
 
     response = user_service.delete_user(current_user.id)
     assert response is None  # delete_user returns None on success
+
+
+def test_delete_user_invalidates_cached_principal(
+    session, user_service: UserService, test_users
+):
+    user_id = test_users[0].id
+    load_principal(session, user_id)
+
+    user_service.delete_user(user_id)
+    session.commit()
+
+    assert load_principal(session, user_id) is None
@@ -0,0 +1,61 @@
+import pytest
+
+from app.core.exceptions.batch import BatchEmpty, BatchInvalidItem, BatchTooLarge
+from app.utils.batch import MAX_ID, parse_batch, positive_id
+
+# -----------------------------
+# Batch parameter tests
+# -----------------------------
+
+
+def test_parse_batch_accepts_repeated_and_comma_separated_values():
+    assert parse_batch(["b,a", " c ", "a,,b"], "usernames", 10) == ["b", "a", "c"]
+
+
+def test_parse_batch_casts_items():
+    assert parse_batch(["3,1", "3"], "ids", 10, cast=int) == [3, 1]
+
+
+def test_parse_batch_rejects_invalid_items():
+    with pytest.raises(BatchInvalidItem) as exc_info:
+        parse_batch(["1,x"], "ids", 10, cast=int)
+
+    assert exc_info.value.field == "ids"
+    assert exc_info.value.status_code == 422
+
+
+def test_parse_batch_rejects_empty_batches():
+    with pytest.raises(BatchEmpty):
+        parse_batch([" , "], "usernames", 10)
+
+
+def test_parse_batch_limits_items():
+    assert parse_batch(["a,b"], "usernames", 2) == ["a", "b"]
+
+    with pytest.raises(BatchTooLarge) as exc_info:
+        parse_batch(["a,b,a"], "usernames", 2)
+
+    assert exc_info.value.field == "usernames"
+    # The class default is left alone
+    assert BatchTooLarge.field is None
+
+
+def test_parse_batch_stops_at_the_first_item_over_the_limit():
+    # Anything past the third item would fail if it were parsed
+    with pytest.raises(BatchTooLarge):
+        parse_batch(["1,2,3,oops", None], "ids", 2, cast=int)
+
+
+# -----------------------------
+# Batch id tests
+# -----------------------------
+
+
+@pytest.mark.parametrize("raw", ["0", "-1", str(MAX_ID + 1), "9" * 30])
+def test_positive_id_rejects_ids_outside_int4(raw):
+    with pytest.raises(BatchInvalidItem):
+        parse_batch([raw], "ids", 10, cast=positive_id)
+
+
+def test_positive_id_accepts_the_int4_range():
+    assert parse_batch([f"1,{MAX_ID}"], "ids", 10, cast=positive_id) == [1, MAX_ID]
@@ -0,0 +1,145 @@
+import gzip
+from types import SimpleNamespace
+
+import pytest
+from fastapi import FastAPI
+from fastapi.responses import PlainTextResponse, Response, StreamingResponse
+from fastapi.testclient import TestClient
+
+from app.core.compression import CompressionMiddleware, get_encoders, negotiate
+
+BODY = b'{"items": [' + b'{"username": "alice", "followers_count": 3},' * 100 + b"{}]}"
+
+SETTINGS = SimpleNamespace(
+    COMPRESSION_ENCODINGS=["zstd", "br", "gzip"],
+    COMPRESSION_GZIP_LEVEL=6,
+    COMPRESSION_BROTLI_QUALITY=4,
+    COMPRESSION_ZSTD_LEVEL=3,
+)
+
+
+# Encodings provided by the compression extra
+EXTRA_MODULES = {"br": "brotli", "zstd": "zstandard"}
+
+
+def decompress(encoding: str, data: bytes) -> bytes:
+    if encoding == "br":
+        import brotli
+
+        return brotli.decompress(data)
+    if encoding == "zstd":
+        import zstandard
+
+        return zstandard.ZstdDecompressor().decompressobj().decompress(data)
+    return gzip.decompress(data)
+
+
+def make_client(encodings: list[str]) -> TestClient:
+    app = FastAPI()
+    settings = SimpleNamespace(**{**vars(SETTINGS), "COMPRESSION_ENCODINGS": encodings})
+    app.add_middleware(
+        CompressionMiddleware, encoders=get_encoders(settings), minimum_size=500
+    )
+
+    @app.get("/large")
+    def large():
+        return Response(BODY, media_type="application/json")
+
+    @app.get("/small")
+    def small():
+        return Response(b'{"status": "ok"}', media_type="application/json")
+
+    @app.get("/stream")
+    def stream():
+        return StreamingResponse(iter([BODY[:700], BODY[700:]]), media_type="text/csv")
+
+    @app.get("/binary")
+    def binary():
+        return Response(BODY, media_type="image/png")
+
+    @app.get("/encoded")
+    def encoded():
+        return PlainTextResponse(BODY, headers={"Content-Encoding": "identity"})
+
+    return TestClient(app)
+
+
+def raw_get(client: TestClient, path: str, accept_encoding: str):
+    """GET without httpx decoding the body."""
+    with client.stream(
+        "GET", path, headers={"Accept-Encoding": accept_encoding}
+    ) as response:
+        return response, b"".join(response.iter_raw())
+
+
+# -----------------------------
+# Negotiation tests
+# -----------------------------
+
+
+@pytest.mark.parametrize(
+    "accept_encoding, expected",
+    [
+        ("gzip, deflate, br, zstd", "zstd"),
+        ("gzip;q=1.0, zstd;q=0.5", "gzip"),
+        ("br;q=0.8, gzip;q=0.8", "br"),
+        ("*", "zstd"),
+        ("*;q=0.5, zstd;q=0", "br"),
+        ("deflate", None),
+        ("gzip;q=0", None),
+        ("", None),
+    ],
+)
+def test_negotiate_prefers_client_weight_then_server_order(accept_encoding, expected):
+    assert negotiate(accept_encoding, ["zstd", "br", "gzip"]) == expected
+
+
+def test_get_encoders_rejects_unknown_names():
+    with pytest.raises(ValueError):
+        get_encoders(
+            SimpleNamespace(**{**vars(SETTINGS), "COMPRESSION_ENCODINGS": ["lz4"]})
+        )
+
+
+# -----------------------------
+# Middleware tests
+# -----------------------------
+
+
+@pytest.mark.parametrize("encoding", ["gzip", "br", "zstd"])
+def test_large_bodies_are_compressed_with_the_negotiated_encoding(encoding):
+    if encoding in EXTRA_MODULES:
+        pytest.importorskip(EXTRA_MODULES[encoding])
+    client = make_client([encoding])
+
+    response, body = raw_get(client, "/large", encoding)
+
+    assert response.headers["content-encoding"] == encoding
+    assert response.headers["vary"] == "Accept-Encoding"
+    assert int(response.headers["content-length"]) == len(body) < len(BODY)
+    assert decompress(encoding, body) == BODY
+
+
+def test_small_bodies_and_other_types_are_sent_as_is():
+    client = make_client(["gzip"])
+
+    for path in ("/small", "/binary", "/encoded"):
+        response, _ = raw_get(client, path, "gzip")
+        assert response.headers.get("content-encoding") in (None, "identity")
+        assert "vary" not in response.headers
+
+
+def test_uncompressed_large_bodies_still_vary_on_accept_encoding():
+    response, body = raw_get(make_client(["gzip"]), "/large", "identity")
+
+    assert "content-encoding" not in response.headers
+    assert response.headers["vary"] == "Accept-Encoding"
+    assert body == BODY
+
+
+def test_streamed_bodies_are_compressed_chunk_by_chunk():
+    response, body = raw_get(make_client(["gzip"]), "/stream", "gzip")
+
+    assert response.headers["content-encoding"] == "gzip"
+    assert "content-length" not in response.headers
+    assert gzip.decompress(body) == BODY
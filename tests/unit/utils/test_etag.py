@@ -0,0 +1,26 @@
+from app.utils.etag import etag_matches, make_etag
+
+# -----------------------------
+# ETag tests
+# -----------------------------
+
+
+def test_make_etag_is_weak_and_depends_on_every_part():
+    etag = make_etag("post", 1, 7, 3, 2)
+
+    assert etag.startswith('W/"') and etag.endswith('"')
+    assert etag == make_etag("post", 1, 7, 3, 2)
+    assert etag != make_etag("post", 2, 7, 3, 2)
+    assert etag != make_etag("post", 1, 7, 4, 2)
+
+
+def test_etag_matches_uses_weak_comparison_over_lists():
+    etag = make_etag("user", 1, "alice", 5)
+    opaque = etag.removeprefix("W/")
+
+    assert etag_matches(etag, etag)
+    assert etag_matches(opaque, etag)
+    assert etag_matches(f'"other", {etag}', etag)
+    assert etag_matches("*", etag)
+    assert not etag_matches('W/"other"', etag)
+    assert not etag_matches(None, etag)
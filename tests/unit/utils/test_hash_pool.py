@@ -0,0 +1,106 @@
+import asyncio
+import os
+import signal
+import threading
+import time
+
+import pytest
+from sqlalchemy.util.concurrency import greenlet_spawn
+
+from app.core.exceptions.auth import AuthPasswordHashingBusy
+from app.core.security.hash_pool import HashPool
+from app.core.security.password import _hash, _verify
+
+
+@pytest.fixture
+def process_pool():
+    pool = HashPool(workers=1, max_pending=1)
+    yield pool
+    pool.shutdown()
+
+
+# -----------------------------
+# Hash pool Tests
+# -----------------------------
+
+
+def test_inline_pool_runs_in_calling_thread():
+    pool = HashPool(workers=0, max_pending=4)
+
+    assert pool.run(threading.get_ident) == threading.get_ident()
+
+    status = pool.status()
+    assert status["completed"] == 1
+    assert status["pending"] == 0
+
+
+def test_process_pool_hashes_and_verifies(process_pool):
+    hashed = process_pool.run(_hash, "MyPass123!")
+
+    assert process_pool.run(_verify, "MyPass123!", hashed) is True
+    assert process_pool.run(_verify, "wrongpass", hashed) is False
+
+    status = process_pool.status()
+    assert status["completed"] == 3
+    assert status["hash_ms"]["max"] > 0
+
+
+def test_saturated_pool_fails_fast(process_pool):
+    process_pool.run(pow, 2, 2)  # start the worker
+    worker = threading.Thread(target=process_pool.run, args=(time.sleep, 0.5))
+    worker.start()
+    while process_pool.pending == 0:
+        time.sleep(0.01)
+
+    start = time.perf_counter()
+    with pytest.raises(AuthPasswordHashingBusy) as exc:
+        process_pool.run(pow, 2, 10)
+    rejected_after = time.perf_counter() - start
+    worker.join()
+
+    assert rejected_after < 0.5
+    assert exc.value.status_code == 503
+    assert process_pool.status()["rejected"] == 1
+    # The slot frees up once the slow hash finishes
+    assert process_pool.run(pow, 2, 10) == 1024
+
+
+def test_pool_releases_slot_when_hash_fails():
+    pool = HashPool(workers=0, max_pending=1)
+
+    with pytest.raises(ZeroDivisionError):
+        pool.run(divmod, 1, 0)
+
+    assert pool.pending == 0
+    assert pool.run(divmod, 7, 2) == (3, 1)
+
+
+def test_process_pool_awaits_on_async_greenlet(process_pool):
+    async def main():
+        ticks = 0
+
+        async def ticker():
+            nonlocal ticks
+            while True:
+                ticks += 1
+                await asyncio.sleep(0.01)
+
+        task = asyncio.create_task(ticker())
+        await greenlet_spawn(process_pool.run, time.sleep, 0.2)
+        task.cancel()
+        return ticks
+
+    # The event loop kept running while the worker slept
+    assert asyncio.run(main()) > 5
+
+
+def test_process_pool_recovers_after_worker_dies(process_pool):
+    process_pool.run(pow, 2, 2)  # start the worker
+    (pid,) = process_pool._executor._processes
+    os.kill(pid, signal.SIGKILL)
+
+    # The first call after the crash either finds the executor broken or has
+    # its task lost with the worker; both end on a fresh executor
+    assert process_pool.run(pow, 2, 3) == 8
+    assert process_pool.run(pow, 2, 4) == 16
+    assert process_pool.status()["completed"] == 3
@@ -0,0 +1,182 @@
+import base64
+import json
+import time
+
+import pytest
+from cryptography.hazmat.primitives import serialization
+from cryptography.hazmat.primitives.asymmetric import ec, ed25519
+
+from app.core.security.jwt_backends import (
+    JoseBackend,
+    NativeBackend,
+    TokenVerificationError,
+    load_keyring,
+)
+
+
+def private_pem(key) -> str:
+    return key.private_bytes(
+        serialization.Encoding.PEM,
+        serialization.PrivateFormat.PKCS8,
+        serialization.NoEncryption(),
+    ).decode()
+
+
+def public_pem(key) -> str:
+    return (
+        key.public_key()
+        .public_bytes(
+            serialization.Encoding.PEM,
+            serialization.PublicFormat.SubjectPublicKeyInfo,
+        )
+        .decode()
+    )
+
+
+ES256_KEY = ec.generate_private_key(ec.SECP256R1())
+EDDSA_KEY = ed25519.Ed25519PrivateKey.generate()
+
+KEYS = {
+    "hs": {"alg": "HS256", "secret": "rotated-secret"},
+    "es": {"alg": "ES256", "private_key": private_pem(ES256_KEY)},
+    "ed": {"alg": "EdDSA", "private_key": private_pem(EDDSA_KEY)},
+}
+
+BACKEND_ALGORITHMS = [
+    (backend, kid)
+    for backend in (JoseBackend(), NativeBackend())
+    for kid in ("hs", "es", "ed")
+    if KEYS[kid]["alg"] in backend.algorithms
+]
+
+
+def keyring(active_kid=""):
+    return load_keyring("legacy-secret", "HS256", KEYS, active_kid)
+
+
+def payload(**claims):
+    return {"user_id": 1, "exp": int(time.time()) + 60, **claims}
+
+
+# -----------------------------
+# Round trip Tests
+# -----------------------------
+
+
+@pytest.mark.parametrize("backend,kid", BACKEND_ALGORITHMS)
+def test_round_trip(backend, kid):
+    ring = keyring(kid)
+    token = backend.encode(payload(), ring.active)
+
+    assert backend.decode(token, ring)["user_id"] == 1
+
+
+@pytest.mark.parametrize("kid", ["hs", "es"])
+def test_backends_are_interchangeable(kid):
+    ring = keyring(kid)
+
+    jose_token = JoseBackend().encode(payload(), ring.active)
+    native_token = NativeBackend().encode(payload(), ring.active)
+
+    assert NativeBackend().decode(jose_token, ring)["user_id"] == 1
+    assert JoseBackend().decode(native_token, ring)["user_id"] == 1
+
+
+def test_jose_backend_rejects_eddsa():
+    with pytest.raises(ValueError):
+        JoseBackend().encode(payload(), keyring("ed").active)
+
+
+# -----------------------------
+# Rejection Tests
+# -----------------------------
+
+
+@pytest.mark.parametrize("backend,kid", BACKEND_ALGORITHMS)
+def test_expired_token_rejected(backend, kid):
+    ring = keyring(kid)
+    token = backend.encode(payload(exp=int(time.time()) - 1), ring.active)
+
+    with pytest.raises(TokenVerificationError):
+        backend.decode(token, ring)
+
+
+@pytest.mark.parametrize("backend,kid", BACKEND_ALGORITHMS)
+def test_tampered_payload_rejected(backend, kid):
+    ring = keyring(kid)
+    header, _, signature = backend.encode(payload(), ring.active).split(".")
+    forged_payload = NativeBackend().encode(payload(user_id=2), ring.active)
+    forged = ".".join([header, forged_payload.split(".")[1], signature])
+
+    with pytest.raises(TokenVerificationError):
+        backend.decode(forged, ring)
+
+
+@pytest.mark.parametrize("token", ["", "abc", "a.b.c", "this.is.invalid"])
+def test_native_rejects_malformed_tokens(token):
+    with pytest.raises(TokenVerificationError):
+        NativeBackend().decode(token, keyring())
+
+
+def test_native_rejects_algorithm_mismatch():
+    # An HS256 token signed with the ES256 public key, labelled with its kid
+    ring = keyring("es")
+    forged_key = load_keyring(ring.keys["es"].verifying_material, "HS256", {}, "")
+    token = NativeBackend().encode(payload(), forged_key.active)
+    header = json.dumps({"alg": "HS256", "kid": "es"}).encode()
+    signing_input = base64.urlsafe_b64encode(header).rstrip(b"=").decode()
+    forged = ".".join([signing_input, *token.split(".")[1:]])
+
+    with pytest.raises(TokenVerificationError):
+        NativeBackend().decode(forged, ring)
+
+
+# -----------------------------
+# Key rotation Tests
+# -----------------------------
+
+
+def test_rotation_keeps_old_kids_verifiable():
+    old = NativeBackend().encode(payload(), keyring("hs").active)
+    new = NativeBackend().encode(payload(), keyring("ed").active)
+    ring = keyring("ed")
+
+    assert NativeBackend().decode(old, ring)["user_id"] == 1
+    assert NativeBackend().decode(new, ring)["user_id"] == 1
+
+
+def test_legacy_tokens_without_kid_verify():
+    ring = keyring("ed")
+    token = NativeBackend().encode(payload(), ring.keys[None])
+
+    assert JoseBackend().decode(token, ring)["user_id"] == 1
+    assert NativeBackend().decode(token, ring)["user_id"] == 1
+
+
+def test_retired_kid_rejected():
+    token = NativeBackend().encode(payload(), keyring("hs").active)
+    ring = load_keyring("legacy-secret", "HS256", {"ed": KEYS["ed"]}, "ed")
+
+    with pytest.raises(TokenVerificationError):
+        NativeBackend().decode(token, ring)
+
+
+def test_public_only_key_verifies_but_cannot_sign():
+    token = NativeBackend().encode(payload(), keyring("es").active)
+    verify_only = {"es": {"alg": "ES256", "public_key": public_pem(ES256_KEY)}}
+
+    ring = load_keyring("legacy-secret", "HS256", verify_only, "")
+    assert NativeBackend().decode(token, ring)["user_id"] == 1
+
+    with pytest.raises(ValueError):
+        load_keyring("legacy-secret", "HS256", verify_only, "es")
+
+
+def test_key_must_match_algorithm():
+    with pytest.raises(ValueError):
+        load_keyring(
+            "legacy-secret",
+            "HS256",
+            {"es": {"alg": "ES256", "private_key": KEYS["ed"]["private_key"]}},
+            "",
+        )
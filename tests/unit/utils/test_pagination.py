@@ -0,0 +1,94 @@
+from datetime import datetime, timezone
+from decimal import Decimal
+
+import pytest
+
+from app.core.exceptions.pagination import PaginationInvalidCursor
+from app.db.models import Post
+from app.utils.pagination import (
+    Page,
+    decode_cursor,
+    encode_cursor,
+    keyset_filter,
+    paginate,
+)
+from app.utils.sql import escape_like
+
+# -----------------------------
+# Cursor encoding tests
+# -----------------------------
+
+
+def test_cursor_round_trip():
+    created_at = datetime(2026, 1, 2, 3, 4, 5, tzinfo=timezone.utc)
+    cursor = encode_cursor([created_at, 42, Decimal("0.4286"), "alice"])
+
+    values = decode_cursor(cursor, [datetime, int, Decimal, str])
+
+    assert values == [created_at, 42, Decimal("0.4286"), "alice"]
+
+
+@pytest.mark.parametrize("cursor", ["not-a-cursor", encode_cursor(["x"]), "e30"])
+def test_decode_cursor_invalid(cursor):
+    with pytest.raises(PaginationInvalidCursor):
+        decode_cursor(cursor, [int])
+
+
+def test_decode_cursor_wrong_length():
+    with pytest.raises(PaginationInvalidCursor):
+        decode_cursor(encode_cursor([1, 2]), [int])
+
+
+# -----------------------------
+# Page building tests
+# -----------------------------
+
+
+def test_paginate_with_more_rows():
+    page = paginate([1, 2, 3], limit=2, cursor_values=lambda row: [row])
+
+    assert page == [1, 2]
+    assert page.has_more is True
+    assert decode_cursor(page.next_cursor, [int]) == [2]
+
+
+def test_paginate_last_page():
+    page = paginate([1, 2], limit=2, cursor_values=lambda row: [row])
+
+    assert page == [1, 2]
+    assert page.has_more is False
+    assert page.next_cursor is None
+
+
+def test_empty_page_equals_empty_list():
+    assert Page() == []
+
+
+# -----------------------------
+# Keyset filter tests
+# -----------------------------
+
+
+def test_keyset_filter_uniform_direction_uses_row_comparison():
+    predicate = keyset_filter([(Post.created_at, True), (Post.id, True)], [1, 2])
+
+    sql = str(predicate.compile(compile_kwargs={"literal_binds": True}))
+
+    assert sql == "(posts.created_at, posts.id) < (1, 2)"
+
+
+def test_keyset_filter_mixed_direction_expands_to_or():
+    predicate = keyset_filter([(Post.title, False), (Post.id, True)], ["a", 2])
+
+    sql = str(predicate.compile(compile_kwargs={"literal_binds": True}))
+
+    assert sql == ("posts.title > 'a' OR posts.title = 'a' AND posts.id < 2")
+
+
+# -----------------------------
+# LIKE escaping tests
+# -----------------------------
+
+
+def test_escape_like():
+    assert escape_like("50%_off\\") == "50\\%\\_off\\\\"
@@ -0,0 +1,63 @@
+import json
+from datetime import datetime, timezone
+from types import SimpleNamespace
+
+import pytest
+from fastapi import Response
+from fastapi.encoders import jsonable_encoder
+from pydantic import ValidationError
+
+from app.api.v1.schemas.comment import CommentOut
+from app.api.v1.schemas.user import UserListItemOut
+from app.utils.pagination import HAS_MORE_HEADER, NEXT_CURSOR_HEADER, Page
+from app.utils.responses import list_response
+
+
+def make_comment(comment_id: int) -> CommentOut:
+    return CommentOut(
+        id=comment_id,
+        content="Nice post",
+        created_at=datetime(2026, 1, 2, 3, 4, 5, tzinfo=timezone.utc),
+        post_id=7,
+        owner=UserListItemOut(
+            id=1, username="alice", is_following=False, followers_count=3
+        ),
+    )
+
+
+# -----------------------------
+# List response tests
+# -----------------------------
+
+
+def test_list_response_matches_response_model_output():
+    comments = [make_comment(1), make_comment(2)]
+
+    response = list_response(CommentOut, comments)
+
+    assert json.loads(response.body) == jsonable_encoder(comments)
+    assert response.headers["content-type"] == "application/json"
+
+
+def test_list_response_validates_rows_from_attributes():
+    rows = [SimpleNamespace(id=1, username="bob", is_following=1, followers_count=0)]
+
+    response = list_response(UserListItemOut, rows)
+
+    assert json.loads(response.body)[0]["is_following"] is True
+    with pytest.raises(ValidationError):
+        list_response(UserListItemOut, [SimpleNamespace(id=1)])
+
+
+def test_list_response_sets_page_headers_and_keeps_route_headers():
+    route_response = Response()
+    route_response.headers["ETag"] = 'W/"abc"'
+
+    response = list_response(
+        CommentOut, Page([make_comment(1)], "cursor"), route_response
+    )
+
+    assert response.headers[HAS_MORE_HEADER] == "true"
+    assert response.headers[NEXT_CURSOR_HEADER] == "cursor"
+    assert response.headers["ETag"] == 'W/"abc"'
+    assert response.headers.getlist("content-length") == [str(len(response.body))]
@@ -0,0 +1,111 @@
+import asyncio
+from datetime import datetime, timedelta, timezone
+
+import pytest
+from sqlalchemy.exc import OperationalError
+
+from app.core.security import revocation
+from app.core.security.revocation import RevocationSet
+from app.db.models import RefreshToken
+
+JTI = "0123456789abcdef0123456789abcdef"
+OTHER_JTI = "fedcba9876543210fedcba9876543210"
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+
+def make_refresh_token(user, jti, created_at, revoked_at=None):
+    return RefreshToken(
+        user_id=user.id,
+        family_id="f" * 32,
+        jti=jti,
+        token_hash=jti * 2,
+        created_at=created_at,
+        expires_at=created_at + timedelta(days=1),
+        revoked_at=revoked_at,
+    )
+
+
+# -----------------------------
+# Revocation set Tests
+# -----------------------------
+
+
+def test_add_and_contains():
+    revoked = RevocationSet(clock=FakeClock())
+    revoked.add(JTI, expires_at=2000)
+
+    assert JTI in revoked
+    assert OTHER_JTI not in revoked
+    assert "not-hex" not in revoked
+    assert None not in revoked
+
+
+def test_already_expired_tokens_are_not_stored():
+    revoked = RevocationSet(clock=FakeClock())
+    revoked.add(JTI, expires_at=999)
+
+    assert JTI not in revoked
+    assert len(revoked) == 0
+
+
+def test_purge_drops_expired_entries():
+    clock = FakeClock()
+    revoked = RevocationSet(clock=clock)
+    revoked.add(JTI, expires_at=1500)
+    revoked.add(OTHER_JTI, expires_at=2500)
+
+    clock.now = 2000
+    assert revoked.purge() == 1
+    assert JTI not in revoked
+    assert OTHER_JTI in revoked
+
+
+def test_add_issued_uses_access_token_lifetime():
+    revoked = RevocationSet()
+    now = datetime.now(timezone.utc)
+
+    revoked.add_issued([(JTI, now), (OTHER_JTI, now - timedelta(days=1))])
+
+    assert JTI in revoked
+    # Its access token expired long ago
+    assert OTHER_JTI not in revoked
+
+
+def test_sync_loads_revocations_from_other_workers(session, test_users):
+    now = datetime.now(timezone.utc)
+    session.add_all(
+        [
+            make_refresh_token(test_users[0], JTI, now, revoked_at=now),
+            make_refresh_token(test_users[0], OTHER_JTI, now),
+        ]
+    )
+    session.flush()
+
+    revoked = RevocationSet()
+    assert revoked.sync(session) == 1
+
+    assert JTI in revoked
+    assert OTHER_JTI not in revoked
+    assert revoked.synced_until is not None
+
+
+def test_sync_loop_retries_database_errors_and_stops_on_bugs(monkeypatch):
+    errors = [OperationalError("SELECT", {}, Exception("down")), KeyError("bug")]
+    calls = []
+
+    def failing_sync():
+        calls.append(1)
+        raise errors[len(calls) - 1]
+
+    monkeypatch.setattr(revocation, "_sync_once", failing_sync)
+
+    with pytest.raises(KeyError):
+        asyncio.run(revocation.run_revocation_sync(0))
+    assert len(calls) == 2
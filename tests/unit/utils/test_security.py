@@ -1,3 +1,4 @@
+import time
 from types import SimpleNamespace
 from unittest.mock import Mock
 
@@ -9,6 +10,7 @@ from app.api.v1.schemas.auth import TokenData
 from app.core.exceptions.auth import AuthInvalidJWT, AuthUserCannotBeAuthenticated
 from app.core.exceptions.post import PostNotFound
 from app.core.exceptions.user import UserNotAllowedToViewResource, UserNotFound
+from app.core.security import jwt as jwt_module
 from app.core.security.access_controls import (
     can_view_post,
     can_view_target_user,
@@ -16,10 +18,14 @@ from app.core.security.access_controls import (
 )
 from app.core.security.jwt import (
     create_access_token,
+    verified_tokens,
     verify_access_token,
 )
 from app.core.security.password import hash_password, verify_password
+from app.core.security.principal import Principal, principal_cache
+from app.db.models.post import Post
 from app.db.models.user import User
+from app.services.helpers.subqueries.user_subqueries import UserSubqueries
 from tests.conftest import settings
 
 SECRET_KEY = settings.SECRET_KEY
@@ -27,10 +33,10 @@ ALGORITHM = settings.ALGORITHM
 ACCESS_TOKEN_EXPIRE_MINUTES = settings.ACCESS_TOKEN_EXPIRE_MINUTES
 
 
-def make_mock_db(user=None, follow_exists=None):
+def make_mock_db(row=None):
     db = Mock()
-    # Mock user query
-    db.query().filter().first.side_effect = [user, follow_exists]
+    # Mock the single lookup + visibility query
+    db.query().filter().first.return_value = row
     return db
 
 
@@ -70,6 +76,38 @@ def test_verify_access_token_missing_user_id():
     assert exc.value.error == "invalid_jwt"
 
 
+def test_verify_access_token_served_from_cache(mocker):  # noqa: F811
+    token = create_access_token({"user_id": 123})
+    decode = mocker.spy(jwt_module.backend, "decode")
+
+    assert verify_access_token(token).user_id == 123
+    assert verify_access_token(token).user_id == 123
+
+    decode.assert_called_once()
+    assert verified_tokens.stats()["hits"] == 1
+
+
+def test_verify_access_token_cache_honours_exp(mocker):  # noqa: F811
+    token = create_access_token({"user_id": 123})
+    set_entry = mocker.spy(verified_tokens, "set")
+
+    verify_access_token(token)
+
+    exp = jwt.get_unverified_claims(token)["exp"]
+    ttl = set_entry.call_args.kwargs["ttl"]
+    assert ttl <= exp - time.time() + 1
+
+
+def test_verify_access_token_does_not_cache_failures(mocker):  # noqa: F811
+    token = jwt.encode({"some": "data"}, SECRET_KEY, algorithm=ALGORITHM)
+
+    for _ in range(2):
+        with pytest.raises(AuthInvalidJWT):
+            verify_access_token(token)
+
+    assert verified_tokens.stats()["size"] == 0
+
+
 # -----------------------------
 # Password Tests
 # -----------------------------
@@ -95,13 +133,32 @@ def test_get_current_user_success(mocker):  # noqa: F811
         return_value=fake_token_data,
     )
 
-    fake_user = User(id=1, email="x@test.com", hashed_password="x")
+    fake_user = User(
+        id=1, email="x@test.com", username="x", hashed_password="x", is_private=False
+    )
     db = Mock()
     db.get.return_value = fake_user
 
     result = get_current_user(token="fake", db=db)
 
-    assert result == fake_user
+    assert result == Principal(id=1, username="x", is_private=False)
+
+
+def test_get_current_user_served_from_cache(mocker):  # noqa: F811
+    mocker.patch(
+        "app.core.security.access_controls.verify_access_token",
+        return_value=SimpleNamespace(user_id=1),
+    )
+    db = Mock()
+    db.get.return_value = User(id=1, username="x", is_private=True)
+
+    first = get_current_user(token="fake", db=db)
+    second = get_current_user(token="fake", db=db)
+
+    assert first == second
+    db.get.assert_called_once()
+    assert principal_cache.stats()["hits"] == 1
+    assert principal_cache.stats()["misses"] == 1
 
 
 def test_get_current_user_not_found(mocker):  # noqa: F811
@@ -125,47 +182,75 @@ def test_get_current_user_not_found(mocker):  # noqa: F811
 
 
 def test_target_user_not_found():
-    db = make_mock_db(user=None)
+    db = make_mock_db(row=None)
     current_user = SimpleNamespace(id=1)
     with pytest.raises(UserNotFound):
         can_view_target_user(username="unknown", db=db, current_user=current_user)
 
 
-def test_target_user_public():
-    public_user = SimpleNamespace(id=2, is_private=False)
-    db = make_mock_db(user=public_user)
+def test_target_user_visible():
+    target = SimpleNamespace(id=2, can_view=True)
+    db = make_mock_db(row=target)
     current_user = SimpleNamespace(id=1)
 
     result = can_view_target_user(username="public", db=db, current_user=current_user)
-    assert result == public_user.id
+    assert result == target.id
 
 
-def test_target_user_is_current_user():
-    private_user = SimpleNamespace(id=1, is_private=True)
-    db = make_mock_db(user=private_user)
+def test_target_user_not_visible():
+    target = SimpleNamespace(id=2, can_view=False)
+    db = make_mock_db(row=target)
     current_user = SimpleNamespace(id=1)
 
-    result = can_view_target_user(username="private", db=db, current_user=current_user)
-    assert result == private_user.id
+    with pytest.raises(UserNotAllowedToViewResource):
+        can_view_target_user(username="private", db=db, current_user=current_user)
 
 
-def test_target_user_private_followed():
-    private_user = SimpleNamespace(id=2, is_private=True)
-    follow = SimpleNamespace()
-    db = make_mock_db(user=private_user, follow_exists=follow)
-    current_user = SimpleNamespace(id=1)
+def test_target_user_private_followed(session, test_users_with_follow):
+    # user4 is private; make user3 private too and check its follower user2
+    target = test_users_with_follow["user3"]
+    target.is_private = True
+    session.flush()
 
-    result = can_view_target_user(username="private", db=db, current_user=current_user)
-    assert result == private_user.id
+    result = can_view_target_user(
+        username=target.username,
+        db=session,
+        current_user=test_users_with_follow["user2"],
+    )
+    assert result == target.id
 
 
-def test_target_user_private_not_followed():
-    private_user = SimpleNamespace(id=2, is_private=True)
-    db = make_mock_db(user=private_user, follow_exists=None)
-    current_user = SimpleNamespace(id=1)
+def test_target_user_private_not_followed(session, test_users_with_follow):
+    target = test_users_with_follow["user4"]
 
     with pytest.raises(UserNotAllowedToViewResource):
-        can_view_target_user(username="private", db=db, current_user=current_user)
+        can_view_target_user(
+            username=target.username,
+            db=session,
+            current_user=test_users_with_follow["user1"],
+        )
+
+
+def test_target_user_private_is_current_user(session, test_users_with_follow):
+    target = test_users_with_follow["user4"]
+
+    result = can_view_target_user(
+        username=target.username, db=session, current_user=target
+    )
+    assert result == target.id
+
+
+def test_target_user_runs_one_statement(
+    session, count_statements, test_users_with_follow
+):
+    username = test_users_with_follow["user4"].username
+    current_user = SimpleNamespace(id=test_users_with_follow["user1"].id)
+    session.commit()
+
+    with count_statements() as statements, pytest.raises(UserNotAllowedToViewResource):
+        can_view_target_user(username=username, db=session, current_user=current_user)
+
+    assert len(statements) == 1
 
 
 # -----------------------------
@@ -174,64 +259,54 @@ def test_target_user_private_not_followed():
 
 
 def test_post_not_found():
-    db = make_mock_db(user=None)
+    db = make_mock_db(row=None)
     current_user = SimpleNamespace(id=1)
     with pytest.raises(PostNotFound):
         can_view_post(post_id=1, db=db, current_user=current_user)
 
 
-def test_post_owner_not_found():
-    post = SimpleNamespace(id=1, owner_id=2)
-    db = make_mock_db(
-        user=post, follow_exists=None
-    )  # post returned first, then owner = None
-    current_user = SimpleNamespace(id=1)
-    with pytest.raises(UserNotFound):
-        can_view_post(post_id=1, db=db, current_user=current_user)
-
-
-def test_post_public_owner():
-    post = SimpleNamespace(id=1, owner_id=2)
-    owner = SimpleNamespace(id=2, is_private=False)
-    db = make_mock_db(user=post, follow_exists=owner)
-    current_user = SimpleNamespace(id=1)
-
-    result = can_view_post(post_id=1, db=db, current_user=current_user)
-    assert result == post.id
-
-
-def test_post_private_owner_self():
-    post = SimpleNamespace(id=1, owner_id=1)
-    owner = SimpleNamespace(id=1, is_private=True)
-    db = make_mock_db(user=post, follow_exists=owner)
+def test_post_visible():
+    db = make_mock_db(row=SimpleNamespace(id=1, can_view=True))
     current_user = SimpleNamespace(id=1)
 
     result = can_view_post(post_id=1, db=db, current_user=current_user)
-    assert result == post.id
-
+    assert result == 1
 
-def test_post_private_owner_followed():
-    post = SimpleNamespace(id=1, owner_id=2)
-    owner = SimpleNamespace(id=2, is_private=True)
-    follow = SimpleNamespace()
-    db = make_mock_db(user=None)
-
-    db.query().filter().first.side_effect = [post, owner, follow]
 
+def test_post_not_visible():
+    db = make_mock_db(row=SimpleNamespace(id=1, can_view=False))
     current_user = SimpleNamespace(id=1)
 
-    result = can_view_post(post_id=1, db=db, current_user=current_user)
-    assert result == post.id
-
+    with pytest.raises(UserNotAllowedToViewResource):
+        can_view_post(post_id=1, db=db, current_user=current_user)
 
-def test_post_private_owner_not_followed():
-    post = SimpleNamespace(id=1, owner_id=2)
-    owner = SimpleNamespace(id=2, is_private=True)
-    db = make_mock_db(user=None)
 
-    db.query().filter().first.side_effect = [post, owner, None]
+# -----------------------------
+# Can view content predicate Tests
+# -----------------------------
 
-    current_user = SimpleNamespace(id=1)
 
-    with pytest.raises(UserNotAllowedToViewResource):
-        can_view_post(post_id=1, db=db, current_user=current_user)
+def test_can_view_content_filters_posts(session, test_users_with_follow):
+    users = test_users_with_follow
+    users["user3"].is_private = True
+    posts = {
+        name: Post(title="Title", content="Content", owner_id=users[name].id)
+        for name in ("user2", "user3", "user4")
+    }
+    session.add_all(posts.values())
+    session.flush()
+
+    def visible_owners(viewer):
+        rows = (
+            session.query(Post.owner_id)
+            .filter(UserSubqueries.can_view_content(viewer.id, Post.owner_id))
+            .all()
+        )
+        return {row.owner_id for row in rows}
+
+    # user1 follows user3 (private); user4 is private and unfollowed
+    assert visible_owners(users["user1"]) == {users["user2"].id, users["user3"].id}
+    # user5 follows nobody: only the public user2
+    assert visible_owners(users["user5"]) == {users["user2"].id}
+    # Owners always see their own posts
+    assert users["user4"].id in visible_owners(users["user4"])
@@ -0,0 +1,201 @@
+import pytest
+
+from app.core.cache.backends import (
+    MISSING,
+    CacheBackendError,
+    MemoryBackend,
+    RedisBackend,
+)
+from app.core.cache.service_cache import ServiceCache
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+@pytest.fixture
+def redis_backend():
+    fakeredis = pytest.importorskip("fakeredis")
+    return RedisBackend(fakeredis.FakeRedis(), prefix="test:")
+
+
+@pytest.fixture(params=["memory", "redis"])
+def backend(request):
+    if request.param == "memory":
+        return MemoryBackend(maxsize=100)
+    return request.getfixturevalue("redis_backend")
+
+
+class FailingBackend(MemoryBackend):
+    name = "failing"
+
+    def get(self, key):
+        raise CacheBackendError("down")
+
+    def set(self, key, value, ttl, tags):
+        raise CacheBackendError("down")
+
+    def invalidate(self, tags):
+        raise CacheBackendError("down")
+
+
+# -----------------------------
+# Backend contract tests (memory and redis)
+# -----------------------------
+
+
+def test_backend_round_trips_values(backend):
+    assert backend.get("a") is MISSING
+
+    backend.set("a", {"id": 1, "tags": ["x"]}, ttl=60, tags=[])
+    backend.set("none", None, ttl=60, tags=[])
+
+    assert backend.get("a") == {"id": 1, "tags": ["x"]}
+    assert backend.get("none") is None
+
+
+def test_backend_invalidates_by_tag(backend):
+    backend.set("post:1", 1, ttl=60, tags=["post:1", "user:7"])
+    backend.set("post:2", 2, ttl=60, tags=["post:2", "user:7"])
+    backend.set("post:3", 3, ttl=60, tags=["post:3", "user:8"])
+
+    backend.invalidate(["user:7"])
+
+    assert backend.get("post:1") is MISSING
+    assert backend.get("post:2") is MISSING
+    assert backend.get("post:3") == 3
+
+
+def test_backend_clear_drops_everything(backend):
+    backend.set("a", 1, ttl=60, tags=["user:1"])
+
+    backend.clear()
+
+    assert backend.get("a") is MISSING
+
+
+# -----------------------------
+# Memory backend tests
+# -----------------------------
+
+
+def test_memory_backend_expires_entries_per_ttl():
+    clock = FakeClock()
+    backend = MemoryBackend(maxsize=10, clock=clock)
+    backend.set("short", 1, ttl=5, tags=[])
+    backend.set("long", 2, ttl=60, tags=[])
+
+    clock.now = 5
+    assert backend.get("short") is MISSING
+    assert backend.get("long") == 2
+
+
+def test_memory_backend_evicts_least_recently_used_and_its_tags():
+    backend = MemoryBackend(maxsize=2)
+    backend.set("a", 1, ttl=60, tags=["user:1"])
+    backend.set("b", 2, ttl=60, tags=[])
+    backend.get("a")
+
+    backend.set("c", 3, ttl=60, tags=[])
+
+    assert backend.get("b") is MISSING
+    assert backend.get("a") == 1
+    assert backend.evictions == 1
+
+    backend.invalidate(["user:1"])
+    assert backend._tags == {}
+
+
+# -----------------------------
+# Redis backend tests
+# -----------------------------
+
+
+def test_redis_backend_uses_millisecond_ttls_and_prefix(redis_backend):
+    redis_backend.set("a", 1, ttl=1.5, tags=["user:1"])
+
+    assert 0 < redis_backend.client.pttl("test:a") <= 1500
+    assert redis_backend.client.smembers("test:tag:user:1") == {b"a"}
+    # A tag lives as long as its longest-lived entry
+    redis_backend.set("b", 2, ttl=60, tags=["user:1"])
+    redis_backend.set("c", 3, ttl=5, tags=["user:1"])
+    assert redis_backend.client.pttl("test:tag:user:1") > 5000
+
+
+def test_redis_backend_wraps_client_errors():
+    redis = pytest.importorskip("redis")
+
+    class DownClient:
+        def get(self, key):
+            raise redis.ConnectionError("refused")
+
+    with pytest.raises(CacheBackendError):
+        RedisBackend(DownClient()).get("a")
+
+
+# -----------------------------
+# Service cache tests
+# -----------------------------
+
+
+def make_service(cache: ServiceCache):
+    class Service:
+        calls = 0
+
+        @cache.cached("double", tags=lambda result, n, scale: [f"n:{n}"])
+        def double(self, n: int, scale: int = 2) -> int:
+            self.calls += 1
+            return n * scale
+
+    return Service()
+
+
+def test_cached_method_calls_through_once_per_arguments():
+    cache = ServiceCache(MemoryBackend(maxsize=10), default_ttl=60)
+    service = make_service(cache)
+
+    assert service.double(3) == 6
+    assert service.double(n=3) == 6
+    assert service.double(3, scale=3) == 9
+
+    assert service.calls == 2
+    assert cache.stats()["namespaces"]["double"] == {"hits": 1, "misses": 2}
+
+
+def test_invalidate_drops_tagged_results():
+    cache = ServiceCache(MemoryBackend(maxsize=10), default_ttl=60)
+    service = make_service(cache)
+    service.double(3)
+
+    cache.invalidate("n:3")
+    service.double(3)
+
+    assert service.calls == 2
+
+
+def test_zero_ttl_disables_cache():
+    cache = ServiceCache(MemoryBackend(maxsize=10), default_ttl=0)
+    service = make_service(cache)
+
+    service.double(3)
+    service.double(3)
+
+    assert service.calls == 2
+    assert cache.stats()["hits"] == 0
+
+
+def test_backend_errors_degrade_to_misses():
+    cache = ServiceCache(FailingBackend(maxsize=10), default_ttl=60)
+    service = make_service(cache)
+
+    assert service.double(3) == 6
+    assert service.double(3) == 6
+    cache.invalidate("n:3")
+
+    stats = cache.stats()
+    assert stats["misses"] == 2
+    assert stats["errors"] == 5